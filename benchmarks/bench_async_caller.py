@@ -0,0 +1,132 @@
+"""
+Benchmark concurrent call placement against a local fake Twilio endpoint.
+
+Starts an aiohttp server that answers the Calls resource after a fixed
+latency, then places the same batch of calls with the synchronous Caller
+(one blocking create after another) and with AsyncCaller at several
+concurrency levels. Reports calls per second and checks every call got a call SID.
+
+Usage:
+    python benchmarks/bench_async_caller.py --calls 200 --latency-ms 150 --concurrency 1 10 50
+"""
+
+import argparse
+import asyncio
+import itertools
+import logging
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from aiohttp import web
+
+from async_caller import AsyncCaller
+from caller import Caller
+
+ACCOUNT_SID = 'AC' + '0' * 32
+FROM_NUMBER = '+15550000000'
+
+
+class FakeTwilio:
+    """Calls resource that answers after `latency` seconds, in a background thread."""
+
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.created = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._sids = itertools.count()
+        self._loop = asyncio.new_event_loop()
+        self.url = None
+
+    async def create(self, request: web.Request) -> web.Response:
+        form = await request.post()
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        await asyncio.sleep(self.latency)
+        self.in_flight -= 1
+        self.created += 1
+        return web.json_response(
+            {'sid': f"CA{next(self._sids):032d}", 'status': 'queued', 'to': form['To'], 'duration': None},
+            status=201
+        )
+
+    async def fetch(self, request: web.Request) -> web.Response:
+        await asyncio.sleep(self.latency)
+        return web.json_response({'sid': request.match_info['sid'], 'status': 'ringing', 'duration': None})
+
+    def routes(self, app: web.Application) -> None:
+        app.router.add_post('/2010-04-01/Accounts/{account}/Calls.json', self.create)
+        app.router.add_get('/2010-04-01/Accounts/{account}/Calls/{sid}.json', self.fetch)
+
+    async def _serve(self) -> None:
+        app = web.Application()
+        self.routes(app)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        site = web.TCPSite(runner, '127.0.0.1', 0, backlog=1024)
+        await site.start()
+        host, port = runner.addresses[0][:2]
+        self.url = f"http://{host}:{port}"
+
+    def start(self) -> str:
+        """Serve on a free local port and return the base URL."""
+        ready = threading.Event()
+
+        def run():
+            asyncio.set_event_loop(self._loop)
+            self._loop.run_until_complete(self._serve())
+            ready.set()
+            self._loop.run_forever()
+
+        threading.Thread(target=run, daemon=True).start()
+        ready.wait()
+        return self.url
+
+
+def batch(count: int) -> list:
+    """Distinct (to_number, message) pairs."""
+    return [(f"+1555{i:07d}", f"Reminder {i}") for i in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark concurrent call placement")
+    parser.add_argument('--calls', type=int, default=200, help='Calls per async run')
+    parser.add_argument('--sync-calls', type=int, default=20, help='Calls for the synchronous baseline')
+    parser.add_argument('--latency-ms', type=float, default=150.0, help='Fake API latency per request')
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 10, 50], help='Semaphore sizes')
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    server = FakeTwilio(args.latency_ms / 1000)
+    base_url = server.start()
+
+    print(f"\nCall placement benchmark: fake API latency {args.latency_ms:.0f} ms")
+    print(f"{'caller':<22}{'calls':>7}{'seconds':>10}{'calls/s':>10}{'peak in flight':>16}")
+
+    # Baseline: one blocking create at a time
+    caller = Caller(ACCOUNT_SID, 'token', FROM_NUMBER)
+    caller.client.api.base_url = base_url
+    began = time.perf_counter()
+    results = [caller.place_call(to_number, message) for to_number, message in batch(args.sync_calls)]
+    elapsed = time.perf_counter() - began
+    assert all(result.success for result in results), "synchronous calls failed"
+    print(f"{'Caller (sync)':<22}{args.sync_calls:>7}{elapsed:>10.2f}{args.sync_calls / elapsed:>10.1f}{1:>16}")
+
+    for concurrency in args.concurrency:
+        caller = AsyncCaller(ACCOUNT_SID, 'token', FROM_NUMBER, max_concurrency=concurrency, api_base=base_url)
+        server.peak_in_flight = 0
+        began = time.perf_counter()
+        results = caller.run_batch(batch(args.calls))
+        elapsed = time.perf_counter() - began
+        print(f"{f'AsyncCaller x{concurrency}':<22}{args.calls:>7}{elapsed:>10.2f}"
+              f"{args.calls / elapsed:>10.1f}{server.peak_in_flight:>16}")
+        assert all(result.success and result.call_id for result in results), "async calls failed"
+        assert server.peak_in_flight <= concurrency, "semaphore exceeded"
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+"""
+Benchmark the dialing thread pool against a provider rate limit.
+
+Queues a batch of due calls into a DialPool whose handler waits for a
+CallPacer slot and then blocks for a fixed time per call, standing in for
+a synchronous Twilio request. Reports throughput per worker count, which
+should grow with the workers until it reaches the pacing rate.
+
+Usage:
+    python benchmarks/bench_dial_pool.py --calls 200 --workers 1 2 4 8 16 --dial-ms 100 --rate 40
+"""
+
+import argparse
+import logging
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from dial_pool import DialPool
+from rate_limiter import CallPacer
+from scheduler import Scheduler
+
+FROM_NUMBER = '+15550000000'
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the dialing thread pool")
+    parser.add_argument('--calls', type=int, default=200, help='Due calls to dial')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8, 16], help='Worker counts')
+    parser.add_argument('--dial-ms', type=float, default=100.0, help='Simulated time per call')
+    parser.add_argument('--rate', type=float, default=40.0, help='Provider calls per second')
+    parser.add_argument('--queue', type=int, default=20, help='Backlog size')
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    scheduler = Scheduler(reminder_hours_before=0)
+    now = datetime.now()
+    calls = [
+        scheduler.make_call(f"apt_{i}", "+15551234567", f"Person {i}", "Reminder", now)
+        for i in range(args.calls)
+    ]
+
+    print(f"\nDial pool benchmark: {args.calls} calls, {args.dial_ms:.0f} ms per call, "
+          f"limit {args.rate:.0f} calls/s")
+    print(f"{'workers':>8}{'seconds':>10}{'calls/s':>10}{'peak pending':>14}")
+
+    for workers in args.workers:
+        pacer = CallPacer(args.rate, burst=1)
+        dialed = set()
+        lock = threading.Lock()
+
+        def dial(call):
+            pacer.acquire(FROM_NUMBER)
+            time.sleep(args.dial_ms / 1000)
+            with lock:
+                dialed.add(call.appointment_id)
+
+        pool = DialPool(dial, workers=workers, queue_size=args.queue)
+        began = time.perf_counter()
+        for call in calls:
+            pool.submit(call)
+        pool.shutdown()
+        elapsed = time.perf_counter() - began
+
+        print(f"{workers:>8}{elapsed:>10.2f}{args.calls / elapsed:>10.1f}{pool.stats['peak_pending']:>14}")
+        assert len(dialed) == args.calls, "calls were missed"
+        assert pool.stats['peak_pending'] <= workers + args.queue, "backlog exceeded its bound"
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,126 @@
+"""
+Benchmark the pooled keep-alive Twilio transport against a local fake Twilio endpoint.
+
+Places the same calls with the synchronous Caller from several threads,
+first with a new HTTP connection per request and then with one
+PooledHttpClient shared by all threads. Reports calls per second and the
+connections the fake server saw, which for the pool should stay at about
+one per thread however many calls are placed.
+
+It also sends requests straight through one shared transport from every
+thread and counts responses that came back for another thread's request:
+TwilioHttpClient keeps the last response on the instance, PooledHttpClient
+must never mix them up.
+
+Usage:
+    python benchmarks/bench_http_pool.py --calls 400 --threads 1 4 8 --latency-ms 5
+"""
+
+import argparse
+import json
+import logging
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from aiohttp import web
+from twilio.http.http_client import TwilioHttpClient
+
+from bench_async_caller import ACCOUNT_SID, FROM_NUMBER, FakeTwilio, batch
+from caller import Caller
+from http_pool import PooledHttpClient
+
+
+class CountingTwilio(FakeTwilio):
+    """Fake Calls resource that also counts the client connections it served."""
+
+    def __init__(self, latency: float):
+        super().__init__(latency)
+        self.peers = set()
+
+    async def create(self, request: web.Request) -> web.Response:
+        self.peers.add(request.transport.get_extra_info('peername'))
+        return await super().create(request)
+
+
+def run(caller: Caller, base_url: str, calls: list, threads: int) -> float:
+    """Place `calls` on `threads` threads and return the elapsed seconds."""
+    def place(call):
+        # Each thread has its own Twilio client; point it at the fake server
+        caller.client.api.base_url = base_url
+        return caller.place_call(*call)
+
+    began = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        results = list(executor.map(place, calls))
+    elapsed = time.perf_counter() - began
+    assert all(result.success and result.call_id for result in results), "calls failed"
+    assert len({result.call_id for result in results}) == len(results), "calls got another call's response"
+    return elapsed
+
+
+def mixed_responses(http_client, base_url: str, count: int, threads: int) -> int:
+    """Send `count` creates through one transport on `threads` threads; count wrong answers."""
+    url = f"{base_url}/2010-04-01/Accounts/{ACCOUNT_SID}/Calls.json"
+
+    def send(to_number):
+        response = http_client.request('POST', url, data={'To': to_number, 'From': FROM_NUMBER})
+        return json.loads(response.text)['to'] != to_number
+
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        return sum(executor.map(send, [to for to, _ in batch(count)]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the pooled HTTP transport")
+    parser.add_argument('--calls', type=int, default=400, help='Calls per run')
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 4, 8], help='Dialing thread counts')
+    parser.add_argument('--latency-ms', type=float, default=5.0, help='Fake API latency per request')
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    server = CountingTwilio(args.latency_ms / 1000)
+    base_url = server.start()
+    calls = batch(args.calls)
+
+    print(f"\nHTTP transport benchmark: {args.calls} calls, fake API latency {args.latency_ms:.0f} ms")
+    print(f"{'transport':<26}{'seconds':>10}{'calls/s':>10}{'connections':>13}{'reused':>9}")
+
+    for threads in args.threads:
+        transports = [
+            (f"new connection x{threads}", TwilioHttpClient(pool_connections=False)),
+            (f"PooledHttpClient x{threads}", PooledHttpClient(pool_size=threads)),
+        ]
+        for label, http_client in transports:
+            caller = Caller(ACCOUNT_SID, 'token', FROM_NUMBER, http_client=http_client)
+            server.peers.clear()
+            elapsed = run(caller, base_url, calls, threads)
+            connections = len(server.peers)
+            print(f"{label:<26}{elapsed:>10.2f}{args.calls / elapsed:>10.1f}{connections:>13}"
+                  f"{1 - connections / args.calls:>9.0%}")
+            if isinstance(http_client, PooledHttpClient):
+                stats = http_client.connection_stats()
+                assert stats['requests'] == args.calls, "pool missed requests"
+                assert stats['new_connections'] <= threads, "pool opened extra connections"
+                http_client.close()
+
+    threads = max(args.threads)
+    print(f"\nShared transport, {args.calls} requests on {threads} threads")
+    print(f"{'transport':<26}{'mixed-up responses':>20}")
+    for label, http_client in [
+        ("TwilioHttpClient", TwilioHttpClient(pool_connections=True)),
+        ("PooledHttpClient", PooledHttpClient(pool_size=threads)),
+    ]:
+        mixed = mixed_responses(http_client, base_url, args.calls, threads)
+        print(f"{label:<26}{mixed:>20}")
+        if isinstance(http_client, PooledHttpClient):
+            assert mixed == 0, "pooled transport returned another request's response"
+            http_client.close()
+
+
+if __name__ == '__main__':
+    main()
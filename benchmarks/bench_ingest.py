@@ -0,0 +1,99 @@
+"""
+Benchmark appointment ingest time per input format.
+
+Writes the same synthetic appointments as .xlsx, .csv, .npz and (when
+pyarrow is installed) .parquet/.feather, then times DataProcessor reading
+each one back.
+
+Usage:
+    python benchmarks/bench_ingest.py --rows 100000
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from data_processor import DataProcessor, Appointment
+
+
+def make_appointments(rows: int) -> list:
+    """Build synthetic appointments spread over the next 30 days."""
+    start = datetime.now().replace(second=0, microsecond=0) + timedelta(days=1)
+    return [
+        Appointment(
+            name=f"Person {i}",
+            phone_number=f"555-{i % 1000:03d}-{i % 10000:04d}",
+            email=f"person{i}@example.com",
+            appointment_datetime=start + timedelta(minutes=15 * (i % 2880)),
+            row_index=i + 2
+        )
+        for i in range(rows)
+    ]
+
+
+def write_xlsx(appointments: list, path: Path, date_format: str) -> None:
+    """Write appointments as a workbook with string dates."""
+    import pandas as pd
+    
+    pd.DataFrame({
+        'name': [apt.name for apt in appointments],
+        'phone_number': [apt.phone_number for apt in appointments],
+        'email': [apt.email for apt in appointments],
+        'appointment_date': [apt.appointment_datetime.strftime(date_format) for apt in appointments],
+    }).to_excel(path, index=False)
+
+
+def time_it(func) -> tuple:
+    """Return (seconds, result) for a single call."""
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare ingest time per file format")
+    parser.add_argument('--rows', type=int, default=50000, help='Number of appointments')
+    args = parser.parse_args()
+    
+    processor = DataProcessor()
+    appointments = make_appointments(args.rows)
+    
+    formats = ['.xlsx', '.csv', '.npz']
+    try:
+        import pyarrow  # noqa: F401
+        formats += ['.parquet', '.feather']
+    except ImportError:
+        print("pyarrow not installed - skipping .parquet/.feather")
+    
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for suffix in formats:
+            path = Path(tmp) / f"appointments{suffix}"
+            if suffix == '.xlsx':
+                write_xlsx(appointments, path, processor.date_format)
+            else:
+                processor.write_appointments(appointments, path)
+            
+            size_mb = path.stat().st_size / 1e6
+            elapsed, count = time_it(
+                lambda: sum(len(chunk) for chunk in processor.iter_appointments(path))
+            )
+            results.append((f"stream {suffix}", size_mb, elapsed, count))
+            
+            if suffix == '.xlsx':
+                elapsed, (parsed, _) = time_it(lambda: processor.read_excel_columnar(path))
+                results.append(("columnar .xlsx", size_mb, elapsed, len(parsed)))
+    
+    print(f"\nIngest benchmark ({args.rows} rows)")
+    print(f"{'reader':<18}{'size MB':>10}{'seconds':>10}{'rows/s':>12}{'rows':>10}")
+    for label, size_mb, elapsed, count in results:
+        print(f"{label:<18}{size_mb:>10.2f}{elapsed:>10.3f}{count / elapsed:>12.0f}{count:>10}")
+
+
+if __name__ == '__main__':
+    main()
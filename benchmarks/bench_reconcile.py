@@ -0,0 +1,130 @@
+"""
+Benchmark call-outcome reconciliation against a local fake Twilio endpoint.
+
+Tracks a day's worth of placed calls as still 'queued', then catches up
+their outcomes two ways: one fetch per call (timed on a sample and
+extrapolated) and CallReconciler paging through the call list. The
+reconcile run is interrupted after a few pages and resumed from its
+checkpoint, and every tracked call must end up with its final status.
+
+Usage:
+    python benchmarks/bench_reconcile.py --calls 50000 --latency-ms 50 --page-size 1000
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from aiohttp import web
+
+from bench_async_caller import ACCOUNT_SID, FROM_NUMBER, FakeTwilio
+from call_results import CallResultStore
+from caller import Caller, CallResult
+from reconcile import CallReconciler
+
+
+def sid(index: int) -> str:
+    return f"CA{index:032d}"
+
+
+class ListingTwilio(FakeTwilio):
+    """Fake Calls resource that also lists `count` completed calls in pages."""
+
+    def __init__(self, latency: float, count: int):
+        super().__init__(latency)
+        self.count = count
+        self.requests = 0
+
+    def record(self, index: int) -> dict:
+        return {
+            'sid': sid(index), 'status': 'completed', 'duration': str(20 + index % 40),
+            'from': FROM_NUMBER, 'to': f"+1555{index:07d}"
+        }
+
+    async def fetch(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        await asyncio.sleep(self.latency)
+        return web.json_response(self.record(int(request.match_info['sid'][2:])))
+
+    async def list(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        await asyncio.sleep(self.latency)
+        page_size = int(request.query.get('PageSize', 50))
+        offset = int(request.query.get('PageToken', 0))
+        end = min(offset + page_size, self.count)
+        next_page_uri = None
+        if end < self.count:
+            next_page_uri = f"{request.path}?PageSize={page_size}&PageToken={end}"
+        return web.json_response({
+            'calls': [self.record(index) for index in range(offset, end)],
+            'next_page_uri': next_page_uri,
+            'page_size': page_size,
+            'uri': request.path_qs
+        })
+
+    def routes(self, app: web.Application) -> None:
+        super().routes(app)
+        app.router.add_get('/2010-04-01/Accounts/{account}/Calls.json', self.list)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark call-outcome reconciliation")
+    parser.add_argument('--calls', type=int, default=50000, help='Calls to reconcile')
+    parser.add_argument('--latency-ms', type=float, default=50.0, help='Fake API latency per request')
+    parser.add_argument('--page-size', type=int, default=1000, help='Calls per listed page')
+    parser.add_argument('--fetch-sample', type=int, default=100, help='Calls fetched one by one for the baseline')
+    parser.add_argument('--interrupt-after', type=int, default=3, help='Pages before the simulated interruption')
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    server = ListingTwilio(args.latency_ms / 1000, args.calls)
+    base_url = server.start()
+    caller = Caller(ACCOUNT_SID, 'token', FROM_NUMBER)
+    caller.client.api.base_url = base_url
+
+    results = CallResultStore(max_entries=args.calls)
+    for index in range(args.calls):
+        results.register(CallResult(success=True, call_id=sid(index), status='queued'))
+
+    print(f"\nReconcile benchmark: {args.calls} tracked calls, fake API latency {args.latency_ms:.0f} ms")
+    print(f"{'method':<28}{'requests':>10}{'seconds':>10}")
+
+    # Baseline: one fetch per call, timed on a sample
+    began = time.perf_counter()
+    for index in range(args.fetch_sample):
+        caller.get_call_status(sid(index))
+    per_call = (time.perf_counter() - began) / args.fetch_sample
+    print(f"{'fetch per call (estimated)':<28}{args.calls:>10}{per_call * args.calls:>10.1f}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        checkpoint = Path(tmp) / 'reconcile.json'
+        reconciler = CallReconciler(caller, results, checkpoint_path=str(checkpoint), page_size=args.page_size)
+        since = datetime.now() - timedelta(days=1)
+        server.requests = 0
+        began = time.perf_counter()
+        first = reconciler.run(since, max_pages=args.interrupt_after)
+        assert not first.complete and checkpoint.exists(), "run was not interrupted"
+        # Resume as a restarted process would: a new reconciler, the join side from the checkpoint
+        reconciler = CallReconciler(caller, results, checkpoint_path=str(checkpoint), page_size=args.page_size)
+        report = reconciler.run(since)
+        elapsed = time.perf_counter() - began
+        assert report.resumed and report.complete and not checkpoint.exists(), "run did not resume"
+
+    print(f"{'paged reconcile':<28}{server.requests:>10}{elapsed:>10.1f}")
+    print(f"\n{report.pages} pages ({first.pages} before the interruption), {report.updated} outcomes updated")
+    counts = results.status_counts()
+    assert counts == {'completed': args.calls}, f"calls left unreconciled: {counts}"
+    assert report.pages == -(-args.calls // args.page_size), "pages were listed twice"
+    assert report.matched == args.calls and report.unresolved == 0, "resumed run lost tracked calls"
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""
+Benchmark the SQLite schedule store: bulk scheduling and restart time.
+
+Bulk-inserts n pending reminders, closes the store, then times reopening
+it and answering the queries the app needs right after a restart (pending
+count, next call time, next five calls, claiming the first due batch).
+
+Usage:
+    python benchmarks/bench_schedule_store.py --calls 1000000
+"""
+
+import argparse
+import logging
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from sqlite_scheduler import SQLiteScheduler
+
+
+def make_calls(scheduler: SQLiteScheduler, count: int, start: datetime) -> list:
+    """Build synthetic reminder calls over the next 90 days."""
+    return [
+        scheduler.make_call(
+            appointment_id=f"apt_{i}",
+            phone_number=f"+1555{i % 10000000:07d}",
+            name=f"Person {i}",
+            message="Hello, this is an automated reminder about your appointment.",
+            appointment_datetime=start + timedelta(minutes=random.randrange(90 * 24 * 60))
+        )
+        for i in range(count)
+    ]
+
+
+def timed(label: str, func, results: list):
+    """Run func, record its duration under label, and return its result."""
+    began = time.perf_counter()
+    value = func()
+    results.append((label, time.perf_counter() - began))
+    return value
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the SQLite schedule store")
+    parser.add_argument('--calls', type=int, default=1000000, help='Pending reminders to store')
+    parser.add_argument('--batch', type=int, default=50000, help='Calls per bulk insert')
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    random.seed(0)
+    results = []
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / 'schedule.db'
+        start = datetime.now() + timedelta(days=2)
+
+        store = SQLiteScheduler(str(db_path))
+        calls = make_calls(store, args.calls, start)
+
+        def bulk_insert():
+            for offset in range(0, len(calls), args.batch):
+                store.insert_calls(calls[offset:offset + args.batch])
+
+        timed(f"bulk insert {args.calls}", bulk_insert, results)
+        store.close()
+
+        # Restart: everything below is what resuming costs
+        store = timed("reopen", lambda: SQLiteScheduler(str(db_path)), results)
+        pending = timed("count pending", store.count, results)
+        next_time = timed("next call time", store.next_call_time, results)
+        timed("next 5 calls", lambda: store.get_upcoming_calls(limit=5), results)
+        claimed = timed(
+            "claim first 100 due",
+            lambda: store.pop_due_calls(next_time + timedelta(days=1), limit=100),
+            results
+        )
+        restart = sum(seconds for label, seconds in results[1:])
+        store.close()
+        size_mb = db_path.stat().st_size / 1e6
+
+    print(f"\nSchedule store benchmark ({pending} pending calls, {size_mb:.0f} MB, {len(claimed)} claimed)")
+    for label, seconds in results:
+        print(f"{label:<28}{seconds * 1000:>12.1f} ms")
+    print(f"{'total restart':<28}{restart * 1000:>12.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
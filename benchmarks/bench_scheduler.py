@@ -0,0 +1,205 @@
+"""
+Benchmark Scheduler operations as the number of scheduled calls grows.
+
+Times scheduling n calls, looking up and removing a sample of them, listing
+upcoming calls and collecting due calls, for the heap/dict Scheduler and
+for a list-backed baseline with the previous linear-scan behaviour. Also
+compares scheduling one call at a time with Scheduler.schedule_many, and
+the memory used by a three-touch reminder plan with one call per touch.
+
+Usage:
+    python benchmarks/bench_scheduler.py --sizes 1000 10000 100000
+"""
+
+import argparse
+import logging
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from scheduler import Scheduler, ScheduledCall
+
+
+class ListScheduler:
+    """Baseline: calls kept in a plain list, every operation a linear scan."""
+    
+    def __init__(self, reminder_hours_before: int = 24):
+        self.reminder_hours_before = reminder_hours_before
+        self.scheduled_calls = []
+    
+    def schedule_appointment(self, appointment_id, phone_number, name, message, appointment_datetime):
+        if self.get_scheduled_call(appointment_id):
+            return None
+        call = ScheduledCall(
+            appointment_id=appointment_id,
+            phone_number=phone_number,
+            name=name,
+            message=message,
+            call_time=appointment_datetime - timedelta(hours=self.reminder_hours_before),
+            appointment_datetime=appointment_datetime
+        )
+        self.scheduled_calls.append(call)
+        return call
+    
+    def get_scheduled_call(self, appointment_id):
+        for call in self.scheduled_calls:
+            if call.appointment_id == appointment_id:
+                return call
+        return None
+    
+    def get_due_calls(self, current_time):
+        return [call for call in self.scheduled_calls if call.call_time <= current_time]
+    
+    def remove_call(self, appointment_id):
+        self.scheduled_calls = [
+            call for call in self.scheduled_calls if call.appointment_id != appointment_id
+        ]
+    
+    def get_upcoming_calls(self, limit=10):
+        now = datetime.now()
+        return sorted(
+            [call for call in self.scheduled_calls if call.call_time > now],
+            key=lambda x: x.call_time
+        )[:limit]
+
+
+def run(scheduler_class, size: int, samples: int) -> dict:
+    """Time each operation on a scheduler holding `size` calls."""
+    random.seed(size)
+    start = datetime.now() + timedelta(days=2)
+    appointment_times = [start + timedelta(minutes=random.randrange(60 * 24 * 90)) for _ in range(size)]
+    scheduler = scheduler_class(reminder_hours_before=24)
+    timings = {}
+    
+    began = time.perf_counter()
+    for i, when in enumerate(appointment_times):
+        scheduler.schedule_appointment(f"apt_{i}", "+15550000000", f"Person {i}", "Reminder", when)
+    timings['schedule all'] = time.perf_counter() - began
+    
+    sample_ids = [f"apt_{random.randrange(size)}" for _ in range(samples)]
+    
+    began = time.perf_counter()
+    for appointment_id in sample_ids:
+        scheduler.get_scheduled_call(appointment_id)
+    timings['lookup (each)'] = (time.perf_counter() - began) / samples
+    
+    began = time.perf_counter()
+    for _ in range(samples):
+        scheduler.get_upcoming_calls(limit=5)
+    timings['upcoming 5 (each)'] = (time.perf_counter() - began) / samples
+    
+    # About 1% of calls are due
+    cutoff = sorted(appointment_times)[size // 100] - timedelta(hours=24)
+    began = time.perf_counter()
+    scheduler.get_due_calls(cutoff)
+    timings['due 1%'] = time.perf_counter() - began
+    
+    began = time.perf_counter()
+    for appointment_id in sample_ids:
+        scheduler.remove_call(appointment_id)
+    timings['remove (each)'] = (time.perf_counter() - began) / samples
+    
+    return timings
+
+
+def run_bulk(size: int) -> dict:
+    """Time scheduling `size` calls one at a time versus with schedule_many."""
+    random.seed(size)
+    start = datetime.now() + timedelta(days=2)
+    records = [
+        (f"apt_{i}", "+15550000000", f"Person {i}", "Reminder",
+         start + timedelta(minutes=random.randrange(60 * 24 * 90)))
+        for i in range(size)
+    ]
+    timings = {}
+    
+    scheduler = Scheduler(reminder_hours_before=24)
+    began = time.perf_counter()
+    for record in records:
+        scheduler.schedule_appointment(*record)
+    timings['one at a time'] = time.perf_counter() - began
+    
+    scheduler = Scheduler(reminder_hours_before=24)
+    began = time.perf_counter()
+    summary = scheduler.schedule_many(records)
+    timings['schedule_many'] = time.perf_counter() - began
+    assert summary['scheduled'] == size
+    
+    return timings
+
+
+def run_memory(size: int, offsets=(72, 24, 2)) -> dict:
+    """Measure bytes per appointment for a multi-touch plan versus one call per touch."""
+    random.seed(size)
+    start = datetime.now() + timedelta(days=4)
+    records = [
+        (f"apt_{i}", "+15550000000", f"Person {i}", f"Reminder for Person {i}",
+         start + timedelta(minutes=random.randrange(60 * 24 * 90)))
+        for i in range(size)
+    ]
+    memory = {}
+    
+    tracemalloc.start()
+    scheduler = Scheduler(reminder_offsets=list(offsets))
+    scheduler.schedule_many(records)
+    memory['plan'] = tracemalloc.get_traced_memory()[0] / size
+    del scheduler
+    tracemalloc.stop()
+    
+    tracemalloc.start()
+    scheduler = Scheduler(reminder_hours_before=0)
+    scheduler.schedule_many(
+        (f"{appointment_id}_{hours}h", phone, name, message, when - timedelta(hours=hours))
+        for appointment_id, phone, name, message, when in records
+        for hours in offsets
+    )
+    memory['call per touch'] = tracemalloc.get_traced_memory()[0] / size
+    tracemalloc.stop()
+    
+    return memory
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Scheduler scaling")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000],
+                        help='Numbers of scheduled calls')
+    parser.add_argument('--samples', type=int, default=200, help='Lookups/removals per size')
+    parser.add_argument('--baseline-max', type=int, default=20000,
+                        help='Largest size to run the list baseline at (it is quadratic)')
+    args = parser.parse_args()
+    
+    logging.disable(logging.INFO)
+    
+    print("\nScheduler benchmark (times in ms)")
+    print(f"{'implementation':<16}{'calls':>9}{'schedule all':>14}{'lookup':>10}"
+          f"{'upcoming':>10}{'due 1%':>10}{'remove':>10}")
+    for size in args.sizes:
+        for label, scheduler_class in (('list baseline', ListScheduler), ('heap + dict', Scheduler)):
+            if scheduler_class is ListScheduler and size > args.baseline_max:
+                continue
+            timings = run(scheduler_class, size, min(args.samples, size))
+            print(f"{label:<16}{size:>9}" + "".join(
+                f"{seconds * 1000:>{width}.3f}"
+                for seconds, width in zip(timings.values(), (14, 10, 10, 10, 10))
+            ))
+
+    print("\nBulk scheduling (times in s)")
+    print(f"{'calls':>9}{'one at a time':>15}{'schedule_many':>15}")
+    for size in args.sizes:
+        timings = run_bulk(size)
+        print(f"{size:>9}{timings['one at a time']:>15.2f}{timings['schedule_many']:>15.2f}")
+
+    print("\nMemory for 72h/24h/2h reminders (bytes per appointment)")
+    print(f"{'calls':>9}{'plan':>10}{'call per touch':>16}")
+    for size in args.sizes:
+        memory = run_memory(size)
+        print(f"{size:>9}{memory['plan']:>10.0f}{memory['call per touch']:>16.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""
+Benchmark application start-up cost.
+
+Times, in fresh interpreters, importing each heavy dependency, importing the
+app module, building AppointmentReminderApp, and running the lightweight
+CLI subcommands end to end.
+
+Usage:
+    python benchmarks/bench_startup.py --repeat 5
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+SRC = ROOT / 'src'
+
+# label -> Python snippet run in a fresh interpreter
+SNIPPETS = {
+    'import pandas': "import pandas",
+    'import twilio.rest': "import twilio.rest",
+    'import apscheduler': "import apscheduler.schedulers.background",
+    'import phonenumbers': "import phonenumbers",
+    'import app': "import app",
+    'AppointmentReminderApp()': "import app; app.AppointmentReminderApp()",
+    'AppointmentReminderApp().caller': "import app; app.AppointmentReminderApp().caller",
+}
+
+# label -> arguments to src/app.py
+COMMANDS = {
+    'app.py --help': ['--help'],
+    'app.py status': ['status', '--config', '{config}'],
+}
+
+# Placeholder credentials so the caller can be built without a .env file
+FAKE_ENV = {
+    'TWILIO_ACCOUNT_SID': 'AC' + '0' * 32,
+    'TWILIO_AUTH_TOKEN': 'benchmark',
+    'TWILIO_PHONE_NUMBER': '+15550000000',
+}
+
+
+def time_process(args: list, repeat: int, env: dict) -> list:
+    """Run a command repeat times and return wall-clock seconds per run."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(args, cwd=ROOT, env=env, stdout=subprocess.DEVNULL,
+                       stderr=subprocess.DEVNULL, check=False)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure import and start-up time")
+    parser.add_argument('--repeat', type=int, default=5, help='Runs per measurement')
+    parser.add_argument('--config', default='config/settings.yaml', help='Configuration file')
+    args = parser.parse_args()
+    
+    env = dict(os.environ, **FAKE_ENV)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [str(SRC), env.get('PYTHONPATH')]))
+    
+    results = [('python -c pass', time_process([sys.executable, '-c', 'pass'], args.repeat, env))]
+    for label, snippet in SNIPPETS.items():
+        snippet = snippet.replace('AppointmentReminderApp()', f"AppointmentReminderApp({args.config!r})")
+        results.append((label, time_process([sys.executable, '-c', snippet], args.repeat, env)))
+    for label, command in COMMANDS.items():
+        command = [sys.executable, str(SRC / 'app.py')] + [arg.format(config=args.config) for arg in command]
+        results.append((label, time_process(command, args.repeat, env)))
+    
+    print(f"\nStart-up benchmark (median of {args.repeat} runs)")
+    print(f"{'measurement':<36}{'median ms':>12}{'min ms':>10}")
+    for label, timings in results:
+        print(f"{label:<36}{statistics.median(timings) * 1000:>12.0f}{min(timings) * 1000:>10.0f}")
+
+
+if __name__ == '__main__':
+    main()
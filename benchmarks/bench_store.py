@@ -0,0 +1,94 @@
+"""
+Benchmark AppointmentStore against a plain list of Appointment objects.
+
+Compares memory per appointment and the latency of time-window queries
+(linear scan vs. searchsorted on the store's time index).
+
+Usage:
+    python benchmarks/bench_store.py --rows 1000000
+"""
+
+import argparse
+import gc
+import logging
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from data_processor import Appointment
+from appointment_store import AppointmentStore
+
+
+def make_appointments(rows: int, start: datetime) -> list:
+    """Build synthetic appointments over the next 90 days with repeating values."""
+    return [
+        Appointment(
+            name=f"Person {i % 50000}",
+            phone_number=f"555-{i % 1000:03d}-{i % 10000:04d}",
+            email=f"person{i % 50000}@example.com",
+            appointment_datetime=start + timedelta(minutes=random.randrange(90 * 24 * 60)),
+            row_index=i + 2
+        )
+        for i in range(rows)
+    ]
+
+
+def measure(build) -> tuple:
+    """Return (object, bytes allocated while building it)."""
+    gc.collect()
+    tracemalloc.start()
+    obj = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return obj, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark AppointmentStore")
+    parser.add_argument('--rows', type=int, default=1000000, help='Number of appointments')
+    parser.add_argument('--queries', type=int, default=50, help='Window queries per method')
+    args = parser.parse_args()
+    
+    logging.disable(logging.INFO)
+    random.seed(0)
+    now = datetime.now().replace(microsecond=0)
+    
+    appointments, list_bytes = measure(lambda: make_appointments(args.rows, now))
+    store, store_bytes = measure(lambda: AppointmentStore(appointments))
+    
+    windows = []
+    for _ in range(args.queries):
+        t1 = now + timedelta(hours=random.randrange(24 * 89))
+        windows.append((t1, t1 + timedelta(hours=24)))
+    
+    start = time.perf_counter()
+    for t1, t2 in windows:
+        scan = [apt for apt in appointments if t1 <= apt.appointment_datetime < t2]
+    scan_seconds = (time.perf_counter() - start) / len(windows)
+    
+    start = time.perf_counter()
+    for t1, t2 in windows:
+        indexed = store.indices_between(t1, t2)
+    index_seconds = (time.perf_counter() - start) / len(windows)
+    
+    start = time.perf_counter()
+    for t1, t2 in windows:
+        views = store.between(t1, t2)
+    view_seconds = (time.perf_counter() - start) / len(windows)
+    
+    assert len(scan) == len(indexed) == len(views)
+    
+    print(f"\nAppointmentStore benchmark ({args.rows} rows, 24h windows of ~{len(scan)} rows)")
+    print(f"{'':<28}{'bytes/appt':>12}{'ms/query':>12}")
+    print(f"{'list[Appointment] scan':<28}{list_bytes / args.rows:>12.0f}{scan_seconds * 1000:>12.2f}")
+    print(f"{'store searchsorted (idx)':<28}{store_bytes / args.rows:>12.0f}{index_seconds * 1000:>12.3f}")
+    print(f"{'store searchsorted (views)':<28}{'':>12}{view_seconds * 1000:>12.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+"""
+Benchmark lease-based dispatch with several worker processes.
+
+Fills a shared SQLite schedule store with due calls, then drains it with
+1, 2, 4, ... worker processes running LeasingDispatcher against a fake
+dialer that takes a fixed time per call. Reports throughput per worker
+count and verifies every call was dialed exactly once. With --crash, a
+worker claims a batch and dies without dialing it, so the others have to
+reclaim those calls when the lease expires.
+
+Usage:
+    python benchmarks/bench_workers.py --calls 2000 --workers 1 2 4 8 --dial-ms 20
+"""
+
+import argparse
+import logging
+import multiprocessing
+import sys
+import tempfile
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from pathlib import Path
+
+SRC = Path(__file__).parent.parent / 'src'
+sys.path.insert(0, str(SRC))
+
+from dispatcher import LeasingDispatcher
+from sqlite_scheduler import SQLiteScheduler
+
+
+def fill_store(db_path: str, calls: int) -> None:
+    """Schedule `calls` calls that are already due."""
+    store = SQLiteScheduler(db_path, reminder_hours_before=0)
+    due = datetime.now() - timedelta(minutes=1)
+    store.insert_calls(
+        [
+            store.make_call(f"apt_{i}", "+15550000000", f"Person {i}", "Reminder", due)
+            for i in range(calls)
+        ],
+        current_time=due
+    )
+    store.close()
+
+
+def run_worker(db_path: str, worker_id: str, dial_seconds: float, lease_seconds: float, batch: int) -> list:
+    """Worker process: drain due calls and return the IDs it dialed."""
+    logging.disable(logging.WARNING)
+    store = SQLiteScheduler(db_path)
+    dialed = []
+
+    def dial(call):
+        time.sleep(dial_seconds)
+        dialed.append(call.appointment_id)
+
+    dispatcher = LeasingDispatcher(
+        store, dial, worker_id, lease_seconds=lease_seconds, batch_size=batch
+    )
+    # Keep going until nothing is scheduled, waiting out leases of crashed workers
+    while store.count():
+        if not dispatcher.dispatch_due():
+            time.sleep(0.05)
+    store.close()
+    return dialed
+
+
+def crash_worker(db_path: str, lease_seconds: float, batch: int) -> None:
+    """Worker process that claims a batch and exits without dialing it."""
+    logging.disable(logging.WARNING)
+    store = SQLiteScheduler(db_path)
+    store.claim_due_calls('crashed-worker', lease_seconds, limit=batch)
+    store.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark multi-worker leased dispatch")
+    parser.add_argument('--calls', type=int, default=2000, help='Due calls to drain')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8], help='Worker counts')
+    parser.add_argument('--dial-ms', type=float, default=20.0, help='Simulated time per call')
+    parser.add_argument('--lease', type=float, default=2.0, help='Lease seconds')
+    parser.add_argument('--batch', type=int, default=10, help='Calls claimed per batch')
+    parser.add_argument('--crash', action='store_true', help='Add a worker that dies holding a batch')
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    context = multiprocessing.get_context('spawn')
+
+    print(f"\nLeased dispatch benchmark: {args.calls} calls, {args.dial_ms:.0f} ms per call")
+    print(f"{'workers':>8}{'seconds':>10}{'calls/s':>10}{'speedup':>9}{'dialed':>8}{'dupes':>7}")
+    baseline = None
+
+    for workers in args.workers:
+        with tempfile.TemporaryDirectory() as tmp:
+            db_path = str(Path(tmp) / 'schedule.db')
+            fill_store(db_path, args.calls)
+
+            with context.Pool(workers + args.crash) as pool:
+                if args.crash:
+                    pool.apply(crash_worker, (db_path, args.lease, args.batch))
+                began = time.perf_counter()
+                results = pool.starmap(run_worker, [
+                    (db_path, f"worker-{i}", args.dial_ms / 1000, args.lease, args.batch)
+                    for i in range(workers)
+                ])
+                elapsed = time.perf_counter() - began
+
+        dialed = Counter(appointment_id for ids in results for appointment_id in ids)
+        dupes = sum(count - 1 for count in dialed.values())
+        baseline = baseline or elapsed
+        print(f"{workers:>8}{elapsed:>10.2f}{args.calls / elapsed:>10.0f}"
+              f"{baseline / elapsed:>9.2f}{len(dialed):>8}{dupes:>7}")
+        assert len(dialed) == args.calls and not dupes, "calls were missed or dialed twice"
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,162 @@
+"""
+Simulate a degrading provider and compare dialing with and without backoff.
+
+Runs a local fake Twilio endpoint that goes through four phases: healthy,
+throttled (429 once more than --capacity calls are in flight), down (every
+request hangs past the read timeout) and recovered. Due calls arrive at a
+fixed rate and are placed by a pool of dialing threads, once with a plain
+Caller and once with a CircuitBreaker and AdaptiveLimiter around it.
+
+Per phase (the phase a call was dialed in, which lags behind when calls
+back up) it reports the requests that reached the provider, calls placed,
+provider failures, calls held back by the breaker, and how late calls were
+handled on average. With the guards, the provider sees far fewer requests
+while throttled or down, the dialing threads are not tied up waiting out
+timeouts, and calling resumes by itself once the provider recovers.
+
+Usage:
+    python benchmarks/sim_provider_faults.py --rate 100 --workers 8 --phase-seconds 1.5
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from aiohttp import web
+
+from bench_async_caller import ACCOUNT_SID, FROM_NUMBER, FakeTwilio
+from caller import Caller
+from circuit_breaker import CircuitBreaker
+from http_pool import PooledHttpClient
+from rate_limiter import AdaptiveLimiter
+
+PHASES = ['healthy', 'throttled', 'down', 'recovered']
+READ_TIMEOUT = 0.25
+
+
+class FaultyTwilio(FakeTwilio):
+    """Fake Calls resource whose behaviour follows the current phase."""
+
+    def __init__(self, latency: float, capacity: int):
+        super().__init__(latency)
+        self.capacity = capacity
+        self.phase = PHASES[0]
+        self.requests = Counter()
+
+    async def create(self, request: web.Request) -> web.Response:
+        phase = self.phase
+        self.requests[phase] += 1
+        if phase == 'down':
+            await asyncio.sleep(READ_TIMEOUT * 4)
+            return web.json_response({'code': 20503, 'message': 'Service unavailable'}, status=503)
+        if phase == 'throttled' and self.in_flight >= self.capacity:
+            return web.json_response({'code': 20429, 'message': 'Too many requests'}, status=429)
+        return await super().create(request)
+
+
+def simulate(server: FaultyTwilio, base_url: str, args, guarded: bool) -> dict:
+    """Feed due calls through every phase and tally the outcomes per phase."""
+    breaker = limiter = None
+    if guarded:
+        breaker = CircuitBreaker(failure_threshold=5, reset_timeout=args.phase_seconds / 3)
+        limiter = AdaptiveLimiter(max_limit=args.workers)
+    http_client = PooledHttpClient(pool_size=args.workers, read_timeout=READ_TIMEOUT)
+    caller = Caller(
+        ACCOUNT_SID, 'token', FROM_NUMBER,
+        http_client=http_client, limiter=limiter, breaker=breaker
+    )
+    tally = defaultdict(Counter)
+    lateness = defaultdict(float)
+    lock = threading.Lock()
+
+    def dial(due: float, index: int):
+        caller.client.api.base_url = base_url
+        phase = server.phase
+        result = caller.place_call(f"+1555{index:07d}", "Reminder")
+        late = time.perf_counter() - due
+        if result.success:
+            outcome = 'placed'
+        elif result.error and result.error.startswith('Circuit breaker'):
+            outcome = 'held'
+        else:
+            outcome = 'failed'
+        with lock:
+            tally[phase][outcome] += 1
+            lateness[phase] += late
+
+    server.requests.clear()
+    interval = 1 / args.rate
+    per_phase = int(args.phase_seconds * args.rate)
+    began = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+        for index in range(per_phase * len(PHASES)):
+            phase = PHASES[index // per_phase]
+            due = began + index * interval
+            time.sleep(max(due - time.perf_counter(), 0))
+            server.phase = phase
+            executor.submit(dial, due, index)
+        server.phase = PHASES[-1]
+    elapsed = time.perf_counter() - began
+    http_client.close()
+
+    return {
+        'tally': tally,
+        'lateness': lateness,
+        'requests': dict(server.requests),
+        'elapsed': elapsed,
+        'breaker': breaker.snapshot() if breaker else None,
+        'limiter': limiter.metrics() if limiter else None,
+    }
+
+
+def report(label: str, run: dict) -> None:
+    print(f"\n{label} (finished in {run['elapsed']:.1f}s)")
+    print(f"{'phase':<12}{'requests':>10}{'placed':>8}{'failed':>8}{'held':>6}{'avg late':>10}")
+    for phase in PHASES:
+        tally = run['tally'][phase]
+        calls = sum(tally.values())
+        late = run['lateness'][phase] / calls if calls else 0.0
+        print(f"{phase:<12}{run['requests'].get(phase, 0):>10}{tally['placed']:>8}"
+              f"{tally['failed']:>8}{tally['held']:>6}{late:>9.2f}s")
+    if run['breaker']:
+        print(f"breaker: {run['breaker']['state']}, opened {run['breaker']['opened']} times; "
+              f"limit ended at {run['limiter']['limit']:.1f} after {run['limiter']['decreases']} cuts")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulate provider faults with and without backoff")
+    parser.add_argument('--rate', type=float, default=100.0, help='Due calls per second')
+    parser.add_argument('--workers', type=int, default=8, help='Dialing threads')
+    parser.add_argument('--capacity', type=int, default=2, help='Calls in flight before throttling')
+    parser.add_argument('--latency-ms', type=float, default=20.0, help='Fake API latency when healthy')
+    parser.add_argument('--phase-seconds', type=float, default=1.5, help='Length of each phase')
+    args = parser.parse_args()
+
+    logging.disable(logging.CRITICAL)
+    server = FaultyTwilio(args.latency_ms / 1000, args.capacity)
+    base_url = server.start()
+
+    print(f"\nProvider fault simulation: {args.rate:.0f} due calls/s, {args.workers} dialing threads, "
+          f"{args.phase_seconds:.1f}s per phase")
+    unguarded = simulate(server, base_url, args, guarded=False)
+    report("Plain Caller", unguarded)
+    guarded = simulate(server, base_url, args, guarded=True)
+    report("CircuitBreaker + AdaptiveLimiter", guarded)
+
+    assert guarded['breaker']['opened'] >= 1, "breaker never opened during the outage"
+    assert guarded['tally']['recovered']['placed'] > 0, "calling did not resume after recovery"
+    assert guarded['requests'].get('down', 0) < unguarded['requests'].get('down', 0), \
+        "breaker did not reduce requests to the failing provider"
+
+
+if __name__ == '__main__':
+    main()
@@ -3,15 +3,17 @@ Main application for Appointment Reminder System.
 Coordinates all components and provides the main entry point.
 """
 
+import glob
+import itertools
 import os
+import socket
 import sys
+import threading
 import time
 import logging
+from datetime import datetime, timedelta
 from pathlib import Path
-from datetime import datetime
-from typing import List, Optional
-from apscheduler.schedulers.background import BackgroundScheduler
-from apscheduler.triggers.interval import IntervalTrigger
+from typing import Dict, Iterable, Iterator, List, Optional, Union, TYPE_CHECKING
 
 # Add src directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
@@ -19,8 +21,21 @@ sys.path.insert(0, str(Path(__file__).parent))
 from config_loader import ConfigLoader
 from logger import setup_logger
 from data_processor import DataProcessor, Appointment
-from scheduler import Scheduler
-from caller import Caller, CallResult
+from parse_cache import ParseCache
+from incremental import IncrementalSync
+from phone_normalizer import PhoneNormalizer
+from scheduler import Scheduler, ScheduledCall
+from dispatcher import Dispatcher, LeasingDispatcher
+from dial_pool import DialPool
+from rate_limiter import AdaptiveLimiter, CallPacer
+
+# twilio and APScheduler are imported only once dialing is needed
+if TYPE_CHECKING:
+    from caller import Caller, CallResult
+    from call_results import CallResultStore
+    from http_pool import PooledHttpClient
+    from reconcile import ReconcileReport
+    from twiml_server import TwiMLServer
 
 
 class AppointmentReminderApp:
@@ -48,19 +63,53 @@ class AppointmentReminderApp:
         self.logger.info("=" * 60)
         
         # Initialize components
+        self._init_phone_normalizer()
         self._init_data_processor()
-        self._init_caller()
         self._init_scheduler()
-        self._init_apscheduler()
+        self.incremental_sync = IncrementalSync()
+        
+        # Created on first use (see the caller property and start())
+        self._caller: Optional['Caller'] = None
+        self.call_results: Optional['CallResultStore'] = None
+        self.http_client: Optional['PooledHttpClient'] = None
+        self.last_reconcile: Optional['ReconcileReport'] = None
+        self.callback_server: Optional['TwiMLServer'] = None
+        self.apscheduler = None
+        self.dispatcher: Optional[Dispatcher] = None
+        self.dispatch_mode = self.config.get('scheduling.dispatch_mode', 'event')
+        self.async_calls = self.config.get('calling.async_calls', False)
         
-        # Statistics
+        # Synchronous dialing on worker threads (async_calls places batches itself)
+        self.dial_pool: Optional[DialPool] = None
+        dial_workers = self.config.get('calling.dial_workers', 0)
+        if dial_workers and not self.async_calls:
+            self.dial_pool = DialPool(
+                self._call_scheduled,
+                workers=dial_workers,
+                queue_size=self.config.get('calling.dial_queue_size', 100)
+            )
+        
+        # Statistics (updated from dialing threads)
+        self._stats_lock = threading.Lock()
         self.stats = {
             'calls_placed': 0,
             'calls_succeeded': 0,
             'calls_failed': 0,
+            'calls_retried': 0,
+            'calls_held': 0,
             'appointments_processed': 0
         }
     
+    def _init_phone_normalizer(self):
+        """Initialize phone normalizer shared by ingest and the caller."""
+        self.normalize_at_ingest = self.config.get('data.normalize_phones', True)
+        self.phone_normalizer = PhoneNormalizer(
+            max_size=self.config.get('data.phone_cache_size', 100000),
+            cache_file=self.config.get('data.phone_cache_file'),
+            processes=self.config.get('data.phone_processes', 0)
+        )
+        self.logger.info("Phone normalizer initialized")
+    
     def _init_data_processor(self):
         """Initialize data processor."""
         required_columns = self.config.get('data.required_columns', [
@@ -69,16 +118,36 @@ class AppointmentReminderApp:
         date_format = self.config.get('data.date_format', "%Y-%m-%d %H:%M")
         fallback_format = self.config.get('data.fallback_date_format', "%m/%d/%Y %H:%M")
         
+        cache = None
+        cache_dir = self.config.get('data.cache_dir')
+        if cache_dir:
+            cache_max_mb = self.config.get('data.cache_max_mb', 256)
+            cache = ParseCache(cache_dir, max_bytes=int(cache_max_mb * 1024 * 1024))
+        
         self.data_processor = DataProcessor(
             required_columns=required_columns,
             date_format=date_format,
-            fallback_date_format=fallback_format
+            fallback_date_format=fallback_format,
+            cache=cache,
+            date_cache_size=self.config.get('data.date_cache_size', 65536),
+            timezone=self.config.get('scheduling.timezone') or None
         )
         
         self.logger.info("Data processor initialized")
     
+    @property
+    def caller(self) -> 'Caller':
+        """Twilio caller, created on first use."""
+        if self._caller is None:
+            self._init_caller()
+        return self._caller
+    
     def _init_caller(self):
         """Initialize caller."""
+        from caller import Caller
+        from call_results import CallResultStore
+        from twiml_server import STATUS_PATH
+        
         env_config = self.config.get('env', {})
         
         account_sid = env_config.get('twilio_account_sid')
@@ -91,25 +160,93 @@ class AppointmentReminderApp:
         
         max_retries = self.config.get('calling.max_retries', 3)
         retry_delay = self.config.get('calling.retry_delay_seconds', 300)
+        max_retry_delay = self.config.get('calling.max_retry_delay_seconds', 3600)
+        
+        pacer = None
+        calls_per_second = self.config.get('calling.calls_per_second', 1)
+        if calls_per_second:
+            pacer = CallPacer(
+                calls_per_second=calls_per_second,
+                burst=self.config.get('calling.call_burst', 1)
+            )
+        
+        # Stop calling a provider that keeps failing instead of waiting out its timeouts
+        breaker = None
+        failure_threshold = self.config.get('calling.breaker_failure_threshold', 5)
+        if failure_threshold:
+            from circuit_breaker import CircuitBreaker
+            breaker = CircuitBreaker(
+                failure_threshold=failure_threshold,
+                reset_timeout=self.config.get('calling.breaker_reset_seconds', 30)
+            )
         
-        self.caller = Caller(
+        # Twilio posts call progress to the callback server when it is reachable
+        self.call_results = CallResultStore()
+        public_url = self.config.get('callbacks.public_url')
+        status_callback = public_url.rstrip('/') + STATUS_PATH if public_url else None
+        
+        caller_args = dict(
             account_sid=account_sid,
             auth_token=auth_token,
             from_number=phone_number,
             max_retries=max_retries,
-            retry_delay=retry_delay
+            retry_delay=retry_delay,
+            normalizer=self.phone_normalizer,
+            pacer=pacer,
+            max_retry_delay=max_retry_delay,
+            status_callback=status_callback,
+            results=self.call_results,
+            breaker=breaker
         )
         
+        if self.async_calls:
+            from async_caller import AsyncCaller
+            self._caller = AsyncCaller(
+                max_concurrency=self.config.get('calling.max_concurrent_calls', 10),
+                **caller_args
+            )
+        else:
+            # Dialing threads share one keep-alive connection pool
+            from http_pool import PooledHttpClient
+            self.http_client = PooledHttpClient(
+                pool_size=self.config.get('calling.http_pool_size', 10),
+                connect_timeout=self.config.get('calling.http_connect_timeout', 5),
+                read_timeout=self.config.get('calling.http_read_timeout', 30),
+                keep_alive=self.config.get('calling.http_keep_alive', True)
+            )
+            # Dialing threads back off together when the provider is overloaded
+            limiter = None
+            if self.dial_pool is not None and self.config.get('calling.adaptive_concurrency', False):
+                limiter = AdaptiveLimiter(max_limit=self.dial_pool.workers)
+            self._caller = Caller(http_client=self.http_client, limiter=limiter, **caller_args)
+        
         self.logger.info("Caller initialized")
     
     def _init_scheduler(self):
         """Initialize scheduler."""
         reminder_hours = self.config.get('scheduling.reminder_hours_before', 24)
-        self.scheduler = Scheduler(reminder_hours_before=reminder_hours)
-        self.logger.info("Scheduler initialized")
+        reminder_offsets = self.config.get('scheduling.reminder_offsets_hours')
+        self.schedule_store = self.config.get('scheduling.store', 'memory')
+        
+        if self.schedule_store == 'sqlite':
+            from sqlite_scheduler import SQLiteScheduler
+            
+            self.scheduler = SQLiteScheduler(
+                db_path=self.config.get('scheduling.store_path', 'data/schedule.db'),
+                reminder_hours_before=reminder_hours,
+                reminder_offsets=reminder_offsets,
+                timezone=self.data_processor.timezone
+            )
+            self.logger.info(f"Scheduler initialized with {self.scheduler.count()} pending calls")
+        else:
+            self.scheduler = Scheduler(reminder_hours_before=reminder_hours, reminder_offsets=reminder_offsets)
+            self.logger.info("Scheduler initialized")
     
     def _init_apscheduler(self):
         """Initialize APScheduler for periodic checks."""
+        from apscheduler.schedulers.background import BackgroundScheduler
+        from apscheduler.triggers.interval import IntervalTrigger
+        
         self.apscheduler = BackgroundScheduler()
         check_interval = self.config.get('scheduling.check_interval_minutes', 60)
         
@@ -124,41 +261,148 @@ class AppointmentReminderApp:
         
         self.logger.info(f"APScheduler initialized with {check_interval} minute interval")
     
-    def load_appointments(self, file_path: str) -> List[Appointment]:
-        """Load appointments from Excel file.
+    def _init_dispatcher(self):
+        """Initialize the event-driven dispatcher."""
+        if self.dispatcher is not None:
+            return
+        max_wait = self.config.get('scheduling.dispatch_max_wait_seconds', 300)
+        # Async dialing places all calls that fall due together in one batch
+        batch_handler = self._call_dispatched_batch if self.async_calls else None
+        
+        if self.schedule_store == 'sqlite':
+            # The store may be shared with other workers: claim due calls under a lease
+            worker_id = self.config.get('scheduling.worker_id') or f"{socket.gethostname()}-{os.getpid()}"
+            self.dispatcher = LeasingDispatcher(
+                self.scheduler,
+                self._call_scheduled,
+                worker_id,
+                lease_seconds=self.config.get('scheduling.lease_seconds', 60),
+                batch_size=self.config.get('scheduling.claim_batch', 10),
+                max_wait=max_wait,
+                batch_handler=batch_handler,
+                dial_pool=self.dial_pool
+            )
+            self.logger.info(f"Leasing dispatcher initialized as worker {worker_id}")
+        else:
+            # With a dial pool the dispatcher only queues calls and goes back to waiting
+            handler = self.dial_pool.submit if self.dial_pool is not None else self._call_scheduled
+            self.dispatcher = Dispatcher(self.scheduler, handler, max_wait=max_wait, batch_handler=batch_handler)
+            self.logger.info("Dispatcher initialized")
+    
+    def load_appointments(self, file_path: str) -> Iterator[List[Appointment]]:
+        """Stream appointments from an appointment file in chunks.
         
         Args:
-            file_path: Path to Excel file
+            file_path: Path to Excel, CSV or columnar file
             
-        Returns:
-            List of Appointment objects
+        Yields:
+            Lists of Appointment objects (upcoming only unless calling immediately)
         """
         self.logger.info(f"Loading appointments from: {file_path}")
         
         call_immediately = self.config.get('scheduling.call_immediately', False)
+        chunk_size = self.config.get('data.chunk_size', 5000)
+        
+        total = 0
+        kept = 0
         
         try:
-            appointments = self.data_processor.read_excel(file_path)
-            
-            if call_immediately:
-                # Don't filter - use all appointments
-                self.logger.info(f"Loaded {len(appointments)} appointments (immediate mode - using all)")
-                return appointments
-            else:
-                # Filter to upcoming appointments only
-                upcoming = self.data_processor.get_upcoming_appointments(appointments)
-                self.logger.info(f"Loaded {len(appointments)} total, {len(upcoming)} upcoming")
-                return upcoming
+            for chunk in self.data_processor.iter_appointments(file_path, chunk_size=chunk_size):
+                total += len(chunk)
+                chunk = self._prepare_chunk(chunk, call_immediately)
+                kept += len(chunk)
+                if chunk:
+                    yield chunk
             
         except Exception as e:
             self.logger.error(f"Error loading appointments: {e}")
             raise
+        
+        if self.normalize_at_ingest:
+            self.phone_normalizer.save()
+        
+        if call_immediately:
+            self.logger.info(f"Loaded {total} appointments (immediate mode - using all)")
+        else:
+            self.logger.info(f"Loaded {total} total, {kept} upcoming")
+    
+    def load_many(self, patterns: List[str]) -> Iterator[List[Appointment]]:
+        """Load every sheet of several files (paths or globs) in parallel.
+        
+        Per-source results are kept in self.ingest_reports.
+        
+        Args:
+            patterns: File paths or glob patterns
+            
+        Yields:
+            Lists of Appointment objects in source/sheet/row order
+        """
+        self.logger.info(f"Loading appointments from: {', '.join(patterns)}")
+        
+        call_immediately = self.config.get('scheduling.call_immediately', False)
+        chunk_size = self.config.get('data.chunk_size', 5000)
+        workers = self.config.get('data.ingest_workers', 0) or None
+        
+        appointments, self.ingest_reports = self.data_processor.read_many(
+            patterns, max_workers=workers
+        )
+        
+        for report in self.ingest_reports:
+            status = f"ERROR {report.error}" if report.error else f"{report.parsed} parsed, {report.rejected} rejected"
+            self.logger.info(f"  {report.task.label()}: {status} ({report.seconds:.2f}s)")
+        
+        for start in range(0, len(appointments), chunk_size):
+            chunk = self._prepare_chunk(appointments[start:start + chunk_size], call_immediately)
+            if chunk:
+                yield chunk
+        
+        if self.normalize_at_ingest:
+            self.phone_normalizer.save()
+    
+    def _prepare_chunk(
+        self,
+        chunk: List[Appointment],
+        call_immediately: bool
+    ) -> List[Appointment]:
+        """Filter a chunk to upcoming appointments and normalize its phone numbers.
+        
+        Args:
+            chunk: Freshly loaded appointments
+            call_immediately: Keep past appointments too (immediate mode)
+            
+        Returns:
+            Appointments ready to schedule
+        """
+        if not call_immediately:
+            # Filter to upcoming appointments only
+            chunk = self.data_processor.get_upcoming_appointments(chunk)
+        
+        if chunk and self.normalize_at_ingest:
+            self._normalize_phones(chunk)
+        
+        return chunk
+    
+    def _normalize_phones(self, appointments: List[Appointment]) -> None:
+        """Normalize phone numbers of a chunk of appointments to E.164 in one batch.
+        
+        Args:
+            appointments: Appointments to update in place
+        """
+        normalized = self.phone_normalizer.normalize_many(
+            apt.phone_number for apt in appointments
+        )
+        for apt, number in zip(appointments, normalized):
+            apt.normalized_phone = number
     
-    def schedule_appointments(self, appointments: List[Appointment]) -> int:
+    def schedule_appointments(
+        self,
+        appointments: Iterable[Union[Appointment, List[Appointment]]]
+    ) -> int:
         """Schedule calls for all appointments.
         
         Args:
-            appointments: List of appointments to schedule
+            appointments: Appointments to schedule, either flat or as chunks
+                (e.g. the stream returned by load_appointments)
             
         Returns:
             Number of appointments successfully scheduled
@@ -166,78 +410,220 @@ class AppointmentReminderApp:
         call_immediately = self.config.get('scheduling.call_immediately', False)
         
         if call_immediately:
-            self.logger.info(f"Call immediately mode: Placing {len(appointments)} calls now")
+            self.logger.info("Call immediately mode: Placing calls now")
         else:
-            self.logger.info(f"Scheduling reminders for {len(appointments)} appointments")
+            self.logger.info("Scheduling reminders for loaded appointments")
         
         scheduled_count = 0
-        message_template = self.config.get(
+        message_template = self._message_template()
+        
+        if call_immediately:
+            for apt in self._flatten(appointments):
+                if self._schedule_one(apt, message_template, call_immediately):
+                    scheduled_count += 1
+            self.logger.info(f"Placed {scheduled_count} immediate calls")
+            return scheduled_count
+        
+        # Schedule reminders chunk by chunk, one bulk insert each
+        chunk_size = self.config.get('data.chunk_size', 5000)
+        flat = self._flatten(appointments)
+        counts = {'scheduled': 0, 'existing': 0, 'duplicates': 0, 'past': 0}
+        
+        while True:
+            chunk = list(itertools.islice(flat, chunk_size))
+            if not chunk:
+                break
+            for key, value in self._schedule_chunk(chunk, message_template).items():
+                counts[key] += value
+        
+        scheduled_count = counts['scheduled'] + counts['existing']
+        if counts['past']:
+            self.logger.warning(f"Skipped {counts['past']} appointments whose reminder time has passed")
+        self.logger.info(
+            f"Scheduled {scheduled_count} reminder calls ({counts['existing']} were already scheduled, "
+            f"{counts['duplicates']} duplicate rows ignored)"
+        )
+        return scheduled_count
+    
+    def sync_appointments(self, file_path: str) -> Dict[str, int]:
+        """Re-ingest a file, applying only rows that changed since its last ingest.
+        
+        New rows are scheduled, rows whose details changed are rescheduled,
+        and rows no longer present have their reminders cancelled. The first
+        sync of a file schedules every row.
+        
+        Args:
+            file_path: Path to appointment file
+            
+        Returns:
+            Counts of added, updated, removed and unchanged appointments
+        """
+        call_immediately = self.config.get('scheduling.call_immediately', False)
+        message_template = self._message_template()
+        
+        delta = self.incremental_sync.diff(
+            file_path,
+            self._flatten(self.load_appointments(file_path)),
+            self._appointment_id
+        )
+        
+        if call_immediately:
+            for apt in delta.added:
+                self._schedule_one(apt, message_template, call_immediately)
+            for apt in delta.updated:
+                self._schedule_one(apt, message_template, call_immediately, replace=True)
+        else:
+            self._schedule_chunk(delta.added, message_template)
+            self._schedule_chunk(delta.updated, message_template, replace=True)
+        for appointment_id in delta.removed:
+            self.scheduler.remove_call(appointment_id)
+        
+        self.incremental_sync.commit(file_path, delta)
+        
+        counts = delta.counts()
+        self.logger.info(
+            f"Synced {file_path}: {counts['added']} added, {counts['updated']} updated, "
+            f"{counts['removed']} removed, {counts['unchanged']} unchanged"
+        )
+        return counts
+    
+    def _message_template(self) -> str:
+        """Get the reminder message template from configuration."""
+        return self.config.get(
             'message.message_template',
             "Hello {name}, this is an automated reminder that you have an appointment scheduled for {appointment_date} at {appointment_time}. If you need to reschedule, please contact us. Thank you."
         )
+    
+    @staticmethod
+    def _format_message(apt: Appointment, message_template: str) -> str:
+        """Fill the reminder message template for an appointment."""
+        return message_template.format(
+            name=apt.name,
+            appointment_date=apt.appointment_datetime.strftime("%B %d, %Y"),
+            appointment_time=apt.appointment_datetime.strftime("%I:%M %p")
+        )
+    
+    def _schedule_chunk(
+        self,
+        appointments: List[Appointment],
+        message_template: str,
+        replace: bool = False
+    ) -> Dict[str, int]:
+        """Schedule reminders for a chunk of appointments with one Scheduler.schedule_many call.
         
+        Args:
+            appointments: Appointments to schedule
+            message_template: Reminder message template
+            replace: Replace existing scheduled calls with the same IDs
+            
+        Returns:
+            Summary counts from Scheduler.schedule_many
+        """
+        records = []
         for apt in appointments:
             try:
-                # Format message
-                appointment_date = apt.appointment_datetime.strftime("%B %d, %Y")
-                appointment_time = apt.appointment_datetime.strftime("%I:%M %p")
-                
-                message = message_template.format(
-                    name=apt.name,
-                    appointment_date=appointment_date,
-                    appointment_time=appointment_time
-                )
-                
-                # Create appointment ID
-                appointment_id = f"{apt.name}_{apt.appointment_datetime.isoformat()}"
-                
-                if call_immediately:
-                    # Call immediately instead of scheduling
-                    self.logger.info(f"Placing immediate call to {apt.name}")
-                    try:
-                        result = self.caller.place_call(
-                            to_number=apt.phone_number,
-                            message=message,
-                            retry=True
-                        )
-                        
-                        # Update statistics
-                        self.stats['calls_placed'] += 1
-                        if result.success:
-                            self.stats['calls_succeeded'] += 1
-                            self.logger.info(f"[OK] Call successful to {apt.name}: {result.status}")
-                        else:
-                            self.stats['calls_failed'] += 1
-                            self.logger.error(f"[FAIL] Call failed to {apt.name}: {result.error}")
-                        
-                        scheduled_count += 1
-                    except Exception as e:
-                        self.logger.error(f"Error placing call to {apt.name}: {e}")
-                else:
-                    # Schedule the call for later
-                    scheduled = self.scheduler.schedule_appointment(
-                        appointment_id=appointment_id,
-                        phone_number=apt.phone_number,
-                        name=apt.name,
+                records.append((
+                    self._appointment_id(apt),
+                    apt.dial_number,
+                    apt.name,
+                    self._format_message(apt, message_template),
+                    apt.appointment_datetime
+                ))
+            except Exception as e:
+                self.logger.error(f"Error processing appointment for {apt.name}: {e}")
+        
+        return self.scheduler.schedule_many(records, replace=replace)
+    
+    @staticmethod
+    def _appointment_id(apt: Appointment) -> str:
+        """Build the unique scheduler ID for an appointment (from its wall-clock time)."""
+        return f"{apt.name}_{apt.appointment_datetime.replace(tzinfo=None).isoformat()}"
+    
+    def _schedule_one(
+        self,
+        apt: Appointment,
+        message_template: str,
+        call_immediately: bool,
+        replace: bool = False
+    ) -> bool:
+        """Call or schedule a single appointment.
+        
+        Args:
+            apt: Appointment to process
+            message_template: Reminder message template
+            call_immediately: Place the call now instead of scheduling it
+            replace: Replace an existing scheduled call with the same ID
+            
+        Returns:
+            True if the call was placed or scheduled
+        """
+        try:
+            message = self._format_message(apt, message_template)
+            
+            # Create appointment ID
+            appointment_id = self._appointment_id(apt)
+            
+            if call_immediately:
+                # Call immediately instead of scheduling
+                self.logger.info(f"Placing immediate call to {apt.name}")
+                try:
+                    result = self.caller.place_call(
+                        to_number=apt.dial_number,
                         message=message,
-                        appointment_datetime=apt.appointment_datetime,
-                        callback=lambda apt_id=appointment_id: self._place_reminder_call(apt_id)
+                        retry=True
                     )
                     
-                    if scheduled:
-                        scheduled_count += 1
-                        self.logger.debug(f"Scheduled reminder for {apt.name}")
-                
-            except Exception as e:
-                self.logger.error(f"Error processing appointment for {apt.name}: {e}")
+                    # Update statistics
+                    self._count_call(result)
+                    if result.success:
+                        self.logger.info(f"[OK] Call successful to {apt.name}: {result.status}")
+                    else:
+                        self.logger.error(f"[FAIL] Call failed to {apt.name}: {result.error}")
+                        # Try again later through the schedule
+                        self._schedule_retry(
+                            self.scheduler.make_call(
+                                appointment_id, apt.dial_number, apt.name, message, apt.appointment_datetime
+                            ),
+                            result
+                        )
+                    
+                    return True
+                except Exception as e:
+                    self.logger.error(f"Error placing call to {apt.name}: {e}")
+                    return False
+            
+            # Schedule the call for later
+            scheduled = self.scheduler.schedule_appointment(
+                appointment_id=appointment_id,
+                phone_number=apt.dial_number,
+                name=apt.name,
+                message=message,
+                appointment_datetime=apt.appointment_datetime,
+                callback=lambda apt_id=appointment_id: self._place_reminder_call(apt_id),
+                replace=replace
+            )
+            
+            if scheduled:
+                self.logger.debug(f"Scheduled reminder for {apt.name}")
+                return True
+            
+        except Exception as e:
+            self.logger.error(f"Error processing appointment for {apt.name}: {e}")
         
-        if call_immediately:
-            self.logger.info(f"Placed {scheduled_count} immediate calls")
-        else:
-            self.logger.info(f"Scheduled {scheduled_count} reminder calls")
-        return scheduled_count
+        return False
+    
+    @staticmethod
+    def _flatten(
+        appointments: Iterable[Union[Appointment, List[Appointment]]]
+    ) -> Iterator[Appointment]:
+        """Yield appointments one at a time from a flat or chunked iterable."""
+        for item in appointments:
+            if isinstance(item, list):
+                yield from item
+            else:
+                yield item
     
-    def _place_reminder_call(self, appointment_id: str) -> CallResult:
+    def _place_reminder_call(self, appointment_id: str) -> 'CallResult':
         """Place a reminder call (callback for scheduled calls).
         
         Args:
@@ -246,11 +632,34 @@ class AppointmentReminderApp:
         Returns:
             CallResult object
         """
+        from caller import CallResult
+        
         scheduled_call = self.scheduler.get_scheduled_call(appointment_id)
         if not scheduled_call:
             self.logger.error(f"Could not find scheduled call for {appointment_id}")
             return CallResult(success=False, error="Scheduled call not found")
         
+        result = self._call_scheduled(scheduled_call)
+        
+        # Move on to the appointment's next reminder (removing it after the
+        # last), unless the call was rescheduled for another attempt
+        if result.retry_at is None:
+            self.scheduler.advance_call(appointment_id)
+        
+        return result
+    
+    def _call_scheduled(self, scheduled_call: ScheduledCall) -> 'CallResult':
+        """Place the reminder call for a scheduled call and record the outcome.
+        
+        Also the Dispatcher's handler, which has already taken the call off
+        the scheduler.
+        
+        Args:
+            scheduled_call: Call to place
+            
+        Returns:
+            CallResult object
+        """
         self.logger.info(f"Placing call to {scheduled_call.name} at {scheduled_call.phone_number}")
         
         # Place the call
@@ -260,12 +669,54 @@ class AppointmentReminderApp:
             retry=True
         )
         
+        self._record_result(scheduled_call, result)
+        return result
+    
+    def _call_batch(self, due_calls: List[ScheduledCall], advance: bool = True) -> None:
+        """Place a batch of due calls concurrently and advance each one.
+        
+        Args:
+            due_calls: Calls that are due now
+            advance: Move each appointment on to its next touch afterwards
+                (False when the calls were already taken off the schedule)
+        """
+        self.logger.info(
+            f"Placing {len(due_calls)} calls, up to {self.caller.max_concurrency} at once"
+        )
+        
+        results = self.caller.run_batch(
+            (scheduled_call.phone_number, scheduled_call.message)
+            for scheduled_call in due_calls
+        )
+        
+        for scheduled_call, result in zip(due_calls, results):
+            self._record_result(scheduled_call, result)
+            if advance and result.retry_at is None:
+                self.scheduler.advance_call(scheduled_call.appointment_id)
+    
+    def _call_dispatched_batch(self, due_calls: List[ScheduledCall]) -> None:
+        """Dispatcher batch handler: place calls it has already taken off the schedule.
+        
+        Args:
+            due_calls: Calls that are due now
+        """
+        self._call_batch(due_calls, advance=False)
+    
+    def _record_result(self, scheduled_call: ScheduledCall, result: 'CallResult') -> None:
+        """Update statistics, log the outcome of a reminder call and schedule
+        a retry if it failed in a way worth retrying.
+        
+        Args:
+            scheduled_call: Call that was placed
+            result: Outcome of the call
+        """
+        if result.rejected:
+            # Never reached the provider: neither a placed call nor a used attempt
+            self._hold_call(scheduled_call, result)
+            return
+        
         # Update statistics
-        self.stats['calls_placed'] += 1
-        if result.success:
-            self.stats['calls_succeeded'] += 1
-        else:
-            self.stats['calls_failed'] += 1
+        self._count_call(result)
         
         # Log result
         if result.success:
@@ -276,17 +727,93 @@ class AppointmentReminderApp:
             self.logger.error(
                 f"✗ Call failed to {scheduled_call.name}: {result.error}"
             )
+            self._schedule_retry(scheduled_call, result)
+    
+    def _schedule_retry(self, scheduled_call: ScheduledCall, result: 'CallResult') -> bool:
+        """Put a failed call back on the schedule after a backoff delay.
         
-        # Remove from scheduler after processing
-        self.scheduler.remove_call(appointment_id)
+        The dispatcher moves straight on to other calls instead of waiting
+        for the retry. Sets result.retry_at when a retry was scheduled.
         
-        return result
+        Args:
+            scheduled_call: Call whose attempt failed
+            result: Outcome of the attempt
+            
+        Returns:
+            True if a retry was scheduled
+        """
+        if not result.retryable:
+            return False
+        
+        delay = self.caller.retry_policy.delay(scheduled_call.attempt)
+        if delay is None:
+            self.logger.error(
+                f"Giving up on call to {scheduled_call.name} after {scheduled_call.attempt + 1} attempts"
+            )
+            return False
+        
+        retry_time = datetime.now(scheduled_call.call_time.tzinfo) + timedelta(seconds=delay)
+        self.scheduler.retry_call(scheduled_call, retry_time)
+        result.retry_at = retry_time
+        with self._stats_lock:
+            self.stats['calls_retried'] += 1
+        
+        self.logger.info(
+            f"Retrying call to {scheduled_call.name} at {retry_time.strftime('%Y-%m-%d %H:%M:%S')} "
+            f"(retry {scheduled_call.attempt + 1} of {self.caller.retry_policy.max_retries})"
+        )
+        return True
+    
+    def _hold_call(self, scheduled_call: ScheduledCall, result: 'CallResult') -> None:
+        """Put a call the circuit breaker held back on the schedule for its next probe.
+        
+        The attempt count is left as it is, so an outage of any length does
+        not use up the call's retries. Sets result.retry_at.
+        
+        Args:
+            scheduled_call: Call that was held back
+            result: Rejected result, with retry_in set
+        """
+        retry_time = datetime.now(scheduled_call.call_time.tzinfo) + timedelta(seconds=result.retry_in or 0)
+        self.scheduler.requeue_call(scheduled_call, retry_time)
+        result.retry_at = retry_time
+        with self._stats_lock:
+            self.stats['calls_held'] += 1
+        
+        self.logger.info(
+            f"Holding call to {scheduled_call.name} until {retry_time.strftime('%Y-%m-%d %H:%M:%S')} "
+            f"(circuit breaker open)"
+        )
+    
+    def _count_call(self, result: 'CallResult') -> None:
+        """Add a placed call to the statistics (safe from any dialing thread).
+        
+        Args:
+            result: Outcome of the call
+        """
+        with self._stats_lock:
+            self.stats['calls_placed'] += 1
+            if result.success:
+                self.stats['calls_succeeded'] += 1
+            else:
+                self.stats['calls_failed'] += 1
     
     def process_due_calls(self):
-        """Process all due calls (called periodically by APScheduler)."""
+        """Process all due calls (called periodically by APScheduler in poll mode)."""
         self.logger.debug("Checking for due calls...")
         
-        due_calls = self.scheduler.get_due_calls()
+        if self.schedule_store == 'sqlite':
+            self._init_dispatcher()
+            dispatched = self.dispatcher.dispatch_due()
+            if dispatched:
+                self.logger.info(f"Processed {dispatched} due calls")
+            return
+        
+        if self.dial_pool is not None:
+            # Off the schedule before dialing, so the next poll can't queue them again
+            due_calls = self.scheduler.pop_due_calls()
+        else:
+            due_calls = self.scheduler.get_due_calls()
         
         if not due_calls:
             self.logger.debug("No calls are due")
@@ -294,52 +821,249 @@ class AppointmentReminderApp:
         
         self.logger.info(f"Processing {len(due_calls)} due calls")
         
+        if self.async_calls:
+            try:
+                self._call_batch(due_calls)
+            except Exception as e:
+                self.logger.error(f"Error processing batch of {len(due_calls)} calls: {e}")
+            return
+        
+        if self.dial_pool is not None:
+            # Blocks while the backlog is full; workers record each outcome
+            for scheduled_call in due_calls:
+                self.dial_pool.submit(scheduled_call)
+            return
+        
         for scheduled_call in due_calls:
             try:
                 self._place_reminder_call(scheduled_call.appointment_id)
             except Exception as e:
                 self.logger.error(f"Error processing call for {scheduled_call.name}: {e}")
     
+    def reconcile_calls(
+        self,
+        since: Optional[datetime] = None,
+        max_pages: Optional[int] = None
+    ) -> Optional['ReconcileReport']:
+        """Fill in outcomes of tracked calls from Twilio's call list.
+        
+        Lists calls page by page instead of fetching each one, so outcomes
+        that no status callback delivered are caught up cheaply. An
+        interrupted run resumes from its checkpoint file.
+        
+        Args:
+            since: Earliest call start time to list (default: shortly before
+                the oldest tracked call still waiting for an outcome)
+            max_pages: Stop after this many pages (None for the whole range)
+        
+        Returns:
+            ReconcileReport, or None if there was nothing to reconcile or it failed
+        """
+        from reconcile import CallReconciler
+        
+        caller = self.caller
+        if since is None:
+            unfinished = self.call_results.unfinished().values()
+            if not unfinished:
+                self.logger.debug("No calls waiting for an outcome")
+                return None
+            # Allow for clock skew between this host and Twilio
+            since = min(result.timestamp for result in unfinished) - timedelta(minutes=5)
+        
+        reconciler = CallReconciler(
+            caller,
+            self.call_results,
+            checkpoint_path=self.config.get('calling.reconcile_checkpoint', 'data/reconcile_checkpoint.json'),
+            page_size=self.config.get('calling.reconcile_page_size', 1000)
+        )
+        try:
+            self.last_reconcile = reconciler.run(since, max_pages=max_pages)
+        except Exception as e:
+            self.logger.error(f"Error reconciling call outcomes: {e}")
+            return None
+        return self.last_reconcile
+    
+    def _start_reconcile_job(self, interval: float):
+        """Reconcile call outcomes every `interval` minutes on APScheduler."""
+        from apscheduler.schedulers.background import BackgroundScheduler
+        from apscheduler.triggers.interval import IntervalTrigger
+        
+        if self.apscheduler is None:
+            self.apscheduler = BackgroundScheduler()
+        self.apscheduler.add_job(
+            self.reconcile_calls,
+            trigger=IntervalTrigger(minutes=interval),
+            id='reconcile_calls',
+            name='Reconcile Call Outcomes',
+            replace_existing=True
+        )
+        if not self.apscheduler.running:
+            self.apscheduler.start()
+        self.logger.info(f"Call reconciliation scheduled every {interval} minutes")
+    
     def start(self):
         """Start the application."""
         self.logger.info("Starting appointment reminder system...")
         
-        # Start APScheduler
-        self.apscheduler.start()
-        self.logger.info("APScheduler started")
+        # Dialing is about to be needed: fail fast on missing credentials
+        self.caller
+        
+        if self.config.get('callbacks.public_url'):
+            self._start_callback_server()
         
-        # Process any immediately due calls
-        self.process_due_calls()
+        if self.dispatch_mode == 'event':
+            # The dispatcher also places calls that are already due
+            self._init_dispatcher()
+            self.dispatcher.start()
+        else:
+            # Start APScheduler
+            if self.apscheduler is None:
+                self._init_apscheduler()
+            self.apscheduler.start()
+            self.logger.info("APScheduler started")
+            
+            # Process any immediately due calls
+            self.process_due_calls()
+        
+        reconcile_interval = self.config.get('calling.reconcile_interval_minutes', 0)
+        if reconcile_interval:
+            self._start_reconcile_job(reconcile_interval)
         
         self.logger.info("Application started successfully")
         self.print_status()
     
+    def _start_callback_server(self):
+        """Serve status callbacks (and TwiML) on a background thread."""
+        from twiml_server import TwiMLServer
+        
+        if self.callback_server is not None:
+            return
+        validate = self.config.get('callbacks.validate_signatures', True)
+        self.callback_server = TwiMLServer(
+            host=self.config.get('callbacks.host', '0.0.0.0'),
+            port=self.config.get('callbacks.port', 8000),
+            results=self.call_results,
+            auth_token=self.config.get('env', {}).get('twilio_auth_token') if validate else None,
+            public_url=self.config.get('callbacks.public_url')
+        )
+        self.callback_server.start(background=True)
+        self.logger.info(f"Receiving status callbacks at {self.callback_server.get_status_callback_url()}")
+    
     def stop(self):
         """Stop the application."""
         self.logger.info("Stopping appointment reminder system...")
         
-        if self.apscheduler.running:
+        if self.dispatcher is not None:
+            self.dispatcher.stop()
+        
+        if self.apscheduler is not None and self.apscheduler.running:
             self.apscheduler.shutdown()
             self.logger.info("APScheduler stopped")
         
+        if self.dial_pool is not None:
+            # Nothing new is queued now; let calls already handed over finish
+            undialed = self.dial_pool.shutdown(self.config.get('calling.drain_timeout_seconds'))
+            for scheduled_call in undialed:
+                self.scheduler.requeue_call(scheduled_call)
+                self.logger.warning(f"Call for {scheduled_call.appointment_id} was not dialed; put back on the schedule")
+        
+        if self.callback_server is not None:
+            self.callback_server.stop()
+            self.callback_server = None
+        
+        if self.http_client is not None:
+            self.http_client.close()
+        
+        self.phone_normalizer.close()
+        self.scheduler.close()
         self.print_statistics()
         self.logger.info("Application stopped")
     
-    def print_status(self):
-        """Print current status."""
+    def print_status(self, limit: int = 5):
+        """Print current status.
+        
+        Args:
+            limit: Number of upcoming calls to list
+        """
         print("\n" + "=" * 60)
         print("APPOINTMENT REMINDER SYSTEM - STATUS")
         print("=" * 60)
         print(f"Total Scheduled Calls: {self.scheduler.count()}")
         
-        upcoming = self.scheduler.get_upcoming_calls(limit=5)
+        upcoming = self.scheduler.get_upcoming_calls(limit=limit)
         if upcoming:
-            print("\nNext 5 Scheduled Calls:")
+            print(f"\nNext {limit} Scheduled Calls:")
             for call in upcoming:
                 print(f"  • {call.name}: {call.call_time.strftime('%Y-%m-%d %H:%M')}")
         else:
             print("\nNo upcoming calls scheduled")
         
+        if self._caller is not None and self._caller.pacer is not None:
+            for number, metrics in self._caller.pacer.metrics().items():
+                print(
+                    f"\nPacing {number}: {metrics['calls']} calls, {metrics['delayed']} delayed, "
+                    f"max wait {metrics['max_wait']:.1f}s, {metrics['queued']:.0f} queued"
+                )
+        
+        if self._caller is not None and self._caller.breaker is not None:
+            breaker = self._caller.breaker.snapshot()
+            line = f"\nCircuit breaker: {breaker['state']}"
+            if breaker['state'] == 'open':
+                line += f" (probing in {breaker['retry_in']:.0f}s)"
+            print(
+                f"{line}, {breaker['failures']} consecutive failures, "
+                f"opened {breaker['opened']} times, {breaker['rejected']} calls held back"
+            )
+        
+        if self._caller is not None and self._caller.limiter is not None:
+            metrics = self._caller.limiter.metrics()
+            print(
+                f"\nAdaptive limit: {metrics['limit']:.1f} of {self._caller.limiter.max_limit} calls in flight "
+                f"({metrics['in_flight']} now), cut {metrics['decreases']} times after {metrics['overloads']} overloads"
+            )
+        
+        if self.call_results is not None and len(self.call_results):
+            counts = self.call_results.status_counts()
+            print(
+                f"\nCall Results: {len(self.call_results)} tracked ("
+                + ", ".join(f"{status}: {count}" for status, count in sorted(counts.items())) + ")"
+            )
+        
+        if self.last_reconcile is not None:
+            report = self.last_reconcile
+            print(
+                f"\nLast Reconcile: {report.fetched} calls listed in {report.pages} pages, "
+                f"{report.updated} outcomes updated, {report.unresolved} unresolved"
+                f"{'' if report.complete else ' (paused; resumes from checkpoint)'}"
+            )
+        
+        if self.dial_pool is not None:
+            stats = self.dial_pool.stats
+            print(
+                f"\nDial pool: {self.dial_pool.workers} workers, {stats['completed']} calls done, "
+                f"{self.dial_pool.pending} in progress or queued (peak {stats['peak_pending']})"
+            )
+        
+        if self.http_client is not None:
+            stats = self.http_client.connection_stats()
+            print(
+                f"\nHTTP connections: {stats['requests']} requests, {stats['new_connections']} opened, "
+                f"{stats['reused_connections']} reused ({stats['reuse_ratio']:.0%})"
+            )
+        
+        if self.dispatcher is not None:
+            stats = self.dispatcher.stats
+            print(
+                f"\nDispatcher: {stats['dispatched']} calls dispatched, "
+                f"max lateness {stats['max_lateness'] * 1000:.1f} ms"
+            )
+            if isinstance(self.dispatcher, LeasingDispatcher):
+                print(
+                    f"Worker {self.dispatcher.worker_id}: {stats['claimed']} calls claimed, "
+                    f"{stats['lost_leases']} leases lost, "
+                    f"{self.scheduler.leased_count()} calls leased by all workers"
+                )
+        
         print("=" * 60 + "\n")
     
     def print_statistics(self):
@@ -350,27 +1074,198 @@ class AppointmentReminderApp:
         print(f"Total Calls Placed: {self.stats['calls_placed']}")
         print(f"Successful Calls: {self.stats['calls_succeeded']}")
         print(f"Failed Calls: {self.stats['calls_failed']}")
+        print(f"Retries Scheduled: {self.stats['calls_retried']}")
+        print(f"Held by Circuit Breaker: {self.stats['calls_held']}")
         print(f"Appointments Processed: {self.stats['appointments_processed']}")
         print("=" * 60 + "\n")
     
-    def run_interactive(self, excel_file: str):
+    def print_configuration(self):
+        """Print configuration, credential and cache status without contacting Twilio."""
+        env_config = self.config.get('env', {})
+        
+        print("\n" + "=" * 60)
+        print("APPOINTMENT REMINDER SYSTEM - CONFIGURATION")
+        print("=" * 60)
+        print(f"Config File: {self.config.config_path}")
+        for key in ('twilio_account_sid', 'twilio_auth_token', 'twilio_phone_number'):
+            print(f"  {key.upper()}: {'set' if env_config.get(key) else 'MISSING'}")
+        
+        print(f"Time Zone: {self.data_processor.timezone_name or 'system local time'}")
+        print(f"Reminder Hours Before: {self.config.get('scheduling.reminder_hours_before', 24)}")
+        print(f"Reminder Offsets (hours): {self.config.get('scheduling.reminder_offsets_hours') or 'not set'}")
+        print(f"Check Interval (minutes): {self.config.get('scheduling.check_interval_minutes', 60)}")
+        print(f"Call Immediately: {self.config.get('scheduling.call_immediately', False)}")
+        print(f"Incremental Sync: {self.config.get('scheduling.incremental_sync', False)}")
+        if self.async_calls:
+            print(f"Call Placement: async, up to {self.config.get('calling.max_concurrent_calls', 10)} at once")
+        elif self.dial_pool is not None:
+            print(f"Call Placement: {self.dial_pool.workers} dialing threads")
+        else:
+            print("Call Placement: one at a time")
+        if not self.async_calls:
+            print(
+                f"HTTP Pool: {self.config.get('calling.http_pool_size', 10)} connections, "
+                f"keep-alive {'on' if self.config.get('calling.http_keep_alive', True) else 'off'}"
+            )
+        threshold = self.config.get('calling.breaker_failure_threshold', 5)
+        if threshold:
+            print(
+                f"Circuit Breaker: opens after {threshold} failures, "
+                f"probes after {self.config.get('calling.breaker_reset_seconds', 30)}s"
+            )
+        else:
+            print("Circuit Breaker: disabled")
+        print(f"Status Callbacks: {self.config.get('callbacks.public_url') or 'disabled'}")
+        reconcile_interval = self.config.get('calling.reconcile_interval_minutes', 0)
+        print(f"Reconcile Outcomes: {f'every {reconcile_interval} minutes' if reconcile_interval else 'disabled'}")
+        if self.schedule_store == 'sqlite':
+            print(
+                f"Schedule Store: {self.scheduler.db_path} ({self.scheduler.count()} pending calls, "
+                f"{self.scheduler.leased_count()} leased)"
+            )
+        else:
+            print("Schedule Store: memory")
+        
+        cache = self.data_processor.cache
+        if cache is not None:
+            entries, size = cache.usage()
+            print(f"Parse Cache: {entries} entries, {size / 1e6:.1f} MB in {cache.cache_dir}")
+        else:
+            print("Parse Cache: disabled")
+        print(f"Phone Cache: {len(self.phone_normalizer)} numbers")
+        print("=" * 60 + "\n")
+    
+    def validate(self, patterns: List[str]) -> bool:
+        """Parse appointment files and report their contents without dialing.
+        
+        Args:
+            patterns: File paths or glob patterns
+        
+        Returns:
+            True if every file was read and no rows were rejected
+        """
+        from parallel_ingest import expand_sources
+        
+        chunk_size = self.config.get('data.chunk_size', 5000)
+        now = self.data_processor.now()
+        valid = True
+        
+        try:
+            sources = expand_sources(patterns)
+        except FileNotFoundError as e:
+            print(f"ERROR: {e}")
+            return False
+        
+        print("\n" + "=" * 60)
+        print("APPOINTMENT REMINDER SYSTEM - VALIDATION")
+        print("=" * 60)
+        
+        for source in sources:
+            parsed = 0
+            upcoming = 0
+            first = None
+            last = None
+            
+            try:
+                for chunk in self.data_processor.iter_appointments(source, chunk_size=chunk_size):
+                    parsed += len(chunk)
+                    for apt in chunk:
+                        when = apt.appointment_datetime
+                        if when > now:
+                            upcoming += 1
+                        first = when if first is None or when < first else first
+                        last = when if last is None or when > last else last
+            except Exception as e:
+                valid = False
+                print(f"{source}: ERROR {e}")
+                continue
+            
+            rejected = self.data_processor.last_rejected
+            valid = valid and not rejected
+            print(f"{source}: {parsed} valid, {rejected} rejected, {upcoming} upcoming")
+            if first is not None:
+                print(f"  Appointments: {first.strftime('%Y-%m-%d %H:%M')} to {last.strftime('%Y-%m-%d %H:%M')}")
+        
+        if not sources:
+            print("No appointment files found")
+            valid = False
+        
+        print("=" * 60 + "\n")
+        return valid
+    
+    def plan(self, patterns: List[str], limit: int = 20) -> int:
+        """Schedule appointments in memory and print the upcoming calls, without dialing.
+        
+        Args:
+            patterns: File paths or glob patterns
+            limit: Number of upcoming calls to list
+        
+        Returns:
+            Number of reminder calls that would be scheduled
+        """
+        # Plan against an in-memory scheduler so a durable store is left untouched
+        self.scheduler.close()
+        self.scheduler = Scheduler(
+            reminder_hours_before=self.config.get('scheduling.reminder_hours_before', 24),
+            reminder_offsets=self.config.get('scheduling.reminder_offsets_hours')
+        )
+        
+        single_file = self._single_file(patterns)
+        stream = self.load_appointments(single_file) if single_file else self.load_many(patterns)
+        message_template = self._message_template()
+        
+        scheduled_count = sum(
+            1 for apt in self._flatten(stream)
+            if self._schedule_one(apt, message_template, call_immediately=False)
+        )
+        self.logger.info(f"Planned {scheduled_count} reminder calls")
+        
+        self.print_status(limit=limit)
+        return scheduled_count
+    
+    def _single_file(self, patterns: List[str]) -> Optional[str]:
+        """Get the file to stream when patterns name one file (and one sheet)."""
+        if (
+            len(patterns) == 1
+            and not glob.has_magic(patterns[0])
+            and not self.config.get('data.all_sheets', False)
+        ):
+            return patterns[0]
+        return None
+    
+    def run_interactive(self, excel_file: Union[str, List[str]]):
         """Run application interactively with immediate processing.
         
         Args:
-            excel_file: Path to Excel file with appointments
+            excel_file: Path to appointment file (any supported format), or a
+                list of paths/glob patterns to ingest in parallel
         """
+        incremental = self.config.get('scheduling.incremental_sync', False)
+        
+        if isinstance(excel_file, list):
+            single_file = self._single_file(excel_file)
+            if single_file:
+                excel_file = single_file
+            elif incremental:
+                self.logger.warning("Incremental sync needs a single file; loading all files in full")
+                incremental = False
+        
         try:
-            # Load appointments
-            appointments = self.load_appointments(excel_file)
+            if isinstance(excel_file, list):
+                scheduled_count = self.schedule_appointments(self.load_many(excel_file))
+            elif incremental:
+                counts = self.sync_appointments(excel_file)
+                scheduled_count = counts['added']
+                last_mtime = os.path.getmtime(excel_file)
+            else:
+                # Stream appointments straight into the scheduler, chunk by chunk
+                scheduled_count = self.schedule_appointments(self.load_appointments(excel_file))
+            self.stats['appointments_processed'] = scheduled_count
             
-            if not appointments:
+            if not scheduled_count and not incremental and not self.scheduler.count():
                 self.logger.warning("No upcoming appointments found")
                 return
             
-            # Schedule them
-            scheduled_count = self.schedule_appointments(appointments)
-            self.stats['appointments_processed'] = scheduled_count
-            
             self.print_status()
             
             # Keep running to process calls as they become due
@@ -380,7 +1275,15 @@ class AppointmentReminderApp:
             try:
                 while True:
                     time.sleep(60)  # Check every minute
-                    self.process_due_calls()
+                    
+                    # Re-sync when the file changes on disk
+                    if incremental and os.path.getmtime(excel_file) != last_mtime:
+                        last_mtime = os.path.getmtime(excel_file)
+                        counts = self.sync_appointments(excel_file)
+                        self.stats['appointments_processed'] += counts['added']
+                    
+                    if self.dispatch_mode != 'event':
+                        self.process_due_calls()
             except KeyboardInterrupt:
                 self.logger.info("Received keyboard interrupt")
             
@@ -391,35 +1294,82 @@ class AppointmentReminderApp:
             self.stop()
 
 
-def main():
-    """Main entry point."""
+# Subcommands; validate, status and plan never import twilio or APScheduler
+COMMANDS = ('run', 'validate', 'status', 'plan')
+
+
+def main(argv: Optional[List[str]] = None):
+    """Main entry point.
+    
+    Args:
+        argv: Command line arguments (default: sys.argv[1:])
+    """
     import argparse
     
+    argv = sys.argv[1:] if argv is None else list(argv)
+    
+    # `app.py FILE...` without a subcommand keeps meaning `app.py run FILE...`
+    if not argv or (argv[0] not in COMMANDS and argv[0] not in ('-h', '--help')):
+        argv = ['run'] + argv
+    
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        '--config',
+        default='config/settings.yaml',
+        help='Path to configuration file'
+    )
+    files_help = (
+        'Appointment file(s) or glob patterns (.xlsx, .xls, .csv, .parquet, '
+        '.feather or .npz); several files are ingested in parallel'
+    )
+    
     parser = argparse.ArgumentParser(
         description="Appointment Reminder System - Automated reminder calls via Google Voice"
     )
-    parser.add_argument(
-        'excel_file',
-        nargs='?',
-        help='Path to Excel file with appointments'
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    
+    run_parser = subparsers.add_parser(
+        'run', parents=[common], help='Schedule reminders and place calls (default)'
     )
-    parser.add_argument(
-        '--config',
-        default='config/settings.yaml',
-        help='Path to configuration file'
+    run_parser.add_argument('excel_files', nargs='*', help=files_help)
+    
+    validate_parser = subparsers.add_parser(
+        'validate', parents=[common], help='Parse appointment files and report problems'
     )
+    validate_parser.add_argument('excel_files', nargs='+', help=files_help)
     
-    args = parser.parse_args()
+    plan_parser = subparsers.add_parser(
+        'plan', parents=[common], help='Show the reminder calls a run would schedule'
+    )
+    plan_parser.add_argument('excel_files', nargs='+', help=files_help)
+    plan_parser.add_argument(
+        '--limit', type=int, default=20, help='Number of upcoming calls to list'
+    )
+    
+    subparsers.add_parser(
+        'status', parents=[common], help='Show configuration, credential and cache status'
+    )
+    
+    args = parser.parse_args(argv)
     
     # Create app
     app = AppointmentReminderApp(config_path=args.config)
     
+    if args.command == 'validate':
+        sys.exit(0 if app.validate(args.excel_files) else 1)
+    if args.command == 'plan':
+        app.plan(args.excel_files, limit=args.limit)
+        return
+    if args.command == 'status':
+        app.print_configuration()
+        return
+    
     try:
         app.start()
         
         # If Excel file provided, process it
-        if args.excel_file:
-            app.run_interactive(args.excel_file)
+        if args.excel_files:
+            app.run_interactive(args.excel_files)
         else:
             # Just run the scheduler
             print("\nNo Excel file provided. Running scheduler only...")
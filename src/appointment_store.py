@@ -0,0 +1,225 @@
+"""
+Compact columnar storage for large appointment sets.
+Keeps appointments as parallel numpy arrays with a time index for window queries.
+"""
+
+import logging
+from datetime import datetime, timedelta, tzinfo
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from data_processor import Appointment
+
+logger = logging.getLogger(__name__)
+
+# Resolution of stored appointment times
+TIME_UNIT = 'datetime64[s]'
+
+
+class _StringPool:
+    """Interns repeated strings and stores them as integer codes."""
+    
+    def __init__(self):
+        self.values: List[str] = []
+        self._codes: Dict[str, int] = {}
+    
+    def code(self, value: str) -> int:
+        code = self._codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self._codes[value] = code
+            self.values.append(value)
+        return code
+    
+    def freeze(self) -> None:
+        """Drop the lookup table once no more strings will be added."""
+        self._codes = {}
+
+
+class AppointmentView:
+    """Read-only view of one appointment in an AppointmentStore."""
+    
+    __slots__ = ('_store', '_index')
+    
+    def __init__(self, store: 'AppointmentStore', index: int):
+        self._store = store
+        self._index = index
+    
+    @property
+    def name(self) -> str:
+        return self._store._strings.values[self._store._names[self._index]]
+    
+    @property
+    def phone_number(self) -> str:
+        return self._store._strings.values[self._store._phones[self._index]]
+    
+    @property
+    def email(self) -> str:
+        return self._store._strings.values[self._store._emails[self._index]]
+    
+    @property
+    def normalized_phone(self) -> Optional[str]:
+        code = self._store._normalized[self._index]
+        return self._store._strings.values[code] if code >= 0 else None
+    
+    @property
+    def dial_number(self) -> str:
+        return self.normalized_phone or self.phone_number
+    
+    @property
+    def appointment_datetime(self) -> datetime:
+        value = self._store._times[self._index].astype('datetime64[us]').item()
+        return value.replace(tzinfo=self._store.timezone)
+    
+    @property
+    def row_index(self) -> Optional[int]:
+        row = int(self._store._rows[self._index])
+        return row if row >= 0 else None
+    
+    def to_appointment(self) -> Appointment:
+        """Materialize a standalone Appointment object."""
+        return Appointment(
+            name=self.name,
+            phone_number=self.phone_number,
+            email=self.email,
+            appointment_datetime=self.appointment_datetime,
+            row_index=self.row_index,
+            normalized_phone=self.normalized_phone
+        )
+    
+    def __repr__(self) -> str:
+        return f"Appointment(name={self.name}, datetime={self.appointment_datetime})"
+
+
+class AppointmentStore:
+    """Columnar, time-indexed collection of appointments.
+    
+    Times are kept as wall-clock times in the appointments' time zone
+    (taken from the first time-zone-aware appointment, if any).
+    """
+    
+    def __init__(self, appointments: Iterable[Appointment] = ()):
+        """Build a store from appointments.
+        
+        Args:
+            appointments: Appointments to store (consumed once)
+        """
+        self.timezone: Optional[tzinfo] = None
+        self._strings = _StringPool()
+        names: List[int] = []
+        phones: List[int] = []
+        emails: List[int] = []
+        normalized: List[int] = []
+        times: List[datetime] = []
+        rows: List[int] = []
+        
+        code = self._strings.code
+        for apt in appointments:
+            names.append(code(apt.name))
+            phones.append(code(apt.phone_number))
+            emails.append(code(apt.email))
+            normalized_phone = getattr(apt, 'normalized_phone', None)
+            normalized.append(code(normalized_phone) if normalized_phone else -1)
+            when = apt.appointment_datetime
+            if when.tzinfo is not None:
+                self.timezone = self.timezone or when.tzinfo
+                when = when.astimezone(self.timezone).replace(tzinfo=None)
+            times.append(when)
+            rows.append(apt.row_index if apt.row_index is not None else -1)
+        
+        self._names = np.array(names, dtype=np.int32)
+        self._phones = np.array(phones, dtype=np.int32)
+        self._emails = np.array(emails, dtype=np.int32)
+        self._normalized = np.array(normalized, dtype=np.int32)
+        self._times = np.array(times, dtype=TIME_UNIT)
+        self._rows = np.array(rows, dtype=np.int32)
+        self._strings.freeze()
+        
+        # Permutation sorting appointments by time, and the sorted times for searchsorted
+        self._order = np.argsort(self._times, kind='stable')
+        self._sorted_times = self._times[self._order]
+        
+        logger.info(
+            f"Built appointment store with {len(self)} appointments "
+            f"({len(self._strings.values)} distinct strings)"
+        )
+    
+    def __len__(self) -> int:
+        return len(self._times)
+    
+    def __getitem__(self, index: int) -> AppointmentView:
+        if not -len(self) <= index < len(self):
+            raise IndexError("appointment index out of range")
+        return AppointmentView(self, index % len(self))
+    
+    def __iter__(self):
+        for index in range(len(self)):
+            yield AppointmentView(self, index)
+    
+    def indices_between(self, start: datetime, end: Optional[datetime] = None) -> np.ndarray:
+        """Get positions of appointments with start <= time < end, in time order.
+        
+        Args:
+            start: Window start (inclusive)
+            end: Window end (exclusive, None for no upper bound)
+        
+        Returns:
+            Array of appointment positions
+        """
+        lo = np.searchsorted(self._sorted_times, self._wall_time(start), side='left')
+        if end is None:
+            hi = len(self._sorted_times)
+        else:
+            hi = np.searchsorted(self._sorted_times, self._wall_time(end), side='left')
+        return self._order[lo:hi]
+    
+    def _wall_time(self, value: datetime) -> np.datetime64:
+        """Convert a query time to the store's wall-clock representation."""
+        if value.tzinfo is not None:
+            value = value.astimezone(self.timezone).replace(tzinfo=None)
+        return np.datetime64(value, 's')
+    
+    def between(self, start: datetime, end: Optional[datetime] = None) -> List[AppointmentView]:
+        """Get appointments with start <= time < end, in time order.
+        
+        Args:
+            start: Window start (inclusive)
+            end: Window end (exclusive, None for no upper bound)
+        
+        Returns:
+            List of appointment views
+        """
+        return [AppointmentView(self, int(index)) for index in self.indices_between(start, end)]
+    
+    def upcoming(
+        self,
+        hours_from_now: Optional[float] = None,
+        now: Optional[datetime] = None,
+        limit: Optional[int] = None
+    ) -> List[AppointmentView]:
+        """Get upcoming appointments, optionally within a time window.
+        
+        Args:
+            hours_from_now: How many hours ahead to look (None for no limit)
+            now: Reference time (default: now)
+            limit: Maximum number of appointments to return
+        
+        Returns:
+            List of appointment views, soonest first
+        """
+        now = (now or datetime.now(self.timezone)).replace(microsecond=0)
+        end = now + timedelta(hours=hours_from_now) if hours_from_now is not None else None
+        indices = self.indices_between(now, end)
+        if limit is not None:
+            indices = indices[:limit]
+        return [AppointmentView(self, int(index)) for index in indices]
+    
+    def nbytes(self) -> int:
+        """Approximate memory used by the store, including interned strings."""
+        arrays = (
+            self._names, self._phones, self._emails, self._normalized,
+            self._times, self._rows, self._order, self._sorted_times
+        )
+        strings = sum(len(value) + 49 for value in self._strings.values)
+        return sum(array.nbytes for array in arrays) + strings
@@ -0,0 +1,229 @@
+"""
+Concurrent call placement via the Twilio REST API.
+Places many reminder calls at once on asyncio instead of one blocking call at a time.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from call_results import CallResultStore
+from caller import Caller, CallResult
+from circuit_breaker import CircuitBreaker
+from phone_normalizer import PhoneNormalizer
+from rate_limiter import CallPacer
+
+from twilio.base.exceptions import TwilioRestException
+
+logger = logging.getLogger(__name__)
+
+TWILIO_API_BASE = "https://api.twilio.com"
+
+
+class AsyncCaller(Caller):
+    """Places calls through Twilio's REST API with asyncio, many at a time.
+    
+    Calls are created with a single non-blocking POST each; like Caller,
+    the result carries the status Twilio returns on creation (usually
+    'queued') and later progress arrives through status callbacks.
+    """
+    
+    def __init__(
+        self,
+        account_sid: str,
+        auth_token: str,
+        from_number: str,
+        max_retries: int = 3,
+        retry_delay: int = 300,
+        normalizer: Optional[PhoneNormalizer] = None,
+        pacer: Optional[CallPacer] = None,
+        max_retry_delay: int = 3600,
+        status_callback: Optional[str] = None,
+        results: Optional[CallResultStore] = None,
+        max_concurrency: int = 10,
+        api_base: str = TWILIO_API_BASE,
+        request_timeout: float = 30.0,
+        breaker: Optional[CircuitBreaker] = None
+    ):
+        """Initialize caller with Twilio credentials.
+        
+        Args:
+            account_sid: Twilio account SID
+            auth_token: Twilio auth token
+            from_number: Phone number to call from (Google Voice number)
+            max_retries: Maximum retry attempts for failed calls
+            retry_delay: Seconds before the first retry (doubled for each later one)
+            normalizer: Shared phone normalizer (a private one is created if None)
+            pacer: Paces call attempts per from_number (None for no pacing)
+            max_retry_delay: Longest wait between retries in seconds
+            status_callback: Public URL Twilio posts call progress to
+                (TwiMLServer's status endpoint); None for no callbacks
+            results: Store that placed calls are registered in, so status
+                callbacks can update their results
+            max_concurrency: Calls that may be in flight at once
+            api_base: Twilio REST API base URL (point at a fake server in benchmarks)
+            request_timeout: Seconds before a create request is abandoned
+            breaker: Stops calling a failing provider (None to always call)
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        
+        super().__init__(
+            account_sid=account_sid,
+            auth_token=auth_token,
+            from_number=from_number,
+            max_retries=max_retries,
+            retry_delay=retry_delay,
+            normalizer=normalizer,
+            pacer=pacer,
+            max_retry_delay=max_retry_delay,
+            status_callback=status_callback,
+            results=results,
+            breaker=breaker
+        )
+        
+        self.max_concurrency = max_concurrency
+        self.api_base = api_base.rstrip('/')
+        self.request_timeout = request_timeout
+        self.calls_url = f"{self.api_base}/2010-04-01/Accounts/{account_sid}/Calls.json"
+    
+    def _session(self):
+        """Open an HTTP session with at most max_concurrency connections."""
+        import aiohttp
+        
+        return aiohttp.ClientSession(
+            auth=aiohttp.BasicAuth(self.account_sid, self.auth_token),
+            timeout=aiohttp.ClientTimeout(total=self.request_timeout),
+            connector=aiohttp.TCPConnector(limit=self.max_concurrency)
+        )
+    
+    def _is_retryable(self, error: Exception) -> bool:
+        """Also treat dropped aiohttp connections as transient."""
+        import aiohttp
+        
+        return isinstance(error, aiohttp.ClientConnectionError) or super()._is_retryable(error)
+    
+    async def _create_call(self, session, to_number: str, twiml_url: str) -> Dict[str, Any]:
+        """POST one call to the Calls resource.
+        
+        Returns:
+            Call resource returned by Twilio
+        
+        Raises:
+            TwilioRestException: If Twilio rejects the request
+        """
+        form = {'To': to_number, 'From': self.from_number, 'Url': twiml_url, 'Method': 'GET'}
+        if self.status_callback:
+            form.update({'StatusCallback': self.status_callback, 'StatusCallbackMethod': 'POST'})
+        async with session.post(self.calls_url, data=form) as response:
+            try:
+                body = await response.json(content_type=None)
+            except ValueError:
+                body = {}
+            body = body if isinstance(body, dict) else {}
+            
+            if response.status >= 400:
+                raise TwilioRestException(
+                    status=response.status,
+                    uri=self.calls_url,
+                    msg=body.get('message', response.reason),
+                    code=body.get('code'),
+                    method='POST'
+                )
+            return body
+    
+    async def _place(
+        self,
+        session,
+        semaphore: asyncio.Semaphore,
+        to_number: str,
+        message: str,
+        retry: bool
+    ) -> CallResult:
+        """Make one attempt at a call, holding a concurrency slot only while it is in flight."""
+        to_number = self.normalize_phone_number(to_number)
+        
+        if not self._admit():
+            return self._rejected(to_number, retry)
+        
+        logger.info(f"Placing call to {to_number}")
+        logger.debug(f"Message: {message}")
+        
+        try:
+            # Create TwiML instructions for the call
+            twiml_url = self._generate_twiml_url(message)
+            
+            # Wait for a slot under the provider's calls-per-second limit
+            if self.pacer is not None:
+                wait = self.pacer.reserve(self.from_number)
+                if wait > 0:
+                    await asyncio.sleep(wait)
+            
+            async with semaphore:
+                call = await self._create_call(session, to_number, twiml_url)
+            
+            result = self._placed(call.get('sid'), call.get('status'), call.get('duration'))
+            self._record_outcome(None)
+            return result
+            
+        except Exception as e:
+            self._record_outcome(e)
+            return self._failure(to_number, e, retry)
+    
+    async def place_calls(
+        self,
+        calls: Iterable[Tuple[str, str]],
+        retry: bool = True
+    ) -> List[CallResult]:
+        """Place a batch of calls concurrently.
+        
+        At most max_concurrency create requests are in flight at once; the
+        pacer, if any, still spaces them per from_number.
+        
+        Args:
+            calls: (to_number, message) pairs
+            retry: Whether failed calls may be retried
+        
+        Returns:
+            CallResult objects in the same order as calls
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._session() as session:
+            return await asyncio.gather(*(
+                self._place(session, semaphore, to_number, message, retry)
+                for to_number, message in calls
+            ))
+    
+    def run_batch(
+        self,
+        calls: Iterable[Tuple[str, str]],
+        retry: bool = True
+    ) -> List[CallResult]:
+        """Place a batch of calls concurrently from synchronous code.
+        
+        Args:
+            calls: (to_number, message) pairs
+            retry: Whether failed calls may be retried
+        
+        Returns:
+            CallResult objects in the same order as calls
+        """
+        return asyncio.run(self.place_calls(calls, retry=retry))
+    
+    def place_call(
+        self,
+        to_number: str,
+        message: str,
+        retry: bool = True
+    ) -> CallResult:
+        """Place a single call in its own event loop and HTTP session.
+        
+        Args:
+            to_number: Phone number to call
+            message: Message to speak during the call
+            retry: Whether a failed call may be retried
+        
+        Returns:
+            CallResult object with call outcome
+        """
+        return self.run_batch([(to_number, message)], retry=retry)[0]
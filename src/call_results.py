@@ -0,0 +1,172 @@
+"""
+Store of call outcomes reported by Twilio status callbacks.
+Keeps the CallResult of each placed call by call ID and updates it in place as Twilio reports progress.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Tuple
+
+from caller import CallResult, FINAL_STATUSES
+
+logger = logging.getLogger(__name__)
+
+
+class CallResultStore:
+    """Thread-safe map of call ID to CallResult, bounded to the most recent calls."""
+    
+    def __init__(self, max_entries: int = 10000):
+        """Initialize result store.
+        
+        Args:
+            max_entries: Results kept before the oldest are forgotten
+        """
+        self.max_entries = max_entries
+        self._results: 'OrderedDict[str, CallResult]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._updated = threading.Condition(self._lock)
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._results)
+    
+    def _add(self, result: CallResult) -> None:
+        self._results[result.call_id] = result
+        while len(self._results) > self.max_entries:
+            self._results.popitem(last=False)
+    
+    def register(self, result: CallResult) -> None:
+        """Track a call that was just created.
+        
+        Args:
+            result: Result returned when the call was placed (needs a call_id)
+        """
+        if not result.call_id:
+            return
+        with self._lock:
+            # A callback may have beaten the create response here
+            reported = self._results.get(result.call_id)
+            if reported is not None and reported is not result:
+                result.status = reported.status
+                result.duration = reported.duration
+                result.error_code = reported.error_code
+            self._add(result)
+    
+    def get(self, call_id: str) -> Optional[CallResult]:
+        """Get the latest known result of a call.
+        
+        Args:
+            call_id: Call SID from Twilio
+        
+        Returns:
+            CallResult if the call is known, None otherwise
+        """
+        with self._lock:
+            return self._results.get(call_id)
+    
+    def update(
+        self,
+        call_id: str,
+        status: str,
+        duration: Optional[float] = None,
+        error_code: Optional[int] = None
+    ) -> CallResult:
+        """Apply a status callback to a call's result.
+        
+        Args:
+            call_id: Call SID from Twilio
+            status: Reported call status (ringing, in-progress, completed, busy, ...)
+            duration: Call duration in seconds, if reported
+            error_code: Twilio error code, if reported
+        
+        Note:
+            Callbacks can arrive out of order; a non-final status reported
+            after the call already reached a final one is ignored.
+        
+        Returns:
+            The updated CallResult (created if the call was not registered)
+        """
+        with self._updated:
+            result = self._results.get(call_id)
+            if result is None:
+                result = CallResult(success=True, call_id=call_id, status=status)
+                self._add(result)
+            elif result.final and status not in FINAL_STATUSES:
+                logger.debug(f"Ignoring late status {status} for call {call_id} ({result.status})")
+                return result
+            result.status = status
+            if duration is not None:
+                result.duration = duration
+            if error_code is not None:
+                result.error_code = error_code
+            self._updated.notify_all()
+        
+        logger.debug(f"Call {call_id} status: {status}")
+        return result
+    
+    def update_many(self, updates: Iterable[Tuple[str, str, Optional[float]]]) -> int:
+        """Apply many reported statuses at once (e.g. a page of reconciled calls).
+        
+        Unlike update(), calls that are not tracked are skipped. Non-final
+        statuses of calls that already reached a final one are ignored.
+        
+        Args:
+            updates: (call_id, status, duration) tuples
+        
+        Returns:
+            Number of tracked calls whose status or duration changed
+        """
+        changed = 0
+        with self._updated:
+            for call_id, status, duration in updates:
+                result = self._results.get(call_id)
+                if result is None or (result.final and status not in FINAL_STATUSES):
+                    continue
+                if result.status != status or (duration is not None and result.duration != duration):
+                    result.status = status
+                    if duration is not None:
+                        result.duration = duration
+                    changed += 1
+            if changed:
+                self._updated.notify_all()
+        
+        if changed:
+            logger.debug(f"Applied {changed} reconciled call statuses")
+        return changed
+    
+    def unfinished(self) -> Dict[str, CallResult]:
+        """Get tracked calls that have not reached a final status, by call ID."""
+        with self._lock:
+            return {
+                call_id: result for call_id, result in self._results.items()
+                if not result.final
+            }
+    
+    def wait(self, call_id: str, timeout: Optional[float] = None) -> Optional[CallResult]:
+        """Wait for a call to reach a final status.
+        
+        Args:
+            call_id: Call SID from Twilio
+            timeout: Seconds to wait (None to wait indefinitely)
+        
+        Returns:
+            The call's result, or None if it did not finish within the timeout
+        """
+        def finished():
+            result = self._results.get(call_id)
+            return result is not None and result.final
+        
+        with self._updated:
+            if self._updated.wait_for(finished, timeout):
+                return self._results[call_id]
+            return None
+    
+    def status_counts(self) -> Dict[str, int]:
+        """Count tracked calls by their latest status."""
+        with self._lock:
+            counts: Dict[str, int] = {}
+            for result in self._results.values():
+                status = result.status or 'unknown'
+                counts[status] = counts.get(status, 0) + 1
+            return counts
@@ -4,13 +4,21 @@ Provides abstraction for making reminder calls to taxpayers.
 """
 
 import logging
-import time
+import random
+import threading
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, Any, Optional
-import phonenumbers
-from phonenumbers import NumberParseException
+from typing import Dict, Any, Callable, Optional, TYPE_CHECKING
 import urllib.parse
 
+from phone_normalizer import PhoneNormalizer
+from rate_limiter import AdaptiveLimiter, CallPacer
+
+if TYPE_CHECKING:
+    from twilio.http import HttpClient
+    from call_results import CallResultStore
+    from circuit_breaker import CircuitBreaker
+
 try:
     from twilio.rest import Client as TwilioClient
     from twilio.base.exceptions import TwilioRestException
@@ -23,6 +31,80 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Call statuses after which Twilio reports nothing more
+FINAL_STATUSES = frozenset({'completed', 'busy', 'no-answer', 'failed', 'canceled'})
+
+# Shortest wait, in seconds, before a call held back by the circuit breaker goes out again
+MIN_REJECTED_DELAY = 5.0
+
+# Twilio error codes that fail the same way however often the call is retried
+PERMANENT_ERROR_CODES = frozenset({
+    13224,  # Invalid phone number
+    20003,  # Authentication failed
+    20404,  # Resource not found
+    21205,  # Invalid TwiML URL
+    21210,  # Caller phone number not verified
+    21211,  # Invalid 'To' phone number
+    21212,  # Invalid caller phone number
+    21214,  # 'To' number cannot be reached
+    21215,  # Geo permission not enabled for the called region
+    21216,  # Number blocked
+    21217,  # Phone number does not appear to be valid
+})
+
+# Twilio error codes worth retrying after a delay
+RETRYABLE_ERROR_CODES = frozenset({
+    20429,  # Too many requests
+    20500,  # Internal server error
+    20503,  # Service unavailable
+})
+
+
+def is_retryable(error: Exception) -> bool:
+    """Check whether a failed call attempt might succeed if placed again later.
+    
+    Args:
+        error: Exception raised while placing the call
+        
+    Returns:
+        True for throttling, provider outages and network failures; False
+        for errors about the call itself (bad number, credentials, ...)
+    """
+    if TWILIO_AVAILABLE and isinstance(error, TwilioRestException):
+        if error.code in PERMANENT_ERROR_CODES:
+            return False
+        if error.code in RETRYABLE_ERROR_CODES:
+            return True
+        return error.status == 429 or error.status >= 500
+    # Connection failures and timeouts (requests and aiohttp raise OSError subclasses)
+    return isinstance(error, OSError)
+
+
+@dataclass
+class RetryPolicy:
+    """Exponential backoff with jitter between attempts at a failed call."""
+    
+    max_retries: int = 3
+    base_delay: float = 300.0  # Seconds before the first retry, doubled for each one after
+    max_delay: float = 3600.0
+    jitter: float = 0.5  # Fraction of each delay that is randomized
+    
+    def delay(self, attempt: int, rng: Callable[[], float] = random.random) -> Optional[float]:
+        """Seconds to wait before the next retry of a call.
+        
+        Args:
+            attempt: Retries already made (ScheduledCall.attempt)
+            rng: Source of uniform random numbers in [0, 1)
+            
+        Returns:
+            Delay in seconds, or None once max_retries have been made
+        """
+        if attempt >= self.max_retries:
+            return None
+        delay = min(self.max_delay, self.base_delay * 2 ** attempt)
+        # Calls that failed together (e.g. during an outage) retry spread out
+        return delay * (1 - self.jitter * rng())
+
 
 class CallResult:
     """Represents the result of a call attempt."""
@@ -34,7 +116,11 @@ class CallResult:
         status: Optional[str] = None,
         duration: Optional[float] = None,
         error: Optional[str] = None,
-        timestamp: Optional[datetime] = None
+        timestamp: Optional[datetime] = None,
+        error_code: Optional[int] = None,
+        retryable: bool = False,
+        rejected: bool = False,
+        retry_in: Optional[float] = None
     ):
         """Initialize call result.
         
@@ -45,6 +131,11 @@ class CallResult:
             duration: Call duration in seconds
             error: Error message if call failed
             timestamp: When the call was placed
+            error_code: Twilio error code if call failed
+            retryable: Whether the failed call may be placed again later
+            rejected: Whether the call was held back by the circuit breaker
+                without reaching the provider (not an attempt)
+            retry_in: Seconds until a rejected call may go out again
         """
         self.success = success
         self.call_id = call_id
@@ -52,6 +143,17 @@ class CallResult:
         self.duration = duration
         self.error = error
         self.timestamp = timestamp or datetime.now()
+        self.error_code = error_code
+        self.retryable = retryable
+        self.rejected = rejected
+        self.retry_in = retry_in
+        # Set by the app when another attempt has been scheduled
+        self.retry_at: Optional[datetime] = None
+    
+    @property
+    def final(self) -> bool:
+        """Whether the call has reached a final status (see FINAL_STATUSES)."""
+        return self.status in FINAL_STATUSES
     
     def __repr__(self) -> str:
         return f"CallResult(success={self.success}, status={self.status})"
@@ -66,7 +168,15 @@ class Caller:
         auth_token: str,
         from_number: str,
         max_retries: int = 3,
-        retry_delay: int = 300
+        retry_delay: int = 300,
+        normalizer: Optional[PhoneNormalizer] = None,
+        pacer: Optional[CallPacer] = None,
+        max_retry_delay: int = 3600,
+        status_callback: Optional[str] = None,
+        results: Optional['CallResultStore'] = None,
+        http_client: Optional['HttpClient'] = None,
+        limiter: Optional[AdaptiveLimiter] = None,
+        breaker: Optional['CircuitBreaker'] = None
     ):
         """Initialize caller with Twilio credentials.
         
@@ -75,7 +185,18 @@ class Caller:
             auth_token: Twilio auth token
             from_number: Phone number to call from (Google Voice number)
             max_retries: Maximum retry attempts for failed calls
-            retry_delay: Seconds to wait between retries
+            retry_delay: Seconds before the first retry (doubled for each later one)
+            normalizer: Shared phone normalizer (a private one is created if None)
+            pacer: Paces call attempts per from_number (None for no pacing)
+            max_retry_delay: Longest wait between retries in seconds
+            status_callback: Public URL Twilio posts call progress to
+                (TwiMLServer's status endpoint); None for no callbacks
+            results: Store that placed calls are registered in, so status
+                callbacks can update their results
+            http_client: Transport shared by every thread's Twilio client
+                (e.g. a PooledHttpClient); None gives each thread its own
+            limiter: Adapts the calls in flight to provider overload (None for no limit)
+            breaker: Stops calling a failing provider (None to always call)
         """
         if not TWILIO_AVAILABLE:
             raise ImportError("Twilio library not installed")
@@ -85,12 +206,30 @@ class Caller:
         self.from_number = from_number
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.retry_policy = RetryPolicy(max_retries, retry_delay, max_retry_delay)
+        self.normalizer = normalizer or PhoneNormalizer()
+        self.pacer = pacer
+        self.status_callback = status_callback
+        self.results = results
+        self.http_client = http_client
+        self.limiter = limiter
+        self.breaker = breaker
         
-        # Initialize Twilio client
-        self.client = TwilioClient(account_sid, auth_token)
+        # Each dialing thread gets its own Twilio client; they share
+        # http_client's connection pool when one is given
+        self._local = threading.local()
         
         logger.info(f"Initialized Twilio caller with number: {from_number}")
     
+    @property
+    def client(self) -> 'TwilioClient':
+        """Twilio client for the calling thread, created on its first call."""
+        client = getattr(self._local, 'client', None)
+        if client is None:
+            client = TwilioClient(self.account_sid, self.auth_token, http_client=self.http_client)
+            self._local.client = client
+        return client
+    
     def normalize_phone_number(self, phone_number: str) -> str:
         """Normalize phone number to E.164 format.
         
@@ -100,24 +239,8 @@ class Caller:
         Returns:
             Phone number in E.164 format (e.g., +1234567890)
         """
-        try:
-            # Try to parse as US number first
-            parsed = phonenumbers.parse(phone_number, "US")
-            if phonenumbers.is_valid_number(parsed):
-                return phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.E164)
-        except NumberParseException:
-            pass
-        
-        try:
-            # Try parsing without region
-            parsed = phonenumbers.parse(phone_number, None)
-            if phonenumbers.is_valid_number(parsed):
-                return phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.E164)
-        except NumberParseException:
-            pass
-        
-        logger.warning(f"Could not normalize phone number: {phone_number}")
-        return phone_number
+        # Numbers normalized at ingest are already E.164 and return immediately
+        return self.normalizer.normalize(phone_number)
     
     def place_call(
         self,
@@ -125,78 +248,158 @@ class Caller:
         message: str,
         retry: bool = True
     ) -> CallResult:
-        """Place a call to the specified number with the given message.
+        """Make one attempt at calling the specified number with the given message.
+        
+        Returns as soon as Twilio has accepted the call; its final status
+        and duration are filled in by status callbacks (see
+        status_callback). Failed attempts are not retried here (which
+        would hold up every other due call); the result says whether a
+        retry is worthwhile and the app schedules it using retry_policy.
         
         Args:
             to_number: Phone number to call
             message: Message to speak during the call
-            retry: Whether to retry on failure
+            retry: Whether a failed call may be retried
             
         Returns:
             CallResult object with call outcome
         """
         to_number = self.normalize_phone_number(to_number)
         
+        # Fail fast instead of waiting out timeouts on a provider that is down
+        if not self._admit():
+            return self._rejected(to_number, retry)
+        
         logger.info(f"Placing call to {to_number}")
         logger.debug(f"Message: {message}")
         
-        attempt = 0
-        last_error = None
-        
-        while attempt <= self.max_retries:
-            try:
-                # Create TwiML instructions for the call
-                twiml_url = self._generate_twiml_url(message)
-                
-                # Place the call
-                call = self.client.calls.create(
-                    to=to_number,
-                    from_=self.from_number,
-                    url=twiml_url,
-                    method='GET'
-                )
-                
-                # Wait a moment for call to be initiated
-                time.sleep(2)
-                
-                # Get call status
-                call = self.client.calls(call.sid).fetch()
-                
-                result = CallResult(
-                    success=True,
-                    call_id=call.sid,
-                    status=call.status,
-                    duration=float(call.duration) if call.duration else None
-                )
-                
-                logger.info(f"Call placed successfully: {call.sid}, status: {call.status}")
-                return result
-                
-            except TwilioRestException as e:
-                last_error = str(e)
-                logger.error(f"Twilio error on attempt {attempt + 1}: {e}")
-                
-                if attempt < self.max_retries and retry:
-                    logger.info(f"Retrying in {self.retry_delay} seconds...")
-                    time.sleep(self.retry_delay)
-                    attempt += 1
-                else:
-                    break
+        if self.limiter is not None:
+            self.limiter.acquire()
+        try:
+            # Create TwiML instructions for the call
+            twiml_url = self._generate_twiml_url(message)
+            
+            # Wait for a slot under the provider's calls-per-second limit
+            if self.pacer is not None:
+                self.pacer.acquire(self.from_number)
+            
+            # Place the call; later progress arrives at the status callback
+            options = {}
+            if self.status_callback:
+                options = {'status_callback': self.status_callback, 'status_callback_method': 'POST'}
+            call = self.client.calls.create(
+                to=to_number,
+                from_=self.from_number,
+                url=twiml_url,
+                method='GET',
+                **options
+            )
             
-            except Exception as e:
-                last_error = str(e)
-                logger.error(f"Unexpected error placing call: {e}")
-                break
+            result = self._placed(call.sid, call.status, call.duration)
+            self._record_outcome(None, limited=True)
+            return result
+            
+        except Exception as e:
+            self._record_outcome(e, limited=True)
+            return self._failure(to_number, e, retry)
+    
+    def _placed(self, call_id: str, status: str, duration: Any = None) -> CallResult:
+        """Build the result of a created call and register it for status callbacks.
         
-        # All attempts failed
+        Args:
+            call_id: Call SID from Twilio
+            status: Status in the create response (usually 'queued')
+            duration: Duration in the create response, if any
+            
+        Returns:
+            Successful CallResult, updated in place by later callbacks
+        """
         result = CallResult(
-            success=False,
-            error=last_error or "Unknown error"
+            success=True,
+            call_id=call_id,
+            status=status,
+            duration=float(duration) if duration else None
         )
+        if self.results is not None:
+            self.results.register(result)
         
-        logger.error(f"Failed to place call to {to_number} after {attempt + 1} attempts")
+        logger.info(f"Call placed successfully: {call_id}, status: {status}")
         return result
     
+    def _is_retryable(self, error: Exception) -> bool:
+        """Classify an error raised while placing a call (see is_retryable)."""
+        return is_retryable(error)
+    
+    def _admit(self) -> bool:
+        """Ask the circuit breaker whether a call may go out now."""
+        return self.breaker is None or self.breaker.allow()
+    
+    def _record_outcome(self, error: Optional[Exception], limited: bool = False) -> None:
+        """Feed the outcome of an admitted attempt to the breaker and limiter.
+        
+        Throttling, provider errors and network failures (the errors worth
+        retrying) count against the provider; errors about the call itself
+        do not.
+        
+        Args:
+            error: Exception raised while placing the call (None if placed)
+            limited: Whether the attempt holds a limiter slot to release
+        """
+        overloaded = error is not None and self._is_retryable(error)
+        if limited and self.limiter is not None:
+            self.limiter.release(overloaded)
+        if self.breaker is not None:
+            if overloaded:
+                self.breaker.record_failure()
+            else:
+                self.breaker.record_success()
+    
+    def _rejected(self, to_number: str, retry: bool) -> CallResult:
+        """Build the result of a call skipped because the circuit breaker is open.
+        
+        retry_in is the time until the breaker's next probe, at least
+        MIN_REJECTED_DELAY so calls held back while a probe is in flight
+        do not come straight back.
+        """
+        logger.warning(f"Circuit breaker open; not calling {to_number}")
+        return CallResult(
+            success=False,
+            error="Circuit breaker open: provider unavailable",
+            retryable=retry,
+            rejected=True,
+            retry_in=max(self.breaker.snapshot()['retry_in'], MIN_REJECTED_DELAY)
+        )
+    
+    def _failure(self, to_number: str, error: Exception, retry: bool) -> CallResult:
+        """Build the result of a failed attempt, classifying the error.
+        
+        Args:
+            to_number: Number that was called
+            error: Exception raised while placing the call
+            retry: Whether the call may be retried at all
+            
+        Returns:
+            Unsuccessful CallResult
+        """
+        retryable = retry and self._is_retryable(error)
+        if TWILIO_AVAILABLE and isinstance(error, TwilioRestException):
+            error_code = error.code
+            logger.error(f"Twilio error calling {to_number}: {error}")
+        else:
+            error_code = None
+            logger.error(f"Unexpected error placing call to {to_number}: {error!r}")
+            
+        logger.error(
+            f"Failed to place call to {to_number}"
+            f"{' (retryable)' if retryable else ''}"
+        )
+        return CallResult(
+            success=False,
+            error=str(error) or type(error).__name__,
+            error_code=error_code,
+            retryable=retryable
+        )
+    
     def _generate_twiml_url(self, message: str) -> str:
         """Generate TwiML URL for text-to-speech.
         
@@ -0,0 +1,131 @@
+"""
+Circuit breaker for calls to the telephony provider.
+Stops placing calls while the provider keeps failing, then lets a few probe calls through to see whether it has recovered.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict
+
+logger = logging.getLogger(__name__)
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half-open'
+
+
+class CircuitBreaker:
+    """Trips open after consecutive provider failures and closes again once a probe succeeds.
+    
+    Closed: every call is allowed. Open: calls are refused until
+    reset_timeout has passed. Half-open: up to half_open_calls probe calls
+    are allowed; the first success closes the breaker and a failure opens
+    it again.
+    """
+    
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        half_open_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """Initialize a closed circuit breaker.
+        
+        Args:
+            failure_threshold: Consecutive failures that open the breaker
+            reset_timeout: Seconds the breaker stays open before probing
+            half_open_calls: Probe calls allowed at once while half-open
+            clock: Monotonic time source in seconds
+        """
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        if reset_timeout <= 0:
+            raise ValueError("reset_timeout must be positive")
+        if half_open_calls < 1:
+            raise ValueError("half_open_calls must be at least 1")
+        
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.half_open_calls = half_open_calls
+        self.clock = clock
+        self.stats: Dict[str, int] = {'allowed': 0, 'rejected': 0, 'opened': 0}
+        
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+    
+    @property
+    def state(self) -> str:
+        """Current state: 'closed', 'open' or 'half-open'."""
+        with self._lock:
+            return self._current_state()
+    
+    def _current_state(self) -> str:
+        if self._state == OPEN and self.clock() - self._opened_at >= self.reset_timeout:
+            self._state = HALF_OPEN
+            self._probes = 0
+            logger.info("Circuit breaker half-open: probing the provider")
+        return self._state
+    
+    def allow(self) -> bool:
+        """Check whether a call may go out now.
+        
+        Every allowed call must be followed by record_success() or
+        record_failure().
+        
+        Returns:
+            True if the call may be placed, False to skip it
+        """
+        with self._lock:
+            state = self._current_state()
+            if state == OPEN or (state == HALF_OPEN and self._probes >= self.half_open_calls):
+                self.stats['rejected'] += 1
+                return False
+            if state == HALF_OPEN:
+                self._probes += 1
+            self.stats['allowed'] += 1
+            return True
+    
+    def record_success(self) -> None:
+        """Report that an allowed call reached the provider and was handled."""
+        with self._lock:
+            if self._state == OPEN:
+                # Sent before the breaker opened; wait for a probe instead
+                return
+            if self._state == HALF_OPEN:
+                logger.info("Circuit breaker closed: provider recovered")
+            self._state = CLOSED
+            self._failures = 0
+            self._probes = 0
+    
+    def record_failure(self) -> None:
+        """Report that an allowed call failed because of the provider."""
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or (
+                self._state == CLOSED and self._failures >= self.failure_threshold
+            ):
+                self._trip()
+    
+    def _trip(self) -> None:
+        self._state = OPEN
+        self._opened_at = self.clock()
+        self._probes = 0
+        self.stats['opened'] += 1
+        logger.warning(
+            f"Circuit breaker open after {self._failures} consecutive failures; "
+            f"pausing calls for {self.reset_timeout:.0f}s"
+        )
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Get state, consecutive failures, seconds until the next probe, and counters."""
+        with self._lock:
+            state = self._current_state()
+            retry_in = 0.0
+            if state == OPEN:
+                retry_in = max(self.reset_timeout - (self.clock() - self._opened_at), 0.0)
+            return dict(self.stats, state=state, failures=self._failures, retry_in=retry_in)
@@ -1,13 +1,23 @@
 """
 Data processor for reading and validating Excel appointment files.
+Also reads the same columns from CSV and columnar (Parquet/Feather/.npz) files.
 """
 
-import pandas as pd
-from datetime import datetime
+import csv
+import itertools
+from collections import OrderedDict
+from datetime import datetime, date, timedelta
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Iterator, TYPE_CHECKING
+from zoneinfo import ZoneInfo
 import logging
 
+# pandas/numpy are imported where needed so CSV and cached loads start fast
+if TYPE_CHECKING:
+    import pandas as pd
+
+from parse_cache import CacheEntryWriter, ParseCache
+
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +31,8 @@ class Appointment:
         phone_number: str,
         email: str,
         appointment_datetime: datetime,
-        row_index: Optional[int] = None
+        row_index: Optional[int] = None,
+        normalized_phone: Optional[str] = None
     ):
         """Initialize appointment.
         
@@ -31,17 +42,62 @@ class Appointment:
             email: Contact email address
             appointment_datetime: Date and time of appointment
             row_index: Original row number in Excel file (for tracking)
+            normalized_phone: phone_number in E.164 format, once normalized
         """
         self.name = name
         self.phone_number = phone_number
         self.email = email
         self.appointment_datetime = appointment_datetime
         self.row_index = row_index
+        self.normalized_phone = normalized_phone
+    
+    @property
+    def dial_number(self) -> str:
+        """Number to dial: the normalized number if available, else the raw one."""
+        return self.normalized_phone or self.phone_number
     
     def __repr__(self) -> str:
         return f"Appointment(name={self.name}, datetime={self.appointment_datetime})"
 
 
+# Columns treated as free text (trimmed and checked for blanks)
+TEXT_COLUMNS = ['name', 'phone_number', 'email']
+
+# Columns used to build an Appointment, in the order readers yield them
+APPOINTMENT_FIELDS = TEXT_COLUMNS + ['appointment_date']
+
+# File extensions accepted by iter_appointments, mapped to reader method names
+READERS = {
+    '.xlsx': '_iter_xlsx_rows',
+    '.xlsm': '_iter_xlsx_rows',
+    '.xls': '_iter_frame_rows',
+    '.csv': '_iter_csv_rows',
+    '.parquet': '_iter_arrow_rows',
+    '.feather': '_iter_arrow_rows',
+    '.npz': '_iter_npz_rows',
+}
+
+# Rows pulled from a columnar file per batch
+COLUMNAR_BATCH_SIZE = 65536
+
+# Formats tried (after the configured ones) when inferring a date column's format
+DATE_FORMAT_CANDIDATES = [
+    "%Y-%m-%d %H:%M",
+    "%m/%d/%Y %H:%M",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%dT%H:%M",
+    "%m/%d/%Y %I:%M %p",
+    "%m/%d/%Y %H:%M:%S",
+    "%m/%d/%y %H:%M",
+    "%m/%d/%y %I:%M %p",
+    "%Y/%m/%d %H:%M",
+]
+
+# Number of date strings sampled to infer a column's format
+DATE_SAMPLE_SIZE = 200
+
+
 class DataProcessor:
     """Processes Excel files containing appointment data."""
     
@@ -49,7 +105,12 @@ class DataProcessor:
         self,
         required_columns: Optional[List[str]] = None,
         date_format: str = "%Y-%m-%d %H:%M",
-        fallback_date_format: str = "%m/%d/%Y %H:%M"
+        fallback_date_format: str = "%m/%d/%Y %H:%M",
+        vectorized: bool = False,
+        cache: Optional[ParseCache] = None,
+        cache_max_rows: int = 1000000,
+        date_cache_size: int = 65536,
+        timezone: Optional[str] = None
     ):
         """Initialize data processor.
         
@@ -57,12 +118,48 @@ class DataProcessor:
             required_columns: List of required column names
             date_format: Expected date format in Excel
             fallback_date_format: Alternative date format to try
+            vectorized: Parse whole columns at once instead of row by row
+            cache: Parse cache for iter_appointments (None to disable)
+            cache_max_rows: Files with more valid rows than this are not cached
+            date_cache_size: Maximum number of memoized date strings
+            timezone: IANA zone that appointment times are in (e.g.
+                "America/New_York"); None keeps them naive (system local time)
         """
         self.required_columns = required_columns or [
             'name', 'phone_number', 'email', 'appointment_date'
         ]
         self.date_format = date_format
         self.fallback_date_format = fallback_date_format
+        self.vectorized = vectorized
+        self.cache = cache
+        self.cache_max_rows = cache_max_rows
+        self.timezone_name = timezone
+        self.timezone = ZoneInfo(timezone) if timezone else None
+        
+        # Date parsing: format inferred for the current column, bounded
+        # string -> datetime memo, and counters of which path each value took
+        self.column_date_format: Optional[str] = None
+        self.date_cache_size = date_cache_size
+        self._date_memo: "OrderedDict[str, Optional[datetime]]" = OrderedDict()
+        self.date_stats: Dict[str, int] = {}
+        self.reset_date_stats()
+    
+        # Rows rejected by the most recent iter_appointments() pass
+        self.last_rejected = 0
+    
+    def now(self) -> datetime:
+        """Current time in the appointments' time zone (naive local time if none is set)."""
+        return datetime.now(self.timezone)
+    
+    def _localize(self, value: datetime) -> datetime:
+        """Attach the configured time zone to a naive wall-clock time.
+        
+        Ambiguous times (when clocks fall back) resolve to the first
+        occurrence, as zoneinfo does by default.
+        """
+        if self.timezone is None or value.tzinfo is not None:
+            return value
+        return value.replace(tzinfo=self.timezone)
     
     def read_excel(self, file_path: str, sheet_name: Optional[str] = None) -> List[Appointment]:
         """Read appointments from Excel file.
@@ -78,6 +175,12 @@ class DataProcessor:
             FileNotFoundError: If file doesn't exist
             ValueError: If required columns are missing or data is invalid
         """
+        import pandas as pd
+        
+        if self.vectorized:
+            appointments, _ = self.read_excel_columnar(file_path, sheet_name)
+            return appointments
+        
         file_path = Path(file_path)
         
         if not file_path.exists():
@@ -106,6 +209,8 @@ class DataProcessor:
             if missing_columns:
                 raise ValueError(f"Missing required columns: {missing_columns}")
             
+            self.infer_date_format(df['appointment_date'].head(DATE_SAMPLE_SIZE).tolist())
+            
             # Process each row
             appointments = []
             for idx, row in df.iterrows():
@@ -117,6 +222,7 @@ class DataProcessor:
                     logger.warning(f"Error parsing row {idx + 2}: {e}")
                     continue
             
+            self.log_date_stats()
             logger.info(f"Successfully parsed {len(appointments)} appointments")
             return appointments
             
@@ -124,7 +230,751 @@ class DataProcessor:
             logger.error(f"Error reading Excel file: {e}")
             raise
     
-    def _parse_row(self, row: pd.Series, row_index: int) -> Optional[Appointment]:
+    def read_excel_columnar(
+        self,
+        file_path: str,
+        sheet_name: Optional[str] = None
+    ) -> Tuple[List[Appointment], 'pd.Series']:
+        """Read appointments from Excel file using whole-column operations.
+        
+        Only the required columns are loaded, text columns are read as
+        strings, and dates are parsed in one pass per configured format.
+        
+        Args:
+            file_path: Path to Excel file
+            sheet_name: Name of sheet to read (None for first sheet)
+            
+        Returns:
+            Tuple of (appointments, rejected mask indexed by Excel row number)
+            
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ValueError: If required columns are missing
+        """
+        import pandas as pd
+        
+        file_path = Path(file_path)
+        
+        if not file_path.exists():
+            raise FileNotFoundError(f"Excel file not found: {file_path}")
+        
+        logger.info(f"Reading Excel file (columnar): {file_path}")
+        
+        try:
+            # pd.read_excel(sheet_name=None) means "all sheets"; we want the first
+            sheet = 0 if sheet_name is None else sheet_name
+            
+            # Read the header once so usecols/dtype can refer to the raw names
+            header = pd.read_excel(file_path, sheet_name=sheet, nrows=0)
+            wanted = {
+                str(col): str(col).lower().strip()
+                for col in header.columns
+                if str(col).lower().strip() in self.required_columns
+            }
+            
+            missing_columns = [
+                col for col in self.required_columns if col not in wanted.values()
+            ]
+            if missing_columns:
+                raise ValueError(f"Missing required columns: {missing_columns}")
+            
+            dtype = {raw: str for raw, norm in wanted.items() if norm in TEXT_COLUMNS}
+            df = pd.read_excel(
+                file_path,
+                sheet_name=sheet,
+                usecols=list(wanted),
+                dtype=dtype
+            )
+            df = df.rename(columns=wanted)
+            logger.info(f"Loaded {len(df)} rows from Excel file")
+            
+            return self.parse_frame(df)
+            
+        except Exception as e:
+            logger.error(f"Error reading Excel file: {e}")
+            raise
+    
+    def parse_frame(self, df: 'pd.DataFrame') -> Tuple[List[Appointment], 'pd.Series']:
+        """Validate a DataFrame of appointments column by column.
+        
+        Args:
+            df: DataFrame with normalized (lowercase) required columns
+            
+        Returns:
+            Tuple of (appointments, rejected mask indexed by Excel row number)
+        """
+        import pandas as pd
+        
+        valid = pd.Series(True, index=df.index)
+        text = {}
+        
+        for col in TEXT_COLUMNS:
+            values = df[col].astype('string').str.strip()
+            valid &= values.notna() & (values != '')
+            text[col] = values
+        
+        dates = self._parse_datetime_column(df['appointment_date'])
+        valid &= dates.notna()
+        
+        kept = valid.to_numpy()
+        row_numbers = df.index[kept] + 2  # +2 for Excel row number (header + 0-index)
+        
+        appointments = [
+            Appointment(
+                name=name,
+                phone_number=phone_number,
+                email=email,
+                appointment_datetime=self._localize(appointment_datetime),
+                row_index=int(row_index)
+            )
+            for name, phone_number, email, appointment_datetime, row_index in zip(
+                text['name'][kept].tolist(),
+                text['phone_number'][kept].tolist(),
+                text['email'][kept].tolist(),
+                list(dates[kept].dt.to_pydatetime()),
+                row_numbers
+            )
+        ]
+        
+        rejected = pd.Series(~kept, index=df.index + 2, name='rejected')
+        rejected_count = int(rejected.sum())
+        if rejected_count:
+            sample = rejected.index[rejected.to_numpy()][:10].tolist()
+            logger.warning(f"Rejected {rejected_count} rows (first rows: {sample})")
+        
+        logger.info(f"Successfully parsed {len(appointments)} appointments")
+        return appointments, rejected
+    
+    def _parse_datetime_column(self, values: 'pd.Series') -> 'pd.Series':
+        """Parse a column of appointment dates.
+        
+        Tries the column's inferred format on the whole column, then the
+        remaining configured format(s) and finally the flexible parser on
+        the rows still unparsed.
+        
+        Args:
+            values: Raw appointment_date column
+            
+        Returns:
+            datetime64 Series with NaT where parsing failed
+        """
+        import pandas as pd
+        
+        column_format = self.infer_date_format(values.head(DATE_SAMPLE_SIZE).tolist())
+        is_text = values.map(lambda value: isinstance(value, str))
+        self.date_stats['native'] += int((values.notna() & ~is_text).sum())
+        
+        parsed = pd.to_datetime(values, format=column_format, errors='coerce')
+        self.date_stats['column_format'] += int((parsed.notna() & is_text).sum())
+        
+        fallbacks = [
+            (fmt, 'fallback_format')
+            for fmt in dict.fromkeys([self.date_format, self.fallback_date_format])
+            if fmt != column_format
+        ] + [('mixed', 'flexible')]
+        
+        for fmt, counter in fallbacks:
+            failed = parsed.isna() & values.notna()
+            if not failed.any():
+                break
+            parsed[failed] = pd.to_datetime(values[failed], format=fmt, errors='coerce')
+            self.date_stats[counter] += int(parsed[failed].notna().sum())
+        
+        self.date_stats['failed'] += int((parsed.isna() & values.notna()).sum())
+        self.log_date_stats()
+        return parsed
+    
+    def infer_date_format(self, samples: List[Any]) -> str:
+        """Detect the date format used by a column from a sample of its values.
+        
+        The configured formats and DATE_FORMAT_CANDIDATES are tried against
+        the string samples; the one matching the most wins (configured
+        formats win ties). The result is stored as column_date_format and
+        used first by _parse_datetime.
+        
+        Args:
+            samples: Raw values from the appointment_date column
+            
+        Returns:
+            The detected format (date_format if nothing matches)
+        """
+        strings = [value.strip() for value in samples if isinstance(value, str) and value.strip()]
+        best_format = self.date_format
+        best_matches = 0
+        
+        if strings:
+            candidates = dict.fromkeys(
+                [self.date_format, self.fallback_date_format] + DATE_FORMAT_CANDIDATES
+            )
+            for fmt in candidates:
+                matches = 0
+                for value in strings:
+                    try:
+                        datetime.strptime(value, fmt)
+                        matches += 1
+                    except ValueError:
+                        pass
+                if matches > best_matches:
+                    best_format, best_matches = fmt, matches
+                    if matches == len(strings):
+                        break
+        
+        if best_format != self.column_date_format:
+            logger.info(
+                f"Using date format {best_format!r} for appointment_date "
+                f"({best_matches}/{len(strings)} sampled values matched)"
+            )
+            # Memoized results depend on the order formats are tried in
+            self._date_memo.clear()
+        self.column_date_format = best_format
+        return best_format
+    
+    def reset_date_stats(self) -> None:
+        """Reset the counters of date parsing paths."""
+        self.date_stats = {
+            'native': 0,          # Already a datetime in the source file
+            'memo_hits': 0,       # String seen before, answered from the memo
+            'column_format': 0,   # Parsed with the inferred column format
+            'fallback_format': 0, # Parsed with another configured format
+            'flexible': 0,        # Needed the permissive pandas parser
+            'failed': 0           # Could not be parsed at all
+        }
+    
+    def log_date_stats(self) -> None:
+        """Log how many date values took each parsing path, then reset the counters."""
+        stats = {key: count for key, count in self.date_stats.items() if count}
+        if stats:
+            logger.info(f"Date parsing paths: {stats}")
+            if self.date_stats['failed']:
+                logger.warning(f"{self.date_stats['failed']} appointment dates could not be parsed")
+        self.reset_date_stats()
+    
+    def iter_appointments(
+        self,
+        file_path: str,
+        chunk_size: int = 5000,
+        sheet_name: Optional[str] = None
+    ) -> Iterator[List[Appointment]]:
+        """Stream appointments from a file in fixed-size chunks.
+        
+        The reader is picked by file extension (see READERS). Workbooks use
+        openpyxl's read-only mode and CSV/columnar files are read
+        incrementally, so only the current chunk is held in memory.
+        
+        Args:
+            file_path: Path to appointment file
+            chunk_size: Maximum number of appointments per chunk
+            sheet_name: Name of sheet to read (workbooks only, None for first)
+            
+        Yields:
+            Lists of at most chunk_size Appointment objects
+            
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            ValueError: If the format is unsupported or columns are missing
+        """
+        file_path = Path(file_path)
+        
+        if not file_path.exists():
+            raise FileNotFoundError(f"Appointment file not found: {file_path}")
+        
+        reader = READERS.get(file_path.suffix.lower())
+        if reader is None:
+            raise ValueError(
+                f"Unsupported file type: {file_path.suffix} "
+                f"(expected one of {', '.join(READERS)})"
+            )
+        
+        logger.info(f"Streaming appointments from: {file_path}")
+        
+        cache_key = None
+        cached_path = None
+        if self.cache is not None:
+            cache_key = self.cache.key(file_path, self._cache_settings(sheet_name))
+            cached_path = self.cache.lookup(cache_key)
+        
+        # Parse statistics saved with the entry (rejected rows are not in it)
+        cached_stats: Dict[str, int] = {}
+        if cached_path is not None:
+            logger.info(f"Using cached parse of {file_path.name}")
+            rows = self._iter_cache_rows(cached_path, cached_stats)
+        else:
+            rows = getattr(self, reader)(file_path, sheet_name)
+            
+            # Detect the date column's format from the first rows, then replay them
+            sample = list(itertools.islice(rows, DATE_SAMPLE_SIZE))
+            self.infer_date_format([values[3] for _, values in sample])
+            rows = itertools.chain(sample, rows)
+        
+        # On a miss, each chunk is also appended to a new cache entry
+        entry = None
+        if cache_key is not None and cached_path is None:
+            try:
+                entry = self.cache.open_entry(cache_key)
+            except Exception as e:
+                logger.warning(f"Could not write parse cache for {file_path.name}: {e}")
+        
+        chunk: List[Appointment] = []
+        parsed = 0
+        rejected = 0
+        
+        try:
+            for row_index, values in rows:
+                appointment = self._build_appointment(values, row_index)
+                if appointment is None:
+                    rejected += 1
+                    continue
+                
+                chunk.append(appointment)
+                parsed += 1
+                if len(chunk) >= chunk_size:
+                    entry = self._cache_chunk(entry, chunk, file_path)
+                    yield chunk
+                    chunk = []
+            
+            if chunk:
+                entry = self._cache_chunk(entry, chunk, file_path)
+                yield chunk
+            
+            if cached_stats:
+                rejected += cached_stats.pop('rejected', 0)
+                self.date_stats = cached_stats
+            
+            # Only reached when the whole file was consumed
+            if entry is not None:
+                try:
+                    entry.commit({
+                        'rejected': rejected,
+                        'date_stat_names': list(self.date_stats),
+                        'date_stat_counts': list(self.date_stats.values())
+                    })
+                except Exception as e:
+                    logger.warning(f"Could not write parse cache for {file_path.name}: {e}")
+                    entry.abort()
+                entry = None
+        finally:
+            if entry is not None:
+                entry.abort()
+        
+        self.last_rejected = rejected
+        if rejected:
+            logger.warning(f"Rejected {rejected} rows while streaming {file_path.name}")
+        self.log_date_stats()
+        logger.info(f"Successfully streamed {parsed} appointments")
+        
+    def _cache_chunk(
+        self,
+        entry: Optional[CacheEntryWriter],
+        chunk: List[Appointment],
+        file_path: Path
+    ) -> Optional[CacheEntryWriter]:
+        """Append a chunk to the cache entry being written.
+        
+        Returns:
+            The entry, or None once it has been given up (too large or unwritable)
+        """
+        if entry is None:
+            return None
+        if entry.rows + len(chunk) > self.cache_max_rows:
+            logger.info(f"{file_path.name} is too large to cache")
+            entry.abort()
+            return None
+        try:
+            entry.add_chunk(self._appointment_columns(chunk))
+        except Exception as e:
+            logger.warning(f"Could not write parse cache for {file_path.name}: {e}")
+            entry.abort()
+            return None
+        return entry
+    
+    def read_many(
+        self,
+        patterns: List[str],
+        max_workers: Optional[int] = None
+    ) -> Tuple[List[Appointment], List[Any]]:
+        """Read every sheet of every file matching the given paths/globs in parallel.
+        
+        See parallel_ingest.read_many for details.
+        
+        Args:
+            patterns: File paths or glob patterns
+            max_workers: Worker processes (default: CPU count)
+            
+        Returns:
+            Tuple of (appointments in source/sheet/row order, per-task IngestReports)
+        """
+        from parallel_ingest import read_many
+        return read_many(self, patterns, max_workers=max_workers)
+    
+    def _cache_settings(self, sheet_name: Optional[str]) -> Dict[str, Any]:
+        """Settings that change parse results and so must be part of the cache key.
+        
+        Args:
+            sheet_name: Sheet being read
+            
+        Returns:
+            Dictionary of relevant settings
+        """
+        return {
+            'required_columns': list(self.required_columns),
+            'date_format': self.date_format,
+            'fallback_date_format': self.fallback_date_format,
+            'sheet_name': sheet_name,
+        }
+    
+    def _iter_xlsx_rows(
+        self,
+        file_path: Path,
+        sheet_name: Optional[str] = None
+    ) -> Iterator[Tuple[int, Tuple[Any, ...]]]:
+        """Yield (Excel row number, field values) from a worksheet.
+        
+        Args:
+            file_path: Path to Excel file
+            sheet_name: Name of sheet to read (None for first sheet)
+            
+        Yields:
+            Tuples of row number and values ordered as APPOINTMENT_FIELDS
+        """
+        from openpyxl import load_workbook
+        
+        workbook = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            sheet = workbook[sheet_name] if sheet_name else workbook.worksheets[0]
+            rows = sheet.iter_rows(values_only=True)
+            positions = self._column_positions(next(rows, None) or ())
+            
+            for offset, row in enumerate(rows):
+                yield offset + 2, tuple(
+                    row[pos] if pos < len(row) else None for pos in positions
+                )
+        finally:
+            workbook.close()
+    
+    def _iter_frame_rows(
+        self,
+        file_path: Path,
+        sheet_name: Optional[str] = None
+    ) -> Iterator[Tuple[int, Tuple[Any, ...]]]:
+        """Yield rows from a legacy .xls workbook via pandas.
+        
+        Args:
+            file_path: Path to Excel file
+            sheet_name: Name of sheet to read (None for first sheet)
+            
+        Yields:
+            Tuples of row number and values ordered as APPOINTMENT_FIELDS
+        """
+        import pandas as pd
+        
+        df = pd.read_excel(file_path, sheet_name=sheet_name or 0)
+        positions = self._column_positions(tuple(df.columns))
+        subset = df.iloc[:, positions].astype(object)
+        subset = subset.where(subset.notna(), None)
+        
+        for offset, values in enumerate(subset.itertuples(index=False, name=None)):
+            yield offset + 2, values
+    
+    def _iter_csv_rows(
+        self,
+        file_path: Path,
+        sheet_name: Optional[str] = None
+    ) -> Iterator[Tuple[int, Tuple[Any, ...]]]:
+        """Yield rows from a CSV file using the stdlib csv module.
+        
+        Args:
+            file_path: Path to CSV file
+            sheet_name: Ignored (CSV files have a single sheet)
+            
+        Yields:
+            Tuples of row number and values ordered as APPOINTMENT_FIELDS
+        """
+        with open(file_path, 'r', newline='', encoding='utf-8-sig') as f:
+            rows = csv.reader(f)
+            positions = self._column_positions(tuple(next(rows, None) or ()))
+            
+            for offset, row in enumerate(rows):
+                yield offset + 2, tuple(
+                    row[pos] if pos < len(row) else None for pos in positions
+                )
+    
+    def _iter_arrow_rows(
+        self,
+        file_path: Path,
+        sheet_name: Optional[str] = None
+    ) -> Iterator[Tuple[int, Tuple[Any, ...]]]:
+        """Yield rows from a Parquet or Feather file in record batches.
+        
+        Args:
+            file_path: Path to .parquet or .feather file
+            sheet_name: Ignored (columnar files have a single table)
+            
+        Yields:
+            Tuples of row number and values ordered as APPOINTMENT_FIELDS
+        """
+        try:
+            import pyarrow.feather as feather
+            import pyarrow.parquet as parquet
+        except ImportError:
+            raise ImportError(
+                f"pyarrow is required to read {file_path.suffix} files. "
+                "Install with: pip install pyarrow"
+            )
+        
+        if file_path.suffix.lower() == '.parquet':
+            source = parquet.ParquetFile(file_path)
+            names = source.schema_arrow.names
+            batches = source.iter_batches(batch_size=COLUMNAR_BATCH_SIZE)
+        else:
+            table = feather.read_table(file_path, memory_map=True)
+            names = table.column_names
+            batches = table.to_batches(max_chunksize=COLUMNAR_BATCH_SIZE)
+        
+        positions = self._column_positions(tuple(names))
+        row_position = names.index('row_index') if 'row_index' in names else None
+        offset = 0
+        
+        for batch in batches:
+            columns = [batch.column(pos).to_pylist() for pos in positions]
+            if row_position is not None:
+                row_numbers = batch.column(row_position).to_pylist()
+            else:
+                row_numbers = range(offset + 2, offset + 2 + batch.num_rows)
+            
+            yield from zip(row_numbers, zip(*columns))
+            offset += batch.num_rows
+    
+    def _iter_npz_rows(
+        self,
+        file_path: Path,
+        sheet_name: Optional[str] = None
+    ) -> Iterator[Tuple[int, Tuple[Any, ...]]]:
+        """Yield rows from a numpy .npz archive of column arrays.
+        
+        Args:
+            file_path: Path to .npz file written by write_appointments
+            sheet_name: Ignored (archives hold a single table)
+            
+        Yields:
+            Tuples of row number and values ordered as APPOINTMENT_FIELDS
+        """
+        import numpy as np
+        
+        with np.load(file_path, allow_pickle=False) as archive:
+            names = list(archive.files)
+            positions = self._column_positions(tuple(names))
+            arrays = [archive[names[pos]] for pos in positions]
+            row_numbers = archive['row_index'] if 'row_index' in names else None
+        
+        total = len(arrays[0])
+        for start in range(0, total, COLUMNAR_BATCH_SIZE):
+            stop = start + COLUMNAR_BATCH_SIZE
+            columns = [
+                array[start:stop].astype('datetime64[us]').tolist()
+                if array.dtype.kind == 'M' else array[start:stop].tolist()
+                for array in arrays
+            ]
+            if row_numbers is not None:
+                rows = row_numbers[start:stop].tolist()
+            else:
+                rows = range(start + 2, start + 2 + len(columns[0]))
+            
+            yield from zip(rows, zip(*columns))
+    
+    def _iter_cache_rows(
+        self,
+        file_path: Path,
+        stats: Dict[str, int]
+    ) -> Iterator[Tuple[int, Tuple[Any, ...]]]:
+        """Yield rows from a parse cache entry one stored chunk at a time.
+        
+        Args:
+            file_path: Entry written through ParseCache.open_entry
+            stats: Filled with the rejected-row count and date parsing
+                counters of the original parse
+            
+        Yields:
+            Tuples of row number and values ordered as APPOINTMENT_FIELDS
+        """
+        import numpy as np
+        
+        with np.load(file_path, allow_pickle=False) as archive:
+            stats['rejected'] = int(archive['rejected'])
+            stats.update(zip(
+                archive['date_stat_names'].tolist(),
+                archive['date_stat_counts'].tolist()
+            ))
+            
+            for index in range(int(archive['chunks'])):
+                arrays = [archive[f"{field}.{index}"] for field in APPOINTMENT_FIELDS]
+                columns = [
+                    array.astype('datetime64[us]').tolist()
+                    if array.dtype.kind == 'M' else array.tolist()
+                    for array in arrays
+                ]
+                yield from zip(archive[f"row_index.{index}"].tolist(), zip(*columns))
+    
+    def _appointment_columns(self, appointments: List[Appointment]) -> Dict[str, Any]:
+        """Convert appointments to numpy column arrays (wall-clock times, no zone).
+        
+        Args:
+            appointments: Appointments to convert
+            
+        Returns:
+            Arrays for APPOINTMENT_FIELDS plus row_index
+        """
+        import numpy as np
+        
+        return {
+            'name': np.array([apt.name for apt in appointments], dtype=str),
+            'phone_number': np.array([apt.phone_number for apt in appointments], dtype=str),
+            'email': np.array([apt.email for apt in appointments], dtype=str),
+            'appointment_date': np.array(
+                [apt.appointment_datetime.replace(tzinfo=None) for apt in appointments],
+                dtype='datetime64[s]'
+            ),
+            'row_index': np.array(
+                [
+                    apt.row_index if apt.row_index is not None else position + 2
+                    for position, apt in enumerate(appointments)
+                ],
+                dtype=np.int64
+            ),
+        }
+    
+    def write_appointments(self, appointments: List[Appointment], file_path: str) -> Path:
+        """Write appointments to CSV or a columnar file.
+        
+        The format is picked by extension: .csv, .parquet/.feather
+        (requires pyarrow) or .npz. Files written here can be read back
+        with iter_appointments. Times are written as wall-clock times in
+        their own time zone.
+        
+        Args:
+            appointments: Appointments to write
+            file_path: Destination path
+            
+        Returns:
+            Path of the written file
+            
+        Raises:
+            ValueError: If the extension is not a writable format
+        """
+        file_path = Path(file_path)
+        suffix = file_path.suffix.lower()
+        
+        if suffix == '.csv':
+            with open(file_path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(APPOINTMENT_FIELDS)
+                writer.writerows(
+                    (apt.name, apt.phone_number, apt.email,
+                     apt.appointment_datetime.strftime(self.date_format))
+                    for apt in appointments
+                )
+            return file_path
+        
+        import numpy as np
+        
+        columns = self._appointment_columns(appointments)
+        
+        if suffix == '.npz':
+            with open(file_path, 'wb') as f:
+                np.savez(f, **columns)
+            return file_path
+        
+        if suffix in ('.parquet', '.feather'):
+            try:
+                import pyarrow as pa
+                import pyarrow.feather as feather
+                import pyarrow.parquet as parquet
+            except ImportError:
+                raise ImportError(
+                    f"pyarrow is required to write {suffix} files. "
+                    "Install with: pip install pyarrow"
+                )
+            
+            table = pa.table(columns)
+            if suffix == '.parquet':
+                parquet.write_table(table, file_path)
+            else:
+                feather.write_feather(table, file_path)
+            return file_path
+        
+        raise ValueError(f"Unsupported output file type: {file_path.suffix}")
+    
+    def _column_positions(self, header: Tuple[Any, ...]) -> List[int]:
+        """Map APPOINTMENT_FIELDS to positions in a header row.
+        
+        Args:
+            header: Raw header cell values
+            
+        Returns:
+            Column positions ordered as APPOINTMENT_FIELDS
+            
+        Raises:
+            ValueError: If required columns are missing
+        """
+        columns = [str(col).lower().strip() if col is not None else '' for col in header]
+        
+        missing_columns = [
+            col for col in dict.fromkeys(self.required_columns + APPOINTMENT_FIELDS)
+            if col not in columns
+        ]
+        if missing_columns:
+            raise ValueError(f"Missing required columns: {missing_columns}")
+        
+        return [columns.index(field) for field in APPOINTMENT_FIELDS]
+    
+    def _build_appointment(
+        self,
+        values: Tuple[Any, ...],
+        row_index: int
+    ) -> Optional[Appointment]:
+        """Validate raw field values and build an Appointment.
+        
+        Args:
+            values: Raw values ordered as APPOINTMENT_FIELDS
+            row_index: Original row number in the source file
+            
+        Returns:
+            Appointment object or None if the row is blank or invalid
+        """
+        if all(value is None or value == '' for value in values):
+            return None
+        
+        name, phone_number, email = (
+            str(value).strip() if value is not None else '' for value in values[:3]
+        )
+        if not all([name, phone_number, email]):
+            logger.debug(f"Row {row_index}: Missing required fields")
+            return None
+        
+        raw_date = values[3]
+        if isinstance(raw_date, datetime):
+            appointment_datetime = raw_date
+            self.date_stats['native'] += 1
+        elif isinstance(raw_date, date):
+            appointment_datetime = datetime.combine(raw_date, datetime.min.time())
+            self.date_stats['native'] += 1
+        elif raw_date is None:
+            appointment_datetime = None
+        else:
+            appointment_datetime = self._parse_datetime(raw_date, row_index)
+        
+        if appointment_datetime is None:
+            logger.debug(f"Row {row_index}: Could not parse appointment date")
+            return None
+        
+        return Appointment(
+            name=name,
+            phone_number=phone_number,
+            email=email,
+            appointment_datetime=self._localize(appointment_datetime),
+            row_index=row_index
+        )
+    
+    def _parse_row(self, row: 'pd.Series', row_index: int) -> Optional[Appointment]:
         """Parse a single row into an Appointment object.
         
         Args:
@@ -149,14 +999,14 @@ class DataProcessor:
                 return None
             
             if appointment_datetime is None:
-                logger.warning(f"Row {row_index}: Could not parse appointment date")
+                logger.debug(f"Row {row_index}: Could not parse appointment date")
                 return None
             
             return Appointment(
                 name=name,
                 phone_number=phone_number,
                 email=email,
-                appointment_datetime=appointment_datetime,
+                appointment_datetime=self._localize(appointment_datetime),
                 row_index=row_index
             )
             
@@ -176,11 +1026,16 @@ class DataProcessor:
         """
         # If already a datetime object
         if isinstance(value, datetime):
+            self.date_stats['native'] += 1
             return value
         
-        # If it's a pandas Timestamp
-        if pd.notna(value) and hasattr(value, 'to_pydatetime'):
-            return value.to_pydatetime()
+        # If it's a pandas Timestamp (NaT falls through and fails below)
+        if hasattr(value, 'to_pydatetime'):
+            import pandas as pd
+            
+            if pd.notna(value):
+                self.date_stats['native'] += 1
+                return value.to_pydatetime()
         
         # Convert to string and try parsing
         value_str = str(value).strip()
@@ -188,51 +1043,102 @@ class DataProcessor:
         if not value_str or value_str.lower() in ['nan', 'none', '']:
             return None
         
-        # Try primary format
-        try:
-            return datetime.strptime(value_str, self.date_format)
-        except ValueError:
-            pass
+        # Most rows repeat timestamps seen earlier in the file
+        if value_str in self._date_memo:
+            self._date_memo.move_to_end(value_str)
+            self.date_stats['memo_hits'] += 1
+            result = self._date_memo[value_str]
+            if result is None:
+                # Repeats of a bad value still count towards the failure summary
+                self.date_stats['failed'] += 1
+                logger.debug(f"Row {row_index}: Could not parse datetime: {value_str}")
+            return result
+        
+        result = self._parse_datetime_string(value_str)
+        if result is None:
+            logger.debug(f"Row {row_index}: Could not parse datetime: {value_str}")
         
-        # Try fallback format
+        self._date_memo[value_str] = result
+        if len(self._date_memo) > self.date_cache_size:
+            self._date_memo.popitem(last=False)
+        
+        return result
+    
+    def _parse_datetime_string(self, value_str: str) -> Optional[datetime]:
+        """Parse a date string, trying the column format before slower options.
+        
+        Args:
+            value_str: Stripped, non-empty date string
+            
+        Returns:
+            Datetime object or None if parsing fails
+        """
+        column_format = self.column_date_format or self.date_format
+        
+        # Try the column's (inferred) format
         try:
-            return datetime.strptime(value_str, self.fallback_date_format)
+            result = datetime.strptime(value_str, column_format)
+            self.date_stats['column_format'] += 1
+            return result
         except ValueError:
             pass
         
+        # Try the configured formats
+        for fmt in (self.date_format, self.fallback_date_format):
+            if fmt == column_format:
+                continue
+            try:
+                result = datetime.strptime(value_str, fmt)
+                self.date_stats['fallback_format'] += 1
+                return result
+            except ValueError:
+                pass
+        
         # Try pandas to_datetime (very flexible)
+        import pandas as pd
+        
         try:
-            result = pd.to_datetime(value)
+            result = pd.to_datetime(value_str)
             if pd.notna(result):
+                self.date_stats['flexible'] += 1
                 return result.to_pydatetime()
         except Exception:
             pass
         
-        logger.warning(f"Row {row_index}: Could not parse datetime: {value_str}")
+        self.date_stats['failed'] += 1
         return None
     
     def get_upcoming_appointments(
         self,
         appointments: List[Appointment],
-        hours_from_now: float = 24
+        hours_from_now: Optional[float] = None
     ) -> List[Appointment]:
         """Filter appointments to only upcoming ones within specified time window.
         
+        For repeated window queries over large sets, build an
+        AppointmentStore and use its upcoming()/between() instead.
+        
         Args:
             appointments: List of all appointments
-            hours_from_now: How many hours ahead to look
+            hours_from_now: How many hours ahead to look (None for no limit)
             
         Returns:
             List of upcoming appointments
         """
-        now = datetime.now()
+        now = self.now()
         cutoff_time = now.replace(microsecond=0)
         
-        upcoming = [
-            apt for apt in appointments
-            if apt.appointment_datetime >= cutoff_time
-        ]
+        if hours_from_now is None:
+            upcoming = [
+                apt for apt in appointments
+                if apt.appointment_datetime >= cutoff_time
+            ]
+        else:
+            end_time = cutoff_time + timedelta(hours=hours_from_now)
+            upcoming = [
+                apt for apt in appointments
+                if cutoff_time <= apt.appointment_datetime < end_time
+            ]
         
         logger.info(f"Found {len(upcoming)} upcoming appointments out of {len(appointments)} total")
         return upcoming
-
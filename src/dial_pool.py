@@ -0,0 +1,167 @@
+"""
+Thread pool of dialing workers.
+Places reminder calls on several threads, with a bounded backlog of calls waiting for a worker.
+"""
+
+import itertools
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from scheduler import ScheduledCall
+
+logger = logging.getLogger(__name__)
+
+
+class DialPool:
+    """Runs a handler for each submitted call on a fixed pool of worker threads."""
+    
+    def __init__(
+        self,
+        handler: Callable[[ScheduledCall], Any],
+        workers: int = 4,
+        queue_size: int = 100
+    ):
+        """Initialize dial pool (threads are started on first use).
+        
+        Args:
+            handler: Places one call (the call is already off the scheduler)
+            workers: Calls dialed at the same time
+            queue_size: Calls that may wait for a free worker before submit() blocks
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if queue_size < 0:
+            raise ValueError("queue_size must not be negative")
+        
+        self.handler = handler
+        self.workers = workers
+        self.queue_size = queue_size
+        self.stats: Dict[str, int] = {'submitted': 0, 'completed': 0, 'errors': 0, 'peak_pending': 0}
+        
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='dialer')
+        # One slot per running or waiting call bounds the executor's unbounded queue
+        self._slots = threading.BoundedSemaphore(workers + queue_size)
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._pending = 0
+        self._closed = False
+        # Submitted calls no worker has started yet, with their handler, by ticket
+        self._waiting: Dict[int, Tuple[ScheduledCall, Callable[[ScheduledCall], Any]]] = {}
+        self._tickets = itertools.count()
+    
+    @property
+    def pending(self) -> int:
+        """Calls submitted but not yet finished."""
+        with self._lock:
+            return self._pending
+    
+    def submit(
+        self,
+        call: ScheduledCall,
+        timeout: Optional[float] = None,
+        handler: Optional[Callable[[ScheduledCall], Any]] = None
+    ) -> bool:
+        """Queue a call for dialing, blocking while the backlog is full.
+        
+        Args:
+            call: Call to place
+            timeout: Seconds to wait for room in the backlog (None to wait indefinitely)
+            handler: Runs instead of the pool's handler for this call
+        
+        Returns:
+            True if queued, False if the backlog stayed full for `timeout` seconds
+        
+        Raises:
+            RuntimeError: If the pool has been shut down
+        """
+        if self._closed:
+            raise RuntimeError("Dial pool is shut down")
+        if not self._slots.acquire(timeout=timeout):
+            return False
+        
+        with self._lock:
+            ticket = next(self._tickets)
+            self._waiting[ticket] = (call, handler or self.handler)
+            self._pending += 1
+            self.stats['submitted'] += 1
+            self.stats['peak_pending'] = max(self.stats['peak_pending'], self._pending)
+        
+        try:
+            self._executor.submit(self._run, ticket)
+        except RuntimeError:
+            with self._lock:
+                self._waiting.pop(ticket, None)
+            self._finish(error=True)
+            raise
+        return True
+    
+    def _run(self, ticket: int) -> None:
+        """Worker: place one call and free its slot."""
+        with self._lock:
+            waiting = self._waiting.pop(ticket, None)
+        if waiting is None:
+            # Handed back by shutdown() before a worker got to it
+            return
+        
+        call, handler = waiting
+        error = False
+        try:
+            handler(call)
+        except Exception as e:
+            error = True
+            logger.error(f"Error dialing {call.appointment_id}: {e}")
+        finally:
+            self._finish(error)
+    
+    def _finish(self, error: bool) -> None:
+        with self._idle:
+            self._pending -= 1
+            self.stats['completed'] += 1
+            if error:
+                self.stats['errors'] += 1
+            if not self._pending:
+                self._idle.notify_all()
+        self._slots.release()
+    
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every submitted call has finished.
+        
+        Args:
+            timeout: Seconds to wait (None to wait indefinitely)
+        
+        Returns:
+            True if the pool is idle
+        """
+        with self._idle:
+            return self._idle.wait_for(lambda: not self._pending, timeout)
+    
+    def shutdown(self, timeout: Optional[float] = None) -> List[ScheduledCall]:
+        """Stop accepting calls and finish the ones already submitted.
+        
+        Args:
+            timeout: Seconds to wait for queued and running calls (None to
+                wait indefinitely); calls still waiting for a worker after
+                that are not dialed
+        
+        Returns:
+            Calls that were not dialed, in the order they were submitted,
+            for the caller to put back on the schedule
+        """
+        self._closed = True
+        if self.drain(timeout):
+            self._executor.shutdown(wait=True)
+            logger.info(f"Dial pool drained ({self.stats['completed']} calls)")
+            return []
+        
+        with self._lock:
+            undialed = [call for call, _ in self._waiting.values()]
+            self._waiting.clear()
+            self._pending -= len(undialed)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        logger.warning(
+            f"Dial pool did not drain within the timeout: {len(undialed)} queued calls "
+            f"not dialed, {self.pending} still in progress"
+        )
+        return undialed
@@ -0,0 +1,344 @@
+"""
+Event-driven dispatch of scheduled calls.
+Sleeps until the earliest call time instead of polling the scheduler.
+"""
+
+import logging
+import threading
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Set, TYPE_CHECKING
+
+from scheduler import Scheduler, ScheduledCall
+
+if TYPE_CHECKING:
+    from dial_pool import DialPool
+    from sqlite_scheduler import SQLiteScheduler
+
+logger = logging.getLogger(__name__)
+
+
+class Dispatcher:
+    """Background thread that hands each scheduled call to a handler when it falls due.
+    
+    With a batch_handler, every call that is due when the thread wakes up
+    is handed over in one list instead, so a concurrent caller can place
+    them together.
+    """
+    
+    def __init__(
+        self,
+        scheduler: Scheduler,
+        handler: Callable[[ScheduledCall], Any],
+        max_wait: float = 300.0,
+        clock: Callable[[], datetime] = datetime.now,
+        batch_handler: Optional[Callable[[List[ScheduledCall]], Any]] = None
+    ):
+        """Initialize dispatcher.
+        
+        Args:
+            scheduler: Scheduler to take due calls from
+            handler: Called with each due call (already removed from the scheduler)
+            max_wait: Longest single sleep in seconds, so wall-clock changes
+                are noticed even when nothing new is scheduled
+            clock: Function returning the current time
+            batch_handler: Called instead of handler with all calls due at
+                once (None to hand over one call at a time)
+        """
+        self.scheduler = scheduler
+        self.handler = handler
+        self.batch_handler = batch_handler
+        self.max_wait = max_wait
+        self.clock = clock
+        self.stats: Dict[str, float] = {'dispatched': 0, 'max_lateness': 0.0, 'wakeups': 0}
+        # Calls may be dispatched from several dialing threads at once
+        self._stats_lock = threading.Lock()
+        
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def running(self) -> bool:
+        """Whether the dispatch thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+    
+    def start(self) -> None:
+        """Start the dispatch thread."""
+        if self.running:
+            return
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name='call-dispatcher', daemon=True)
+        self._thread.start()
+        logger.info("Dispatcher started")
+    
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the dispatch thread after any in-progress call finishes.
+        
+        Args:
+            timeout: Seconds to wait for the thread to exit (None to wait indefinitely)
+        """
+        if self._thread is None:
+            return
+        with self.scheduler.changed:
+            self._stopping = True
+            self.scheduler.changed.notify_all()
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            logger.warning("Dispatcher did not stop within the timeout")
+        else:
+            self._thread = None
+            logger.info("Dispatcher stopped")
+    
+    def _wait_for_due_calls(self) -> Optional[datetime]:
+        """Sleep until a call is due or stop() is called.
+        
+        Returns:
+            The current time once calls are due, or None when stopping
+        """
+        changed = self.scheduler.changed
+        with changed:
+            while not self._stopping:
+                now = self.clock()
+                next_time = self.scheduler.next_call_time()
+                # Compared as timestamps: call times may be in a configured time zone
+                remaining = next_time.timestamp() - now.timestamp() if next_time is not None else None
+                if remaining is not None and remaining <= 0:
+                    return now
+                
+                timeout = self.max_wait
+                if remaining is not None:
+                    timeout = min(timeout, remaining)
+                changed.wait(timeout)
+                self.stats['wakeups'] += 1
+        return None
+    
+    def _run(self) -> None:
+        """Dispatch loop; pops only the calls it hands over next so stop() never strands any."""
+        limit = None if self.batch_handler is not None else 1
+        while True:
+            now = self._wait_for_due_calls()
+            if now is None:
+                return
+            self._dispatch_many(self.scheduler.pop_due_calls(now, limit=limit))
+    
+    def _dispatch_many(self, calls: List[ScheduledCall]) -> None:
+        """Hand due calls to the batch handler, or one at a time to the handler."""
+        if self.batch_handler is None:
+            for call in calls:
+                self._dispatch(call)
+            return
+        if not calls:
+            return
+        
+        for call in calls:
+            self._record_dispatch(call)
+        try:
+            self.batch_handler(calls)
+        except Exception as e:
+            logger.error(f"Error dispatching batch of {len(calls)} calls: {e}")
+    
+    def _dispatch(self, call: ScheduledCall) -> None:
+        """Hand one due call to the handler."""
+        self._record_dispatch(call)
+        try:
+            self.handler(call)
+        except Exception as e:
+            logger.error(f"Error dispatching call for {call.name}: {e}")
+    
+    def _record_dispatch(self, call: ScheduledCall) -> None:
+        lateness = self.clock().timestamp() - call.call_time.timestamp()
+        with self._stats_lock:
+            self.stats['max_lateness'] = max(self.stats['max_lateness'], lateness)
+            self.stats['dispatched'] += 1
+        logger.debug(f"Dispatching {call.appointment_id} {lateness * 1000:.1f}ms after its call time")
+
+
+class LeasingDispatcher(Dispatcher):
+    """Dispatcher for workers sharing one SQLite schedule store.
+    
+    Due calls are claimed in batches under a lease instead of being popped.
+    While the batch is dialed a heartbeat thread renews the leases, each
+    call's lease is renewed once more just before it is dialed (a call
+    whose lease was lost is skipped), and finished calls are completed.
+    Calls of a worker that dies are reclaimed by others when the lease
+    expires. Schedule changes made by other processes are noticed within
+    max_wait seconds.
+    
+    With a dial_pool, the calls of a batch are dialed on its threads (each
+    renewed and completed by the thread that dials it), and the next batch
+    is claimed once the whole batch has finished.
+    """
+    
+    def __init__(
+        self,
+        scheduler: 'SQLiteScheduler',
+        handler: Callable[[ScheduledCall], Any],
+        worker_id: str,
+        lease_seconds: float = 60.0,
+        batch_size: int = 10,
+        max_wait: float = 300.0,
+        clock: Callable[[], datetime] = datetime.now,
+        batch_handler: Optional[Callable[[List[ScheduledCall]], Any]] = None,
+        dial_pool: Optional['DialPool'] = None
+    ):
+        """Initialize leasing dispatcher.
+        
+        Args:
+            scheduler: Shared schedule store
+            handler: Called with each claimed call
+            worker_id: Name of this worker, unique among workers sharing the store
+            lease_seconds: Lease length; must comfortably exceed one call attempt
+                (or, with a batch_handler, one whole batch)
+            batch_size: Calls claimed per batch
+            max_wait: Longest single sleep in seconds
+            clock: Function returning the current time
+            batch_handler: Called instead of handler with each claimed batch
+            dial_pool: Threads to run handler on for the calls of a batch
+                (None to dial them one at a time on the dispatch thread)
+        """
+        super().__init__(scheduler, handler, max_wait=max_wait, clock=clock, batch_handler=batch_handler)
+        self.dial_pool = dial_pool
+        self.worker_id = worker_id
+        self.lease_seconds = lease_seconds
+        self.batch_size = batch_size
+        self.stats.update({'claimed': 0, 'lost_leases': 0})
+    
+    def _run(self) -> None:
+        """Dispatch loop."""
+        while True:
+            now = self._wait_for_due_calls()
+            if now is None:
+                return
+            self.dispatch_due(now)
+    
+    def dispatch_due(self, current_time: Optional[datetime] = None) -> int:
+        """Claim and dial due calls, one batch at a time, until none are left.
+        
+        Also used directly by the app's poll mode.
+        
+        Args:
+            current_time: Time to check against (default: now)
+            
+        Returns:
+            Number of calls dispatched
+        """
+        dispatched = 0
+        while not self._stopping:
+            batch = self.scheduler.claim_due_calls(
+                self.worker_id, self.lease_seconds, limit=self.batch_size,
+                current_time=current_time or self.clock()
+            )
+            if not batch:
+                break
+            self.stats['claimed'] += len(batch)
+            dispatched += self._dispatch_batch(batch)
+            current_time = None
+        return dispatched
+    
+    def _dispatch_batch(self, batch: List[ScheduledCall]) -> int:
+        """Dial a claimed batch while a heartbeat keeps its leases alive."""
+        held = {call.appointment_id for call in batch}
+        held_lock = threading.Lock()
+        done = threading.Event()
+        
+        def heartbeat():
+            while not done.wait(self.lease_seconds / 3):
+                with held_lock:
+                    ids = list(held)
+                lost = set(ids) - set(self.scheduler.renew_leases(self.worker_id, ids, self.lease_seconds))
+                with held_lock:
+                    held.difference_update(lost)
+        
+        keeper = threading.Thread(target=heartbeat, name='lease-heartbeat', daemon=True)
+        keeper.start()
+        dispatched = 0
+        
+        try:
+            if self.batch_handler is not None:
+                return self._dispatch_together(batch, held, held_lock)
+            if self.dial_pool is not None:
+                return self._dispatch_pooled(batch, held, held_lock)
+            
+            for index, call in enumerate(batch):
+                if self._stopping:
+                    self.scheduler.release_calls(self.worker_id, [c.appointment_id for c in batch[index:]])
+                    break
+                dispatched += self._dispatch_leased(call, held, held_lock)
+        finally:
+            done.set()
+            keeper.join()
+                
+        return dispatched
+    
+    def _dispatch_leased(self, call: ScheduledCall, held: Set[str], held_lock: threading.Lock) -> bool:
+        """Dial one claimed call if its lease still holds, then complete it."""
+        # Last check before dialing: skip calls whose lease another worker took over
+        if not self.scheduler.renew_leases(self.worker_id, [call.appointment_id], self.lease_seconds):
+            with self._stats_lock:
+                self.stats['lost_leases'] += 1
+            logger.warning(f"Lease on {call.appointment_id} was lost; not dialing")
+            with held_lock:
+                held.discard(call.appointment_id)
+            return False
+                
+        self._dispatch(call)
+        with held_lock:
+            held.discard(call.appointment_id)
+        self.scheduler.complete_call(self.worker_id, call.appointment_id)
+        return True
+    
+    def _dispatch_pooled(self, batch: List[ScheduledCall], held: Set[str], held_lock: threading.Lock) -> int:
+        """Dial a claimed batch on the dial pool and wait until every call has finished."""
+        finished = threading.Condition()
+        remaining = len(batch)
+        dispatched = 0
+        
+        def dial(call: ScheduledCall) -> None:
+            nonlocal remaining, dispatched
+            placed = False
+            try:
+                if self._stopping:
+                    self.scheduler.release_calls(self.worker_id, [call.appointment_id])
+                else:
+                    placed = self._dispatch_leased(call, held, held_lock)
+            finally:
+                with finished:
+                    remaining -= 1
+                    dispatched += placed
+                    finished.notify_all()
+        
+        for index, call in enumerate(batch):
+            try:
+                self.dial_pool.submit(call, handler=dial)
+            except RuntimeError:
+                # Pool already shut down: give the rest of the batch back
+                ids = [c.appointment_id for c in batch[index:]]
+                self.scheduler.release_calls(self.worker_id, ids)
+                with finished:
+                    remaining -= len(ids)
+                break
+        
+        with finished:
+            finished.wait_for(lambda: remaining == 0)
+        return dispatched
+    
+    def _dispatch_together(self, batch: List[ScheduledCall], held: Set[str], held_lock: threading.Lock) -> int:
+        """Hand a claimed batch to the batch handler in one go, then complete it."""
+        ids = [call.appointment_id for call in batch]
+        if self._stopping:
+            self.scheduler.release_calls(self.worker_id, ids)
+            return 0
+        
+        # Last check before dialing: skip calls whose lease another worker took over
+        renewed = set(self.scheduler.renew_leases(self.worker_id, ids, self.lease_seconds))
+        live = [call for call in batch if call.appointment_id in renewed]
+        for call in batch:
+            if call.appointment_id not in renewed:
+                self.stats['lost_leases'] += 1
+                logger.warning(f"Lease on {call.appointment_id} was lost; not dialing")
+        
+        self._dispatch_many(live)
+        with held_lock:
+            held.clear()
+        for call in live:
+            self.scheduler.complete_call(self.worker_id, call.appointment_id)
+        return len(live)
@@ -0,0 +1,152 @@
+"""
+Pooled keep-alive HTTP transport for the Twilio REST client.
+One connection pool shared by every dialing thread, so calls reuse open connections instead of paying a new TLS handshake each time.
+"""
+
+import logging
+from typing import Dict, Optional, Tuple
+
+from requests import Request
+from requests.adapters import HTTPAdapter
+from twilio.http.http_client import TwilioHttpClient
+from twilio.http.response import Response
+
+logger = logging.getLogger(__name__)
+
+
+class PooledHttpClient(TwilioHttpClient):
+    """TwilioHttpClient with a bounded, shared keep-alive connection pool.
+    
+    Requests are never retried by the transport: a failed create must not
+    be sent twice, and retries are scheduled by the app instead. Threads
+    wait for a free connection rather than opening extra ones that would
+    be thrown away afterwards.
+    
+    Safe to share between threads: unlike the base class, request() keeps
+    no per-request state on the instance.
+    """
+    
+    def __init__(
+        self,
+        pool_size: int = 10,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 30.0,
+        keep_alive: bool = True
+    ):
+        """Initialize pooled HTTP client.
+        
+        Args:
+            pool_size: Connections kept open per host (match the number of dialing threads)
+            connect_timeout: Seconds to wait for a connection to be established
+            read_timeout: Seconds to wait for the server to respond
+            keep_alive: Keep connections open between requests
+        """
+        if pool_size < 1:
+            raise ValueError("pool_size must be at least 1")
+        if connect_timeout <= 0 or read_timeout <= 0:
+            raise ValueError("timeouts must be positive")
+        
+        super().__init__(pool_connections=True, max_retries=0)
+        self.pool_size = pool_size
+        self.keep_alive = keep_alive
+        # requests takes (connect, read); the base class passes this through
+        self.timeout = (connect_timeout, read_timeout)
+        
+        self.adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=pool_size,
+            max_retries=0,
+            pool_block=True
+        )
+        self.session.mount('https://', self.adapter)
+        self.session.mount('http://', self.adapter)
+        if not keep_alive:
+            self.session.headers['Connection'] = 'close'
+    
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, object]] = None,
+        data: Optional[Dict[str, object]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        auth: Optional[Tuple[str, str]] = None,
+        timeout: Optional[float] = None,
+        allow_redirects: bool = False
+    ) -> Response:
+        """Send one request over the pool and return its response.
+        
+        Same as TwilioHttpClient.request(), except the response is not kept
+        in _test_only_last_response, where a concurrent request could
+        replace it before it is returned.
+        
+        Args:
+            method: HTTP method
+            url: Request URL
+            params: Query parameters
+            data: Form (or JSON) body parameters
+            headers: HTTP headers
+            auth: Basic auth (username, password)
+            timeout: Read timeout in seconds (None for the configured timeouts)
+            allow_redirects: Whether to follow redirects
+        
+        Returns:
+            Twilio Response with the status code, body and headers
+        """
+        if timeout is None:
+            timeout = self.timeout
+        elif timeout <= 0:
+            raise ValueError(timeout)
+        
+        kwargs = {
+            'method': method.upper(),
+            'url': url,
+            'params': params,
+            'headers': headers,
+            'auth': auth,
+            'hooks': self.request_hooks
+        }
+        if headers and headers.get('Content-Type') in ('application/json', 'application/scim+json'):
+            kwargs['json'] = data
+        else:
+            kwargs['data'] = data
+        self.log_request(kwargs)
+        
+        prepped_request = self.session.prepare_request(Request(**kwargs))
+        settings = self.session.merge_environment_settings(prepped_request.url, self.proxy, None, None, None)
+        response = self.session.send(
+            prepped_request,
+            allow_redirects=allow_redirects,
+            timeout=timeout,
+            **settings
+        )
+        self.log_response(response.status_code, response)
+        
+        return Response(int(response.status_code), response.text, response.headers)
+    
+    def connection_stats(self) -> Dict[str, float]:
+        """Count requests and the connections opened to serve them.
+        
+        Returns:
+            Requests sent, new connections opened, requests that reused an
+            open connection, and the fraction of requests that did
+        """
+        requests = 0
+        connections = 0
+        pools = self.adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is not None:
+                requests += pool.num_requests
+                connections += pool.num_connections
+        reused = max(requests - connections, 0)
+        return {
+            'requests': requests,
+            'new_connections': connections,
+            'reused_connections': reused,
+            'reuse_ratio': reused / requests if requests else 0.0
+        }
+    
+    def close(self) -> None:
+        """Close every pooled connection."""
+        self.session.close()
@@ -0,0 +1,128 @@
+"""
+Incremental re-ingest support.
+Diffs a re-read appointment file against the previous ingest of the same source.
+"""
+
+import hashlib
+import logging
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List
+
+from data_processor import Appointment
+
+logger = logging.getLogger(__name__)
+
+
+def row_hash(apt: Appointment) -> bytes:
+    """Hash the fields of an appointment that affect its reminder.
+    
+    Args:
+        apt: Appointment to hash
+    
+    Returns:
+        8-byte digest
+    """
+    material = "\x1f".join([
+        apt.name,
+        apt.phone_number,
+        apt.email,
+        apt.appointment_datetime.isoformat()
+    ])
+    return hashlib.blake2b(material.encode('utf-8'), digest_size=8).digest()
+
+
+@dataclass
+class SyncDelta:
+    """Changes between two ingests of the same source."""
+    
+    added: List[Appointment] = field(default_factory=list)
+    updated: List[Appointment] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)  # Appointment IDs
+    unchanged: int = 0
+    manifest: Dict[str, bytes] = field(default_factory=dict, repr=False)
+    
+    def counts(self) -> Dict[str, int]:
+        """Get the number of rows in each category."""
+        return {
+            'added': len(self.added),
+            'updated': len(self.updated),
+            'removed': len(self.removed),
+            'unchanged': self.unchanged
+        }
+
+
+class IncrementalSync:
+    """Tracks per-source row hashes so re-ingests only apply what changed."""
+    
+    def __init__(self):
+        """Initialize with no previous ingests."""
+        # source path -> {appointment ID: row hash}
+        self._manifests: Dict[str, Dict[str, bytes]] = {}
+    
+    @staticmethod
+    def _source_key(source: str) -> str:
+        return str(Path(source).resolve())
+    
+    def has_manifest(self, source: str) -> bool:
+        """Check whether a source has been ingested before."""
+        return self._source_key(source) in self._manifests
+    
+    def diff(
+        self,
+        source: str,
+        appointments: Iterable[Appointment],
+        key_func: Callable[[Appointment], str]
+    ) -> SyncDelta:
+        """Compare freshly read appointments with the previous ingest.
+        
+        Unchanged rows are only counted, so applying the delta costs time
+        proportional to the number of changed rows.
+        
+        Args:
+            source: Path of the source file
+            appointments: Appointments read from the source
+            key_func: Function returning the scheduler ID for an appointment
+        
+        Returns:
+            SyncDelta with added, updated and removed appointments
+        """
+        previous = self._manifests.get(self._source_key(source), {})
+        delta = SyncDelta()
+        
+        for apt in appointments:
+            appointment_id = key_func(apt)
+            digest = row_hash(apt)
+            
+            if appointment_id in delta.manifest:
+                logger.debug(f"Duplicate appointment {appointment_id} in {source}")
+            delta.manifest[appointment_id] = digest
+            
+            old_digest = previous.get(appointment_id)
+            if old_digest is None:
+                delta.added.append(apt)
+            elif old_digest != digest:
+                delta.updated.append(apt)
+            else:
+                delta.unchanged += 1
+        
+        delta.removed = [
+            appointment_id for appointment_id in previous
+            if appointment_id not in delta.manifest
+        ]
+        
+        logger.info(f"Incremental diff for {Path(source).name}: {delta.counts()}")
+        return delta
+    
+    def commit(self, source: str, delta: SyncDelta) -> None:
+        """Record a delta's manifest as the latest ingest of a source.
+        
+        Args:
+            source: Path of the source file
+            delta: Delta returned by diff() after it has been applied
+        """
+        self._manifests[self._source_key(source)] = delta.manifest
+    
+    def forget(self, source: str) -> None:
+        """Drop the stored manifest so the next diff treats every row as new."""
+        self._manifests.pop(self._source_key(source), None)
@@ -0,0 +1,289 @@
+"""
+Parallel ingest of many appointment files.
+Splits work by file, sheet and (for large CSV files) byte range across a process pool.
+"""
+
+import csv
+import glob
+import itertools
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from data_processor import DataProcessor, Appointment, READERS, DATE_SAMPLE_SIZE
+
+logger = logging.getLogger(__name__)
+
+# CSV files larger than this are split into byte ranges across workers
+CSV_SPLIT_BYTES = 64 * 1024 * 1024
+
+
+@dataclass
+class IngestTask:
+    """One unit of ingest work: a sheet of a file, or a byte range of a CSV file."""
+    
+    source: str
+    sheet: Optional[str] = None
+    byte_range: Optional[Tuple[int, int]] = None
+    
+    def label(self) -> str:
+        """Human-readable description for reports."""
+        label = self.source
+        if self.sheet is not None:
+            label += f" [{self.sheet}]"
+        if self.byte_range is not None:
+            label += f" bytes {self.byte_range[0]}-{self.byte_range[1]}"
+        return label
+
+
+@dataclass
+class IngestReport:
+    """Outcome of one ingest task."""
+    
+    task: IngestTask
+    parsed: int = 0
+    rejected: int = 0
+    lines: int = 0
+    seconds: float = 0.0
+    error: Optional[str] = None
+    appointments: List[Appointment] = field(default_factory=list, repr=False)
+
+
+def expand_sources(patterns: Iterable[str]) -> List[Path]:
+    """Expand file paths and glob patterns into a sorted, de-duplicated file list.
+    
+    Args:
+        patterns: File paths or glob patterns (e.g. "data/*.xlsx")
+    
+    Returns:
+        Existing files, in pattern order and sorted within each pattern
+    
+    Raises:
+        FileNotFoundError: If a plain path does not exist
+    """
+    sources: Dict[Path, None] = {}
+    for pattern in patterns:
+        if glob.has_magic(pattern):
+            matches = sorted(glob.glob(pattern, recursive=True))
+            if not matches:
+                logger.warning(f"No files match {pattern}")
+            for match in matches:
+                sources[Path(match)] = None
+        else:
+            path = Path(pattern)
+            if not path.exists():
+                raise FileNotFoundError(f"Appointment file not found: {path}")
+            sources[path] = None
+    
+    return [path for path in sources if path.suffix.lower() in READERS]
+
+
+def sheet_names(file_path: Path) -> List[Optional[str]]:
+    """List the sheets of a workbook (a single None entry for other formats).
+    
+    Args:
+        file_path: Appointment file
+    
+    Returns:
+        Sheet names in workbook order
+    """
+    suffix = file_path.suffix.lower()
+    if suffix in ('.xlsx', '.xlsm'):
+        from openpyxl import load_workbook
+        
+        workbook = load_workbook(file_path, read_only=True)
+        try:
+            return list(workbook.sheetnames)
+        finally:
+            workbook.close()
+    if suffix == '.xls':
+        import pandas as pd
+        
+        return list(pd.ExcelFile(file_path).sheet_names)
+    return [None]
+
+
+def plan_tasks(sources: List[Path], workers: int, split_bytes: int = CSV_SPLIT_BYTES) -> List[IngestTask]:
+    """Break sources into ingest tasks in a deterministic order.
+    
+    Args:
+        sources: Files to ingest
+        workers: Number of worker processes (used to size CSV ranges)
+        split_bytes: CSV files larger than this are split by byte range
+    
+    Returns:
+        Tasks ordered by source, then sheet, then byte offset
+    """
+    tasks = []
+    for source in sources:
+        if source.suffix.lower() == '.csv' and source.stat().st_size > split_bytes:
+            size = source.stat().st_size
+            parts = max(2, min(workers, -(-size // split_bytes) * 2))
+            bounds = [size * part // parts for part in range(parts + 1)]
+            tasks.extend(
+                IngestTask(str(source), byte_range=(start, end))
+                for start, end in zip(bounds, bounds[1:])
+            )
+        else:
+            tasks.extend(IngestTask(str(source), sheet=sheet) for sheet in sheet_names(source))
+    return tasks
+
+
+def _iter_csv_range(
+    processor: DataProcessor,
+    file_path: Path,
+    start: int,
+    end: int,
+    counter: Dict[str, int]
+) -> Iterator[Tuple[int, Tuple[Any, ...]]]:
+    """Yield rows of the lines that begin within [start, end) of a CSV file.
+    
+    Line numbers are local to the range (the first range counts the header
+    as line 1); counter['lines'] receives the number of lines consumed.
+    Assumes no quoted field contains a newline.
+    """
+    with open(file_path, 'rb') as f:
+        header = next(csv.reader([f.readline().decode('utf-8-sig')]), [])
+        positions = processor._column_positions(tuple(header))
+        
+        if start == 0:
+            line_number = 1
+        else:
+            # Skip the line straddling the boundary; the previous range owns it
+            f.seek(start - 1)
+            f.readline()
+            line_number = 0
+        position = max(f.tell(), start)
+        
+        def lines():
+            nonlocal position, line_number
+            while position < end:
+                raw = f.readline()
+                if not raw:
+                    break
+                position += len(raw)
+                line_number += 1
+                yield raw.decode('utf-8')
+        
+        for row in csv.reader(lines()):
+            yield line_number, tuple(row[pos] if pos < len(row) else None for pos in positions)
+        
+        counter['lines'] = line_number
+
+
+def _run_task(settings: Dict[str, Any], task: IngestTask) -> IngestReport:
+    """Process pool worker: ingest one task with a fresh DataProcessor."""
+    report = IngestReport(task=task)
+    start_time = time.perf_counter()
+    processor = DataProcessor(**settings)
+    
+    try:
+        if task.byte_range is not None:
+            counter = {'lines': 0}
+            rows = _iter_csv_range(processor, Path(task.source), *task.byte_range, counter)
+        else:
+            counter = None
+            reader = READERS[Path(task.source).suffix.lower()]
+            rows = getattr(processor, reader)(Path(task.source), task.sheet)
+        
+        sample = list(itertools.islice(rows, DATE_SAMPLE_SIZE))
+        processor.infer_date_format([values[3] for _, values in sample])
+        rows = itertools.chain(sample, rows)
+        
+        for row_index, values in rows:
+            appointment = processor._build_appointment(values, row_index)
+            if appointment is None:
+                report.rejected += 1
+            else:
+                report.appointments.append(appointment)
+        
+        report.parsed = len(report.appointments)
+        report.lines = counter['lines'] if counter else 0
+    except Exception as e:
+        report.error = f"{type(e).__name__}: {e}"
+        report.appointments = []
+    
+    report.seconds = time.perf_counter() - start_time
+    return report
+
+
+def read_many(
+    processor: DataProcessor,
+    patterns: Iterable[str],
+    max_workers: Optional[int] = None,
+    split_bytes: int = CSV_SPLIT_BYTES
+) -> Tuple[List[Appointment], List[IngestReport]]:
+    """Ingest every sheet of every matching file in parallel.
+    
+    Args:
+        processor: Processor whose settings the workers copy
+        patterns: File paths or glob patterns
+        max_workers: Worker processes (default: CPU count)
+        split_bytes: CSV files larger than this are split by byte range
+    
+    Returns:
+        Tuple of (appointments in source/sheet/row order, per-task reports)
+    """
+    sources = expand_sources(patterns)
+    workers = max_workers or os.cpu_count() or 1
+    tasks = plan_tasks(sources, workers, split_bytes)
+    settings = {
+        'required_columns': processor.required_columns,
+        'date_format': processor.date_format,
+        'fallback_date_format': processor.fallback_date_format,
+        'date_cache_size': processor.date_cache_size,
+        'timezone': processor.timezone_name,
+    }
+    
+    logger.info(f"Ingesting {len(sources)} files as {len(tasks)} tasks on {workers} workers")
+    
+    if workers == 1 or len(tasks) == 1:
+        reports = [_run_task(settings, task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            reports = list(pool.map(_run_task, [settings] * len(tasks), tasks))
+    
+    # A failed byte range leaves a gap in its file's line numbers, so the
+    # other ranges of that file are dropped as well
+    failed_sources = {
+        report.task.source for report in reports
+        if report.error and report.task.byte_range is not None
+    }
+    for report in reports:
+        if report.task.source in failed_sources and not report.error:
+            report.error = "another byte range of this file failed"
+            report.parsed = 0
+            report.appointments = []
+    
+    appointments: List[Appointment] = []
+    line_offset = 0
+    previous_source = None
+    
+    for report in reports:
+        # Byte-range tasks number lines locally; shift them to file line numbers
+        if report.task.byte_range is not None:
+            if report.task.source != previous_source:
+                line_offset = 0
+            for apt in report.appointments:
+                apt.row_index += line_offset
+            line_offset += report.lines
+        previous_source = report.task.source
+        
+        if report.error:
+            logger.error(f"Failed to ingest {report.task.label()}: {report.error}")
+        elif report.rejected:
+            logger.warning(f"Rejected {report.rejected} rows in {report.task.label()}")
+        
+        appointments.extend(report.appointments)
+        report.appointments = []
+    
+    failed = sum(1 for report in reports if report.error)
+    logger.info(
+        f"Parallel ingest parsed {len(appointments)} appointments "
+        f"({failed} of {len(tasks)} tasks failed)"
+    )
+    return appointments, reports
@@ -0,0 +1,254 @@
+"""
+On-disk cache of parsed appointment files.
+Stores already-validated appointments so unchanged inputs skip re-parsing.
+"""
+
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Bump when the cached file layout changes so old entries are ignored
+CACHE_FORMAT_VERSION = 2
+
+# Extension of cache entries (.npz archives, see CacheEntryWriter)
+ENTRY_SUFFIX = '.npz'
+
+# Bytes read per block when hashing source files
+HASH_BLOCK_SIZE = 1 << 20
+
+
+class ParseCache:
+    """Content-addressed, size-bounded cache of parsed appointment files."""
+    
+    def __init__(self, cache_dir: str = "data/.cache", max_bytes: int = 256 * 1024 * 1024):
+        """Initialize parse cache.
+        
+        Args:
+            cache_dir: Directory holding cache entries
+            max_bytes: Maximum total size of cache entries before LRU eviction
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.index_path = self.cache_dir / 'index.json'
+        self.hits = 0
+        self.misses = 0
+        
+        # source path -> [size, mtime_ns, content digest]; avoids re-hashing unchanged files
+        self._digests: Dict[str, list] = self._load_index()
+    
+    def _load_index(self) -> Dict[str, list]:
+        """Load the stat -> digest index, ignoring a missing or corrupt file."""
+        try:
+            with open(self.index_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save_index(self) -> None:
+        """Persist the stat -> digest index."""
+        tmp_path = self.index_path.with_suffix('.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(self._digests, f)
+        os.replace(tmp_path, self.index_path)
+    
+    def content_digest(self, file_path: Path) -> str:
+        """Get the SHA-256 of a file, reusing the stored digest if size and mtime match.
+        
+        Args:
+            file_path: Source file
+        
+        Returns:
+            Hex digest of the file contents
+        """
+        stat = file_path.stat()
+        source = str(file_path.resolve())
+        known = self._digests.get(source)
+        if known and known[0] == stat.st_size and known[1] == stat.st_mtime_ns:
+            return known[2]
+        
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b''):
+                digest.update(block)
+        
+        self._digests[source] = [stat.st_size, stat.st_mtime_ns, digest.hexdigest()]
+        self._save_index()
+        return digest.hexdigest()
+    
+    def key(self, file_path: str, settings: Dict[str, Any]) -> str:
+        """Build the cache key for a source file and parser settings.
+        
+        Args:
+            file_path: Source file
+            settings: Parser settings that affect the result
+        
+        Returns:
+            Hex cache key
+        """
+        file_path = Path(file_path)
+        stat = file_path.stat()
+        material = {
+            'version': CACHE_FORMAT_VERSION,
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'digest': self.content_digest(file_path),
+            'settings': settings,
+        }
+        encoded = json.dumps(material, sort_keys=True, default=str).encode('utf-8')
+        return hashlib.sha256(encoded).hexdigest()
+    
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{ENTRY_SUFFIX}"
+    
+    def lookup(self, key: str) -> Optional[Path]:
+        """Find a cache entry and mark it as recently used.
+        
+        Args:
+            key: Cache key from key()
+        
+        Returns:
+            Path to the entry, or None on a miss
+        """
+        path = self._entry_path(key)
+        if not path.exists():
+            self.misses += 1
+            return None
+        
+        # mtime doubles as the LRU timestamp
+        os.utime(path)
+        self.hits += 1
+        logger.debug(f"Parse cache hit: {key[:12]}")
+        return path
+    
+    def open_entry(self, key: str) -> 'CacheEntryWriter':
+        """Start writing a new cache entry; it is stored by the writer's commit().
+        
+        Args:
+            key: Cache key from key()
+        
+        Returns:
+            Writer for the entry's chunks
+        """
+        return CacheEntryWriter(self, key, self._entry_path(key).with_name(f"{key}.tmp{ENTRY_SUFFIX}"))
+    
+    def _commit(self, key: str, tmp_path: Path) -> Path:
+        """Move a fully written entry into place and evict old ones if over budget."""
+        path = self._entry_path(key)
+        os.replace(tmp_path, path)
+        logger.debug(f"Stored parse cache entry: {key[:12]}")
+        
+        self.evict(keep=path)
+        return path
+    
+    def usage(self) -> Tuple[int, int]:
+        """Get the number of cache entries and their total size in bytes."""
+        sizes = []
+        for path in self.cache_dir.glob(f"*{ENTRY_SUFFIX}"):
+            try:
+                sizes.append(path.stat().st_size)
+            except OSError:
+                continue
+        return len(sizes), sum(sizes)
+    
+    def evict(self, keep: Optional[Path] = None) -> int:
+        """Remove least recently used entries until under max_bytes.
+        
+        Args:
+            keep: Entry that must not be evicted (e.g. the one just written)
+        
+        Returns:
+            Number of entries removed
+        """
+        entries = []
+        for path in self.cache_dir.glob(f"*{ENTRY_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+        
+        if removed:
+            logger.info(f"Evicted {removed} parse cache entries")
+        return removed
+
+
+class CacheEntryWriter:
+    """Writes a cache entry chunk by chunk, so only one chunk is held in memory.
+    
+    The entry is an .npz archive: column `name` of chunk i is stored as
+    member 'name.i', followed by metadata arrays and the chunk count.
+    """
+    
+    def __init__(self, cache: ParseCache, key: str, tmp_path: Path):
+        """Open the entry's temporary file.
+        
+        Args:
+            cache: Cache the entry belongs to
+            key: Cache key from ParseCache.key()
+            tmp_path: File written until the entry is committed
+        """
+        import zipfile
+        
+        self.cache = cache
+        self.key = key
+        self.tmp_path = tmp_path
+        self.chunks = 0
+        self.rows = 0
+        self._archive = zipfile.ZipFile(tmp_path, 'w', zipfile.ZIP_STORED, allowZip64=True)
+    
+    def _write_array(self, name: str, array: Any) -> None:
+        import numpy as np
+        
+        with self._archive.open(f"{name}.npy", 'w', force_zip64=True) as f:
+            np.lib.format.write_array(f, np.asanyarray(array), allow_pickle=False)
+    
+    def add_chunk(self, columns: Dict[str, Any]) -> None:
+        """Append one chunk of equal-length column arrays."""
+        for name, array in columns.items():
+            self._write_array(f"{name}.{self.chunks}", array)
+        self.chunks += 1
+        self.rows += len(next(iter(columns.values()), ()))
+    
+    def commit(self, meta: Dict[str, Any]) -> Path:
+        """Write metadata arrays and store the finished entry.
+        
+        Args:
+            meta: Extra arrays saved with the entry (e.g. parse statistics)
+        
+        Returns:
+            Path to the stored entry
+        """
+        for name, array in meta.items():
+            self._write_array(name, array)
+        self._write_array('chunks', self.chunks)
+        self._archive.close()
+        return self.cache._commit(self.key, self.tmp_path)
+    
+    def abort(self) -> None:
+        """Discard the partly written entry."""
+        self._archive.close()
+        try:
+            self.tmp_path.unlink()
+        except OSError:
+            pass
@@ -0,0 +1,231 @@
+"""
+Phone number normalization for ingest.
+Converts raw phone numbers to E.164 once, with memoization, so dialing never re-parses.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Already in E.164 form; normalizing such a value always returns it unchanged
+E164_PATTERN = re.compile(r'^\+[1-9]\d{7,14}$')
+
+# Common US formats: 555-123-4567, (555) 456-7890, 555.123.4567, +1 555 123 4567
+US_PHONE_PATTERN = re.compile(
+    r'^(?:\+?1[\s.-]?)?\(?([2-9]\d{2})\)?[\s.-]?([2-9]\d{2})[\s.-]?(\d{4})$'
+)
+
+# Minimum number of uncached numbers before a process pool is worth starting
+POOL_MIN_BATCH = 5000
+
+
+def parse_phone_number(phone_number: str) -> Optional[str]:
+    """Normalize a phone number with the phonenumbers library.
+    
+    Args:
+        phone_number: Phone number in any format
+    
+    Returns:
+        E.164 string, or None if the number is not valid
+    """
+    # Imported on first use; numbers handled by the memo/fast path never need it
+    import phonenumbers
+    from phonenumbers import NumberParseException
+    
+    for region in ("US", None):
+        try:
+            parsed = phonenumbers.parse(phone_number, region)
+            if phonenumbers.is_valid_number(parsed):
+                return phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.E164)
+        except NumberParseException:
+            pass
+    return None
+
+
+def _parse_batch(phone_numbers: List[str]) -> List[Optional[str]]:
+    """Process pool worker: parse a batch of numbers."""
+    return [parse_phone_number(number) for number in phone_numbers]
+
+
+class PhoneNormalizer:
+    """Memoizing raw -> E.164 phone number normalizer.
+    
+    Safe to share between threads (ingest and every dialing thread use the
+    same instance); the memo and stats are only touched under a lock, while
+    phonenumbers parsing runs outside it.
+    """
+    
+    def __init__(
+        self,
+        max_size: int = 100000,
+        cache_file: Optional[str] = None,
+        processes: int = 0,
+        fast_path: bool = True
+    ):
+        """Initialize phone normalizer.
+        
+        Args:
+            max_size: Maximum number of memoized numbers (LRU eviction)
+            cache_file: JSON file persisting the memo between runs (None to disable)
+            processes: Worker processes for large batches (0 to parse in-process)
+            fast_path: Convert common US formats with a regex instead of phonenumbers.
+                This accepts any structurally valid NANP number, including
+                area codes phonenumbers considers unassigned.
+        """
+        self.max_size = max_size
+        self.cache_file = Path(cache_file) if cache_file else None
+        self.processes = processes
+        self.fast_path = fast_path
+        self.stats = {'memo_hits': 0, 'fast_path': 0, 'parsed': 0, 'invalid': 0}
+        
+        # raw number -> E.164, or None if it could not be normalized
+        self._memo: "OrderedDict[str, Optional[str]]" = OrderedDict()
+        # Guards _memo, stats and _pool
+        self._lock = threading.Lock()
+        # Created on the first large batch and kept until close()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._load()
+    
+    def __len__(self) -> int:
+        """Number of memoized phone numbers."""
+        with self._lock:
+            return len(self._memo)
+    
+    def _load(self) -> None:
+        """Load the on-disk memo, ignoring a missing or corrupt file."""
+        if not self.cache_file or not self.cache_file.exists():
+            return
+        try:
+            with open(self.cache_file, 'r') as f:
+                entries = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable phone cache {self.cache_file}: {e}")
+            return
+        
+        for raw, normalized in entries[-self.max_size:]:
+            self._memo[raw] = normalized
+        logger.info(f"Loaded {len(self._memo)} cached phone numbers")
+    
+    def save(self) -> None:
+        """Write the memo to cache_file, if configured, and release the worker processes."""
+        self.close()
+        if not self.cache_file:
+            return
+        with self._lock:
+            entries = list(self._memo.items())
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_file.with_suffix('.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(entries, f)
+        os.replace(tmp_path, self.cache_file)
+    
+    def close(self) -> None:
+        """Shut down the worker process pool; the next large batch starts a new one."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown()
+    
+    def _executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.processes)
+            return self._pool
+    
+    # _remember, _lookup and _record_parsed must be called with self._lock held
+    
+    def _remember(self, raw: str, normalized: Optional[str]) -> None:
+        self._memo[raw] = normalized
+        if len(self._memo) > self.max_size:
+            self._memo.popitem(last=False)
+    
+    def _lookup(self, raw: str) -> Optional[str]:
+        """Resolve a number without phonenumbers; returns None on a miss."""
+        if E164_PATTERN.match(raw):
+            return raw
+        
+        if raw in self._memo:
+            self._memo.move_to_end(raw)
+            self.stats['memo_hits'] += 1
+            return self._memo[raw] or raw
+        
+        if self.fast_path:
+            match = US_PHONE_PATTERN.match(raw.strip())
+            if match:
+                normalized = "+1" + "".join(match.groups())
+                self.stats['fast_path'] += 1
+                self._remember(raw, normalized)
+                return normalized
+        
+        return None
+    
+    def _record_parsed(self, raw: str, normalized: Optional[str]) -> str:
+        self.stats['parsed'] += 1
+        if normalized is None:
+            self.stats['invalid'] += 1
+            logger.warning(f"Could not normalize phone number: {raw}")
+        self._remember(raw, normalized)
+        return normalized or raw
+    
+    def normalize(self, phone_number: str) -> str:
+        """Normalize a single phone number to E.164.
+        
+        Args:
+            phone_number: Phone number in any format
+        
+        Returns:
+            Phone number in E.164 format, or unchanged if it cannot be normalized
+        """
+        with self._lock:
+            normalized = self._lookup(phone_number)
+        if normalized is not None:
+            return normalized
+        parsed = parse_phone_number(phone_number)
+        with self._lock:
+            return self._record_parsed(phone_number, parsed)
+    
+    def normalize_many(self, phone_numbers: Iterable[str]) -> List[str]:
+        """Normalize a batch of phone numbers.
+        
+        Numbers not resolved by the memo or fast path are parsed once each,
+        across a process pool when there are enough of them.
+        
+        Args:
+            phone_numbers: Phone numbers in any format
+        
+        Returns:
+            E.164 numbers in the same order (unchanged where invalid)
+        """
+        phone_numbers = list(phone_numbers)
+        results: Dict[str, str] = {}
+        pending: List[str] = []
+        
+        with self._lock:
+            for raw in dict.fromkeys(phone_numbers):
+                normalized = self._lookup(raw)
+                if normalized is None:
+                    pending.append(raw)
+                else:
+                    results[raw] = normalized
+        
+        if pending:
+            if self.processes > 1 and len(pending) >= POOL_MIN_BATCH:
+                chunk = -(-len(pending) // (self.processes * 4))
+                batches = [pending[i:i + chunk] for i in range(0, len(pending), chunk)]
+                parsed = [number for batch in self._executor().map(_parse_batch, batches) for number in batch]
+            else:
+                parsed = _parse_batch(pending)
+            
+            with self._lock:
+                for raw, normalized in zip(pending, parsed):
+                    results[raw] = self._record_parsed(raw, normalized)
+        
+        return [results[raw] for raw in phone_numbers]
@@ -0,0 +1,257 @@
+"""
+Call pacing for provider rate limits.
+Token buckets, one per outbound number, that spread bursts of due calls over time.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Token bucket: refills at `rate` tokens per second up to `burst` tokens."""
+    
+    def __init__(self, rate: float, burst: int = 1, clock: Callable[[], float] = time.monotonic):
+        """Initialize a full bucket.
+        
+        Args:
+            rate: Tokens added per second
+            burst: Bucket capacity (calls that may go out back to back)
+            clock: Monotonic time source in seconds
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        
+        self.rate = rate
+        self.burst = burst
+        self.clock = clock
+        self._tokens = float(burst)
+        self._updated = clock()
+    
+    def _refill(self) -> None:
+        now = self.clock()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+    
+    @property
+    def tokens(self) -> float:
+        """Tokens currently available."""
+        self._refill()
+        return self._tokens
+    
+    def reserve(self) -> float:
+        """Take one token, going into debt if none is available.
+        
+        Returns:
+            Seconds the caller must wait before using the token (0 if available now)
+        """
+        self._refill()
+        self._tokens -= 1
+        return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+
+class CallPacer:
+    """Paces outbound calls with a separate token bucket per from_number."""
+    
+    def __init__(
+        self,
+        calls_per_second: float = 1.0,
+        burst: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Any] = time.sleep
+    ):
+        """Initialize call pacer.
+        
+        Args:
+            calls_per_second: Sustained call rate allowed per from_number
+            burst: Calls per from_number that may go out back to back
+            clock: Monotonic time source in seconds
+            sleep: Function used to wait (replace together with clock in simulations)
+        """
+        self.calls_per_second = calls_per_second
+        self.burst = burst
+        self.clock = clock
+        self.sleep = sleep
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._metrics: Dict[str, Dict[str, float]] = {}
+    
+    def acquire(self, from_number: str) -> float:
+        """Wait until a call from this number is allowed.
+        
+        Concurrent callers reserve tokens in arrival order, so each waits
+        only for its own slot.
+        
+        Args:
+            from_number: Outbound number placing the call
+        
+        Returns:
+            Seconds waited
+        """
+        wait = self.reserve(from_number)
+        if wait > 0:
+            logger.debug(f"Pacing call from {from_number}: waiting {wait:.2f}s")
+            self.sleep(wait)
+        return wait
+    
+    def reserve(self, from_number: str) -> float:
+        """Reserve a call slot for this number without waiting for it.
+        
+        For callers that wait on their own (e.g. with asyncio.sleep).
+        
+        Args:
+            from_number: Outbound number placing the call
+        
+        Returns:
+            Seconds until the reserved slot (0 if a call may go out now)
+        """
+        with self._lock:
+            bucket = self._buckets.get(from_number)
+            if bucket is None:
+                bucket = TokenBucket(self.calls_per_second, self.burst, self.clock)
+                self._buckets[from_number] = bucket
+                self._metrics[from_number] = {
+                    'calls': 0, 'delayed': 0, 'total_wait': 0.0, 'max_wait': 0.0
+                }
+            wait = bucket.reserve()
+            
+            metrics = self._metrics[from_number]
+            metrics['calls'] += 1
+            if wait > 0:
+                metrics['delayed'] += 1
+                metrics['total_wait'] += wait
+                metrics['max_wait'] = max(metrics['max_wait'], wait)
+        return wait
+    
+    def metrics(self, from_number: Optional[str] = None) -> Dict[str, Dict[str, float]]:
+        """Get pacing metrics per from_number.
+        
+        Args:
+            from_number: Only report this number (None for all)
+        
+        Returns:
+            Mapping of from_number to calls, delayed calls, total/max/average
+            wait in seconds, tokens available, and queued calls (tokens owed)
+        """
+        with self._lock:
+            numbers = [from_number] if from_number is not None else list(self._buckets)
+            report = {}
+            for number in numbers:
+                if number not in self._buckets:
+                    continue
+                tokens = self._buckets[number].tokens
+                metrics = dict(self._metrics[number])
+                metrics['avg_wait'] = metrics['total_wait'] / metrics['calls'] if metrics['calls'] else 0.0
+                metrics['tokens'] = max(tokens, 0.0)
+                metrics['queued'] = max(-tokens, 0.0)
+                report[number] = metrics
+            return report
+
+
+class AdaptiveLimiter:
+    """AIMD limit on calls in flight to the provider.
+    
+    A call that hits throttling, a provider error or a timeout multiplies
+    the limit by `backoff` (calls already in flight at that point do not cut
+    it again); successful calls raise it by `increase` per limit's worth of
+    calls, i.e. per round of calls in flight.
+    """
+    
+    def __init__(
+        self,
+        max_limit: int = 10,
+        min_limit: int = 1,
+        initial_limit: Optional[float] = None,
+        increase: float = 1.0,
+        backoff: float = 0.5
+    ):
+        """Initialize adaptive limiter.
+        
+        Args:
+            max_limit: Most calls allowed in flight
+            min_limit: Fewest calls allowed in flight, however bad the provider gets
+            initial_limit: Starting limit (max_limit if None)
+            increase: Added to the limit per round of successful calls
+            backoff: Factor the limit is multiplied by on each overload
+        """
+        if min_limit < 1 or max_limit < min_limit:
+            raise ValueError("limits must satisfy 1 <= min_limit <= max_limit")
+        if not 0 < backoff < 1:
+            raise ValueError("backoff must be between 0 and 1")
+        
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.increase = increase
+        self.backoff = backoff
+        self.stats: Dict[str, int] = {'calls': 0, 'overloads': 0, 'decreases': 0, 'waited': 0}
+        
+        self._limit = float(initial_limit if initial_limit is not None else max_limit)
+        self._in_flight = 0
+        self._stale = 0
+        self._lock = threading.Lock()
+        self._released = threading.Condition(self._lock)
+    
+    @property
+    def limit(self) -> float:
+        """Current limit on calls in flight."""
+        with self._lock:
+            return self._limit
+    
+    @property
+    def in_flight(self) -> int:
+        """Calls currently holding a slot."""
+        with self._lock:
+            return self._in_flight
+    
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """Wait for a slot under the current limit.
+        
+        Args:
+            timeout: Seconds to wait (None to wait indefinitely)
+        
+        Returns:
+            True once a slot is held, False if none freed up in time
+        """
+        with self._released:
+            if self._in_flight >= int(self._limit):
+                self.stats['waited'] += 1
+                if not self._released.wait_for(lambda: self._in_flight < int(self._limit), timeout):
+                    return False
+            self._in_flight += 1
+            self.stats['calls'] += 1
+            return True
+    
+    def release(self, overloaded: bool = False) -> None:
+        """Free a slot and adjust the limit by the call's outcome.
+        
+        Args:
+            overloaded: Whether the call was throttled, failed with a
+                provider error or timed out
+        """
+        with self._released:
+            self._in_flight -= 1
+            # Calls that were in flight when the limit was cut fail together; cut once per round
+            stale = self._stale > 0
+            if stale:
+                self._stale -= 1
+            if overloaded:
+                self.stats['overloads'] += 1
+                limit = max(self.min_limit, self._limit * self.backoff)
+                if not stale and limit < self._limit:
+                    self.stats['decreases'] += 1
+                    logger.info(f"Provider overloaded: call limit {self._limit:.1f} -> {limit:.1f}")
+                    self._limit = limit
+                    self._stale = self._in_flight
+            else:
+                self._limit = min(self.max_limit, self._limit + self.increase / self._limit)
+            self._released.notify_all()
+    
+    def metrics(self) -> Dict[str, float]:
+        """Get the current limit, calls in flight and counters."""
+        with self._lock:
+            return dict(self.stats, limit=self._limit, in_flight=self._in_flight)
@@ -0,0 +1,205 @@
+"""
+Bulk reconciliation of call outcomes.
+Pages through Twilio's call list for a time range and applies the reported statuses to locally tracked calls, instead of fetching every call on its own.
+"""
+
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from call_results import CallResultStore
+from caller import Caller
+
+logger = logging.getLogger(__name__)
+
+# Largest page the Calls list resource returns
+MAX_PAGE_SIZE = 1000
+
+
+@dataclass
+class ReconcileReport:
+    """Outcome of a reconciliation run."""
+    
+    pages: int = 0
+    fetched: int = 0  # Call records listed by Twilio
+    matched: int = 0  # Records of calls tracked locally
+    updated: int = 0  # Tracked calls whose status changed
+    unresolved: int = 0  # Unfinished local calls not seen in the listed range
+    resumed: bool = False
+    complete: bool = False
+
+
+class CallReconciler:
+    """Reconciles locally tracked calls against Twilio's paged call list.
+    
+    The IDs of unfinished calls in the result store are put in a hash set
+    once; each listed page is joined against it and its changes are
+    applied to the store in one bulk update. After every page the position
+    in the list and the IDs not yet matched are written to a checkpoint
+    file, so an interrupted run resumes from the next page, joining
+    against the saved IDs, instead of starting over; while a checkpoint
+    exists, run() finishes that interrupted range before listing any other.
+    """
+    
+    def __init__(
+        self,
+        caller: Caller,
+        results: CallResultStore,
+        checkpoint_path: Optional[str] = None,
+        page_size: int = MAX_PAGE_SIZE
+    ):
+        """Initialize reconciler.
+        
+        Args:
+            caller: Caller whose Twilio client lists the calls
+            results: Store of locally tracked call results to update
+            checkpoint_path: File recording progress (None to not checkpoint)
+            page_size: Calls requested per page (at most 1000)
+        """
+        if not 1 <= page_size <= MAX_PAGE_SIZE:
+            raise ValueError(f"page_size must be between 1 and {MAX_PAGE_SIZE}")
+        
+        self.caller = caller
+        self.results = results
+        self.checkpoint_path = Path(checkpoint_path) if checkpoint_path else None
+        self.page_size = page_size
+    
+    def _load_checkpoint(self, from_number: str) -> Optional[Dict[str, Any]]:
+        """Load saved progress for this number, ignoring a missing or corrupt file."""
+        if self.checkpoint_path is None:
+            return None
+        try:
+            with open(self.checkpoint_path, 'r') as f:
+                checkpoint = json.load(f)
+        except (OSError, ValueError):
+            return None
+        scope = checkpoint.get('scope') or {}
+        if scope.get('from_number') != from_number or not checkpoint.get('next_page_url') or 'pending' not in checkpoint:
+            return None
+        return checkpoint
+    
+    def _save_checkpoint(
+        self,
+        scope: Dict[str, Any],
+        next_page_url: str,
+        report: ReconcileReport,
+        pending: Set[str]
+    ) -> None:
+        """Persist the position of the next page and the call IDs still to match."""
+        if self.checkpoint_path is None:
+            return
+        self.checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.checkpoint_path.with_suffix('.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump({
+                'scope': scope,
+                'next_page_url': next_page_url,
+                'report': asdict(report),
+                'pending': sorted(pending)
+            }, f)
+        os.replace(tmp_path, self.checkpoint_path)
+    
+    def _clear_checkpoint(self) -> None:
+        if self.checkpoint_path is not None and self.checkpoint_path.exists():
+            self.checkpoint_path.unlink()
+    
+    def run(
+        self,
+        start: datetime,
+        end: Optional[datetime] = None,
+        from_number: Optional[str] = None,
+        max_pages: Optional[int] = None
+    ) -> ReconcileReport:
+        """Reconcile calls that started in [start, end) from one number.
+        
+        Args:
+            start: Earliest call start time to list
+            end: Latest call start time to list (None for now)
+            from_number: Outbound number whose calls to list (the caller's if None)
+            max_pages: Stop after this many pages, leaving a checkpoint to
+                resume from (None to list the whole range)
+        
+        Note:
+            If an earlier run for this number was interrupted, it is resumed
+            instead and start/end are ignored. The resumed run matches the
+            call IDs saved with the checkpoint, so it also works in a new
+            process; outcomes of calls the result store no longer tracks are
+            counted as matched but not stored.
+        
+        Returns:
+            ReconcileReport; complete is False if the run stopped at max_pages
+        """
+        end = end or datetime.now(timezone.utc)
+        from_number = from_number or self.caller.from_number
+        scope = {
+            'start': _utc(start).isoformat(),
+            'end': _utc(end).isoformat(),
+            'from_number': from_number
+        }
+        
+        # Build side of the join: tracked calls still waiting for an outcome
+        pending = set(self.results.unfinished())
+        report = ReconcileReport()
+        
+        calls = self.caller.client.calls
+        checkpoint = self._load_checkpoint(from_number)
+        if checkpoint is not None:
+            scope = checkpoint['scope']
+            # Join against the calls the interrupted run was still looking for
+            pending = set(checkpoint['pending'])
+            report = ReconcileReport(**checkpoint['report'])
+            report.resumed = True
+            logger.info(
+                f"Resuming reconciliation of {scope['start']} to {scope['end']} "
+                f"after {report.pages} pages"
+            )
+            page = calls.get_page(checkpoint['next_page_url'])
+        else:
+            page = calls.page(
+                from_=from_number,
+                start_time_after=_utc(start),
+                start_time_before=_utc(end),
+                page_size=self.page_size
+            )
+        
+        pages_this_run = 0
+        while True:
+            updates: List[Tuple[str, str, Optional[float]]] = []
+            for record in page:
+                report.fetched += 1
+                if record.sid in pending:
+                    report.matched += 1
+                    duration = float(record.duration) if record.duration else None
+                    updates.append((record.sid, record.status, duration))
+                    pending.discard(record.sid)
+            report.updated += self.results.update_many(updates)
+            report.pages += 1
+            pages_this_run += 1
+            
+            next_page_url = page.next_page_url
+            if not next_page_url:
+                break
+            self._save_checkpoint(scope, next_page_url, report, pending)
+            if max_pages is not None and pages_this_run >= max_pages:
+                logger.info(f"Reconciliation paused after {report.pages} pages")
+                report.unresolved = len(pending)
+                return report
+            page = calls.get_page(next_page_url)
+        
+        self._clear_checkpoint()
+        report.unresolved = len(pending)
+        report.complete = True
+        logger.info(
+            f"Reconciled {report.fetched} listed calls in {report.pages} pages: "
+            f"{report.matched} tracked, {report.updated} updated, {report.unresolved} unresolved"
+        )
+        return report
+
+
+def _utc(value: datetime) -> datetime:
+    """Convert a datetime to UTC, reading naive values as local time."""
+    return value.astimezone(timezone.utc)
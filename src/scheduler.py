@@ -3,13 +3,23 @@ Scheduler for managing appointment reminder timing.
 Coordinates when to place reminder calls.
 """
 
+import dataclasses
+import functools
+import heapq
+import itertools
 import logging
-from datetime import datetime, timedelta
-from typing import List, Callable, Optional
+import math
+import threading
+import time
+from datetime import datetime, timedelta, tzinfo
+from typing import Dict, Iterable, List, Callable, Optional, Tuple
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+# Rebuild the heap once stale entries outnumber live calls by this factor
+HEAP_COMPACT_RATIO = 2
+
 
 @dataclass
 class ScheduledCall:
@@ -22,25 +32,193 @@ class ScheduledCall:
     call_time: datetime
     appointment_datetime: datetime
     callback: Optional[Callable] = None  # Function to call when time arrives
+    touch: int = 0  # Index into the scheduler's reminder offsets
+    attempt: int = 0  # Retries already made for this touch
     
     def __repr__(self) -> str:
         return f"ScheduledCall(name={self.name}, call_time={self.call_time})"
 
 
+# Heap entry: (call time in UTC epoch seconds, insertion sequence, call);
+# the sequence breaks ties
+HeapEntry = Tuple[int, int, ScheduledCall]
+
+# Input to schedule_many: (appointment_id, phone_number, name, message, appointment_datetime)
+CallRecord = Tuple[str, str, str, str, datetime]
+
+
+def to_epoch(value: datetime) -> int:
+    """Convert a datetime to integer UTC epoch seconds.
+    
+    Aware values are converted from their own time zone; naive values are
+    taken to be system local time, as returned by datetime.now().
+    """
+    return math.floor(value.timestamp())
+
+
+def from_epoch(seconds: int, tz: Optional[tzinfo] = None) -> datetime:
+    """Convert UTC epoch seconds to a datetime in tz (naive system local time if None)."""
+    return datetime.fromtimestamp(seconds, tz)
+
+
+def epoch_or_now(current_time: Optional[datetime]) -> int:
+    """Epoch seconds of current_time, or of the current time if None."""
+    return to_epoch(current_time) if current_time is not None else math.floor(time.time())
+
+
+def _synchronized(method: Callable) -> Callable:
+    """Run a Scheduler method while holding the scheduler's lock."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
 class Scheduler:
-    """Manages scheduling of reminder calls."""
+    """Manages scheduling of reminder calls.
+    
+    Calls are indexed by appointment ID in a dict and ordered by call time
+    in a min-heap. Removing a call only drops it from the dict; its heap
+    entry goes stale and is discarded when it reaches the top (or when the
+    heap is compacted).
+    
+    An appointment can get several reminders (e.g. 72h, 24h and 2h
+    before). Only its next touch is kept as a ScheduledCall; when that
+    touch is dispatched (pop_due_calls or advance_call) the call moves on
+    to the next offset, so memory grows with appointments rather than
+    touches, and remove_call cancels every remaining touch at once.
     
-    def __init__(self, reminder_hours_before: int = 24):
+    Times are compared as integer UTC epoch seconds, so appointments in a
+    time zone keep their real spacing across DST changes (a 24h reminder
+    is 24 elapsed hours before the appointment). Call times are returned
+    in the appointment's time zone.
+    
+    Public methods are thread-safe. `changed` is notified whenever a new
+    call becomes the earliest one, so a dispatcher can sleep until
+    next_call_time() and still wake for calls scheduled in the meantime.
+    """
+    
+    def __init__(self, reminder_hours_before: int = 24, reminder_offsets: Optional[List[float]] = None):
         """Initialize scheduler.
         
         Args:
             reminder_hours_before: How many hours before appointment to place call
+            reminder_offsets: Hours before the appointment of each reminder
+                (overrides reminder_hours_before when given)
         """
         self.reminder_hours_before = reminder_hours_before
-        self.scheduled_calls: List[ScheduledCall] = []
-        logger.info(f"Initialized scheduler with {reminder_hours_before}h reminder window")
+        self.reminder_offsets = sorted(
+            (timedelta(hours=hours) for hours in reminder_offsets or [reminder_hours_before]),
+            reverse=True
+        )
+        self._offset_seconds = [int(offset.total_seconds()) for offset in self.reminder_offsets]
+        self._calls: Dict[str, ScheduledCall] = {}
+        self._heap: List[HeapEntry] = []
+        self._sequence = itertools.count()
+        self._lock = threading.RLock()
+        self.changed = threading.Condition(self._lock)
+        logger.info(
+            f"Initialized scheduler with reminders "
+            f"{', '.join(f'{offset / timedelta(hours=1):g}h' for offset in self.reminder_offsets)} before"
+        )
     
-    def schedule_appointment(
+    @property
+    @_synchronized
+    def scheduled_calls(self) -> List[ScheduledCall]:
+        """All scheduled calls in scheduling order (a copy)."""
+        return list(self._calls.values())
+    
+    def _is_live(self, entry: HeapEntry) -> bool:
+        """Check whether a heap entry still refers to a scheduled call."""
+        call = entry[2]
+        return self._calls.get(call.appointment_id) is call
+    
+    def _push(self, call: ScheduledCall, call_epoch: Optional[int] = None) -> None:
+        """Index a call and add it to the heap (call_epoch saves converting call_time)."""
+        self._calls[call.appointment_id] = call
+        if call_epoch is None:
+            call_epoch = to_epoch(call.call_time)
+        heapq.heappush(self._heap, (call_epoch, next(self._sequence), call))
+        if self._heap[0][2] is call:
+            self.changed.notify_all()
+    
+    def _pop_until(self, stop: Callable[[HeapEntry, int], bool]) -> List[HeapEntry]:
+        """Pop live entries in call-time order, dropping stale ones on the way.
+        
+        Args:
+            stop: Called with the next live entry and the number popped so far;
+                popping stops (leaving that entry on the heap) when it returns True
+        
+        Returns:
+            Popped live entries, earliest first
+        """
+        popped: List[HeapEntry] = []
+        while self._heap:
+            entry = self._heap[0]
+            if not self._is_live(entry):
+                heapq.heappop(self._heap)
+                continue
+            if stop(entry, len(popped)):
+                break
+            popped.append(heapq.heappop(self._heap))
+        return popped
+    
+    def _restore(self, entries: List[HeapEntry]) -> None:
+        """Push entries taken by _pop_until back onto the heap."""
+        for entry in entries:
+            heapq.heappush(self._heap, entry)
+    
+    def _touch_from(
+        self,
+        call: ScheduledCall,
+        first_touch: int,
+        now: int
+    ) -> Optional[Tuple[int, ScheduledCall]]:
+        """Find the first touch from first_touch on that is not yet due.
+        
+        Args:
+            call: Call for the appointment
+            first_touch: Earliest touch to consider
+            now: Touches timed before this (epoch seconds) are skipped
+            
+        Returns:
+            Tuple of the touch's call time in epoch seconds and the call timed
+            for it (call itself if unchanged), or None if no touches remain
+        """
+        appointment_epoch = to_epoch(call.appointment_datetime)
+        for touch in range(first_touch, len(self._offset_seconds)):
+            call_epoch = appointment_epoch - self._offset_seconds[touch]
+            if call_epoch >= now:
+                if touch == call.touch:
+                    return call_epoch, call
+                call_time = from_epoch(call_epoch, call.appointment_datetime.tzinfo)
+                return call_epoch, dataclasses.replace(call, call_time=call_time, touch=touch, attempt=0)
+        return None
+    
+    def _touch_time(self, appointment_datetime: datetime, touch: int) -> datetime:
+        """Call time of a touch, in the appointment's time zone."""
+        return from_epoch(
+            to_epoch(appointment_datetime) - self._offset_seconds[touch],
+            appointment_datetime.tzinfo
+        )
+    
+    def _advance(self, call: ScheduledCall, now: int) -> Optional[ScheduledCall]:
+        """Move an appointment on to its next pending touch, or drop it if none remain."""
+        following = self._touch_from(call, call.touch + 1, now)
+        if following is None:
+            self._calls.pop(call.appointment_id, None)
+            return None
+        self._push(following[1], following[0])
+        return following[1]
+    
+    def _maybe_compact(self) -> None:
+        """Drop stale heap entries once they dominate the heap."""
+        if len(self._heap) > HEAP_COMPACT_RATIO * len(self._calls) + 64:
+            self._heap = [entry for entry in self._heap if self._is_live(entry)]
+            heapq.heapify(self._heap)
+    
+    def make_call(
         self,
         appointment_id: str,
         phone_number: str,
@@ -48,6 +226,40 @@ class Scheduler:
         message: str,
         appointment_datetime: datetime,
         callback: Optional[Callable] = None
+    ) -> ScheduledCall:
+        """Build the reminder call for an appointment without scheduling it.
+        
+        Args:
+            appointment_id: Unique ID for the appointment
+            phone_number: Phone number to call
+            name: Patient/taxpayer name
+            message: Message to deliver during call
+            appointment_datetime: When the appointment is
+            callback: Function to call when reminder time arrives
+            
+        Returns:
+            ScheduledCall timed for the appointment's first reminder
+        """
+        return ScheduledCall(
+            appointment_id=appointment_id,
+            phone_number=phone_number,
+            name=name,
+            message=message,
+            call_time=self._touch_time(appointment_datetime, 0),
+            appointment_datetime=appointment_datetime,
+            callback=callback
+        )
+    
+    @_synchronized
+    def schedule_appointment(
+        self,
+        appointment_id: str,
+        phone_number: str,
+        name: str,
+        message: str,
+        appointment_datetime: datetime,
+        callback: Optional[Callable] = None,
+        replace: bool = False
     ) -> Optional[ScheduledCall]:
         """Schedule a reminder call for an appointment.
         
@@ -58,44 +270,121 @@ class Scheduler:
             message: Message to deliver during call
             appointment_datetime: When the appointment is
             callback: Function to call when reminder time arrives
+            replace: Replace an existing call with the same ID instead of
+                returning it unchanged
             
         Returns:
-            ScheduledCall object if scheduled, None if already past reminder time
+            ScheduledCall for the next pending reminder if scheduled, None if
+            every reminder time is already past
         """
-        # Calculate when to place the call
-        call_time = appointment_datetime - timedelta(hours=self.reminder_hours_before)
+        first_call = self.make_call(
+            appointment_id, phone_number, name, message, appointment_datetime, callback
+        )
         
         # Check if reminder time is in the past
-        now = datetime.now()
-        if call_time < now:
+        pending = self._touch_from(first_call, 0, epoch_or_now(None))
+        if pending is None:
             logger.warning(
-                f"Appointment {appointment_id} reminder time ({call_time}) is in the past. "
+                f"Appointment {appointment_id} reminder time ({first_call.call_time}) is in the past. "
                 f"Skipping scheduling."
             )
+            if replace:
+                self.remove_call(appointment_id)
             return None
         
         # Check if already scheduled
         existing = self.get_scheduled_call(appointment_id)
         if existing:
-            logger.debug(f"Appointment {appointment_id} already scheduled")
-            return existing
-        
-        # Create scheduled call
-        scheduled_call = ScheduledCall(
-            appointment_id=appointment_id,
-            phone_number=phone_number,
-            name=name,
-            message=message,
-            call_time=call_time,
-            appointment_datetime=appointment_datetime,
-            callback=callback
-        )
+            if not replace:
+                logger.debug(f"Appointment {appointment_id} already scheduled")
+                return existing
+            self.remove_call(appointment_id)
         
-        self.scheduled_calls.append(scheduled_call)
-        logger.info(f"Scheduled call for {name} at {call_time}")
+        call_epoch, scheduled_call = pending
+        self._push(scheduled_call, call_epoch)
+        logger.info(f"Scheduled call for {name} at {scheduled_call.call_time}")
         
         return scheduled_call
     
+    @_synchronized
+    def insert_calls(
+        self,
+        calls: Iterable[ScheduledCall],
+        replace: bool = False,
+        current_time: Optional[datetime] = None
+    ) -> Dict[str, int]:
+        """Schedule prebuilt calls in one step.
+        
+        Args:
+            calls: Calls to schedule
+            replace: Replace calls whose ID is already scheduled (and drop
+                them if their new call time has passed)
+            current_time: Touches due before this time are skipped (default: now)
+            
+        Returns:
+            Counts of calls 'added', already scheduled ('existing') and in the 'past'
+        """
+        now = epoch_or_now(current_time)
+        counts = {'added': 0, 'existing': 0, 'past': 0}
+        
+        for call in calls:
+            pending = self._touch_from(call, call.touch, now)
+            if pending is None:
+                counts['past'] += 1
+                if replace:
+                    self._calls.pop(call.appointment_id, None)
+            elif not replace and call.appointment_id in self._calls:
+                counts['existing'] += 1
+            else:
+                self._push(pending[1], pending[0])
+                counts['added'] += 1
+        
+        self._maybe_compact()
+        return counts
+    
+    def schedule_many(
+        self,
+        records: Iterable[CallRecord],
+        replace: bool = False,
+        current_time: Optional[datetime] = None
+    ) -> Dict[str, int]:
+        """Schedule reminder calls for many appointments at once.
+        
+        Call times are computed against one captured time, repeated IDs are
+        dropped with a dict, and the calls are added with one insert_calls().
+        Nothing is logged per appointment.
+        
+        Args:
+            records: (appointment_id, phone_number, name, message,
+                appointment_datetime) tuples; the first record wins for a repeated ID
+            replace: Replace calls whose ID is already scheduled
+            current_time: Calls due before this time are skipped (default: now)
+            
+        Returns:
+            Counts of calls 'scheduled', already scheduled ('existing'),
+            repeated within records ('duplicates') and in the 'past'
+        """
+        unique: Dict[str, CallRecord] = {}
+        total = 0
+        for total, record in enumerate(records, 1):
+            unique.setdefault(record[0], record)
+        
+        counts = self.insert_calls(
+            (
+                ScheduledCall(appointment_id, phone_number, name, message, self._touch_time(when, 0), when)
+                for appointment_id, phone_number, name, message, when in unique.values()
+            ),
+            replace=replace,
+            current_time=current_time
+        )
+        return {
+            'scheduled': counts['added'],
+            'existing': counts['existing'],
+            'duplicates': total - len(unique),
+            'past': counts['past']
+        }
+    
+    @_synchronized
     def get_scheduled_call(self, appointment_id: str) -> Optional[ScheduledCall]:
         """Get a scheduled call by appointment ID.
         
@@ -105,11 +394,9 @@ class Scheduler:
         Returns:
             ScheduledCall if found, None otherwise
         """
-        for call in self.scheduled_calls:
-            if call.appointment_id == appointment_id:
-                return call
-        return None
+        return self._calls.get(appointment_id)
     
+    @_synchronized
     def get_due_calls(self, current_time: Optional[datetime] = None) -> List[ScheduledCall]:
         """Get all calls that are due (current time >= call time).
         
@@ -119,17 +406,118 @@ class Scheduler:
         Returns:
             List of due calls
         """
-        current_time = current_time or datetime.now()
+        now = epoch_or_now(current_time)
+        
+        due = self._pop_until(lambda entry, _: entry[0] > now)
+        self._restore(due)
+        
+        return [call for _, _, call in due]
+    
+    @_synchronized
+    def pop_due_calls(
+        self,
+        current_time: Optional[datetime] = None,
+        limit: Optional[int] = None
+    ) -> List[ScheduledCall]:
+        """Take calls that are due, moving each appointment on to its next touch.
+        
+        Touches that fell due while an earlier one was waiting are skipped,
+        so a late appointment gets one call rather than several in a row.
+        
+        Args:
+            current_time: Time to check against (default: now)
+            limit: Maximum number of calls to remove (None for all due calls)
+            
+        Returns:
+            List of due calls, earliest first
+        """
+        now = epoch_or_now(current_time)
         
-        due_calls = [
-            call for call in self.scheduled_calls
-            if call.call_time <= current_time
-        ]
+        due = self._pop_until(
+            lambda entry, count: entry[0] > now or (limit is not None and count >= limit)
+        )
+        for _, _, call in due:
+            self._advance(call, now)
         
-        return due_calls
+        return [call for _, _, call in due]
     
+    @_synchronized
+    def advance_call(
+        self,
+        appointment_id: str,
+        current_time: Optional[datetime] = None
+    ) -> Optional[ScheduledCall]:
+        """Mark an appointment's current touch done after dialing it.
+        
+        Args:
+            appointment_id: Unique appointment identifier
+            current_time: Later touches due before this time are skipped (default: now)
+            
+        Returns:
+            The call for the next touch, or None if the appointment has no
+            touches left (it is removed) or was not scheduled
+        """
+        call = self._calls.get(appointment_id)
+        if call is None:
+            return None
+        following = self._advance(call, epoch_or_now(current_time))
+        self._maybe_compact()
+        return following
+    
+    @_synchronized
+    def retry_call(self, call: ScheduledCall, retry_time: datetime) -> ScheduledCall:
+        """Schedule another attempt at a touch that could not be placed.
+        
+        The retry takes the appointment's place in the schedule, replacing
+        its next touch if the call was already taken off; once the retry
+        has been dialed the appointment moves on to its following touch
+        as usual.
+        
+        Args:
+            call: Call whose attempt failed
+            retry_time: When to try again
+            
+        Returns:
+            The rescheduled call, with its attempt count increased
+        """
+        retry = dataclasses.replace(call, call_time=retry_time, attempt=call.attempt + 1)
+        self._push(retry)
+        self._maybe_compact()
+        return retry
+    
+    @_synchronized
+    def requeue_call(self, call: ScheduledCall, call_time: Optional[datetime] = None) -> ScheduledCall:
+        """Put back a call that was taken off the schedule but never dialed.
+        
+        Like retry_call(), it takes the appointment's place in the schedule,
+        but keeps its attempt count.
+        
+        Args:
+            call: Call to put back
+            call_time: When to place it (None to keep its call time)
+        
+        Returns:
+            The call as put back
+        """
+        if call_time is not None:
+            call = dataclasses.replace(call, call_time=call_time)
+        self._push(call)
+        self._maybe_compact()
+        return call
+    
+    @_synchronized
+    def next_call_time(self) -> Optional[datetime]:
+        """Get the time of the earliest scheduled call.
+        
+        Returns:
+            Earliest call time, or None if nothing is scheduled
+        """
+        self._pop_until(lambda entry, _: True)  # Discards stale entries at the top
+        return self._heap[0][2].call_time if self._heap else None
+    
+    @_synchronized
     def remove_call(self, appointment_id: str) -> bool:
-        """Remove a scheduled call.
+        """Remove a scheduled call, cancelling all of its remaining touches.
         
         Args:
             appointment_id: Unique appointment identifier
@@ -137,18 +525,14 @@ class Scheduler:
         Returns:
             True if removed, False if not found
         """
-        initial_count = len(self.scheduled_calls)
-        self.scheduled_calls = [
-            call for call in self.scheduled_calls
-            if call.appointment_id != appointment_id
-        ]
-        
-        removed = len(self.scheduled_calls) < initial_count
+        removed = self._calls.pop(appointment_id, None) is not None
         if removed:
             logger.info(f"Removed scheduled call for appointment {appointment_id}")
+            self._maybe_compact()
         
         return removed
     
+    @_synchronized
     def get_upcoming_calls(self, limit: int = 10) -> List[ScheduledCall]:
         """Get the next N upcoming calls.
         
@@ -158,50 +542,49 @@ class Scheduler:
         Returns:
             List of upcoming calls, sorted by call time
         """
-        now = datetime.now()
-        upcoming = sorted(
-            [call for call in self.scheduled_calls if call.call_time > now],
-            key=lambda x: x.call_time
-        )
+        now = epoch_or_now(None)
+        
+        # Set aside due calls, then take the next `limit` calls after them
+        due = self._pop_until(lambda entry, _: entry[0] > now)
+        upcoming = self._pop_until(lambda _, count: count >= limit)
+        self._restore(due)
+        self._restore(upcoming)
         
-        return upcoming[:limit]
+        return [call for _, _, call in upcoming]
     
+    @_synchronized
     def get_all_scheduled(self) -> List[ScheduledCall]:
         """Get all scheduled calls.
         
         Returns:
             List of all scheduled calls
         """
-        return self.scheduled_calls.copy()
+        return list(self._calls.values())
     
+    @_synchronized
     def clear_completed(self, current_time: Optional[datetime] = None) -> int:
-        """Remove calls that have already passed.
+        """Remove reminder touches that have already passed.
         
         Args:
             current_time: Time to check against (default: now)
             
         Returns:
-            Number of calls removed
+            Number of touches removed
         """
-        current_time = current_time or datetime.now()
-        initial_count = len(self.scheduled_calls)
-        
-        self.scheduled_calls = [
-            call for call in self.scheduled_calls
-            if call.call_time > current_time
-        ]
-        
-        removed = initial_count - len(self.scheduled_calls)
+        removed = len(self.pop_due_calls(current_time))
         if removed > 0:
             logger.info(f"Cleared {removed} completed calls from scheduler")
         
         return removed
     
+    @_synchronized
     def count(self) -> int:
         """Get total number of scheduled calls.
         
         Returns:
             Number of scheduled calls
         """
-        return len(self.scheduled_calls)
-
+        return len(self._calls)
+    
+    def close(self) -> None:
+        """Release resources held by the schedule store (none for the in-memory scheduler)."""
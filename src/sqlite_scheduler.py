@@ -0,0 +1,476 @@
+"""
+Durable schedule store backed by SQLite.
+Keeps scheduled calls on disk so a restart resumes without re-parsing appointment files,
+and lets several workers share one schedule by leasing due calls.
+"""
+
+import json
+import logging
+import math
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime, tzinfo
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from scheduler import Scheduler, ScheduledCall, epoch_or_now, from_epoch, to_epoch
+
+logger = logging.getLogger(__name__)
+
+# Times are stored as integer UTC epoch seconds
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scheduled_calls (
+    appointment_id TEXT NOT NULL PRIMARY KEY,
+    phone_number TEXT NOT NULL,
+    name TEXT NOT NULL,
+    message TEXT NOT NULL,
+    call_time INTEGER NOT NULL,
+    appointment_time INTEGER NOT NULL,
+    lease_owner TEXT,
+    lease_expires INTEGER,
+    touch INTEGER NOT NULL DEFAULT 0,
+    attempt INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_scheduled_calls_call_time ON scheduled_calls (call_time);
+CREATE INDEX IF NOT EXISTS idx_scheduled_calls_lease_expires
+    ON scheduled_calls (lease_expires) WHERE lease_expires IS NOT NULL;
+"""
+
+# A row is claimable when it has no lease or its lease has run out
+CLAIMABLE = "(lease_expires IS NULL OR lease_expires <= ?)"
+
+COLUMNS = "appointment_id, phone_number, name, message, call_time, appointment_time, touch, attempt"
+PLACEHOLDERS = "?, ?, ?, ?, ?, ?, ?, ?"
+
+
+class SQLiteScheduler(Scheduler):
+    """Scheduler whose calls live in an SQLite database (WAL mode).
+    
+    Same interface as Scheduler. Callbacks are not persisted, so calls read
+    back from the store have callback=None; the app dispatches by ID.
+    
+    Workers sharing the database file take due calls with
+    claim_due_calls(), which leases them to one worker until the lease
+    expires. The worker renews the lease while dialing and deletes the
+    call with complete_call(); calls of a worker that dies become
+    claimable again once their lease runs out. Lease times use the same
+    clock as call times, so workers must agree on the time.
+    
+    Each row holds an appointment's next touch; its touch column indexes
+    the reminder offsets the store was opened with. retry_call() replaces
+    the row and its lease, so the worker's complete_call() that follows
+    leaves the retry in place.
+    """
+    
+    def __init__(
+        self,
+        db_path: str = "data/schedule.db",
+        reminder_hours_before: int = 24,
+        reminder_offsets: Optional[List[float]] = None,
+        timezone: Optional[tzinfo] = None
+    ):
+        """Open (or create) the schedule store.
+        
+        Args:
+            db_path: SQLite database file
+            reminder_hours_before: How many hours before appointment to place call
+            reminder_offsets: Hours before the appointment of each reminder
+                (overrides reminder_hours_before when given)
+            timezone: Zone that times read back from the store are returned
+                in (None for naive system local time)
+        """
+        super().__init__(reminder_hours_before=reminder_hours_before, reminder_offsets=reminder_offsets)
+        self.timezone = timezone
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Shared with the dispatcher thread; every access holds self._lock
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        self._conn.executescript(SCHEMA)
+        
+        logger.info(f"Opened schedule store {self.db_path}")
+    
+    @staticmethod
+    def _row(call: ScheduledCall, call_epoch: Optional[int] = None) -> Tuple:
+        return (
+            call.appointment_id,
+            call.phone_number,
+            call.name,
+            call.message,
+            to_epoch(call.call_time) if call_epoch is None else call_epoch,
+            to_epoch(call.appointment_datetime),
+            call.touch,
+            call.attempt
+        )
+    
+    def _call(self, row: Tuple) -> ScheduledCall:
+        return ScheduledCall(
+            appointment_id=row[0],
+            phone_number=row[1],
+            name=row[2],
+            message=row[3],
+            call_time=from_epoch(row[4], self.timezone),
+            appointment_datetime=from_epoch(row[5], self.timezone),
+            touch=row[6],
+            attempt=row[7]
+        )
+    
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Hold the lock and a write transaction, rolling back on error."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+    
+    def _select(
+        self,
+        where: str = "",
+        params: Tuple = (),
+        order: str = "rowid",
+        limit: int = -1
+    ) -> List[ScheduledCall]:
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {COLUMNS} FROM scheduled_calls {where} ORDER BY {order} LIMIT ?",
+                params + (limit,)
+            ).fetchall()
+        return [self._call(row) for row in rows]
+    
+    @property
+    def scheduled_calls(self) -> List[ScheduledCall]:
+        """All scheduled calls in scheduling order (a copy)."""
+        return self._select()
+    
+    def _push(self, call: ScheduledCall, call_epoch: Optional[int] = None) -> None:
+        """Insert (or replace) a single call, dropping any lease on it."""
+        with self._lock:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO scheduled_calls ({COLUMNS}) VALUES ({PLACEHOLDERS})",
+                self._row(call, call_epoch)
+            )
+            self.changed.notify_all()
+    
+    def insert_calls(
+        self,
+        calls: Iterable[ScheduledCall],
+        replace: bool = False,
+        current_time: Optional[datetime] = None
+    ) -> Dict[str, int]:
+        """Schedule prebuilt calls with one bulk insert.
+        
+        Args:
+            calls: Calls to schedule
+            replace: Replace calls whose ID is already scheduled (and drop
+                them if their new call time has passed)
+            current_time: Calls due before this time are skipped (default: now)
+        
+        Returns:
+            Counts of calls 'added', already scheduled ('existing') and in the 'past'
+        """
+        now = epoch_or_now(current_time)
+        rows = []
+        past_ids = []
+        for call in calls:
+            pending = self._touch_from(call, call.touch, now)
+            if pending is None:
+                past_ids.append((call.appointment_id,))
+            else:
+                rows.append(self._row(pending[1], pending[0]))
+        
+        verb = "INSERT OR REPLACE" if replace else "INSERT OR IGNORE"
+        with self._transaction() as conn:
+            if replace and past_ids:
+                conn.executemany("DELETE FROM scheduled_calls WHERE appointment_id = ?", past_ids)
+            before = conn.total_changes
+            conn.executemany(f"{verb} INTO scheduled_calls ({COLUMNS}) VALUES ({PLACEHOLDERS})", rows)
+            added = conn.total_changes - before
+            if added:
+                self.changed.notify_all()
+        
+        return {'added': added, 'existing': len(rows) - added, 'past': len(past_ids)}
+    
+    def get_scheduled_call(self, appointment_id: str) -> Optional[ScheduledCall]:
+        """Get a scheduled call by appointment ID.
+        
+        Args:
+            appointment_id: Unique appointment identifier
+        
+        Returns:
+            ScheduledCall if found, None otherwise
+        """
+        calls = self._select("WHERE appointment_id = ?", (appointment_id,))
+        return calls[0] if calls else None
+    
+    def get_due_calls(self, current_time: Optional[datetime] = None) -> List[ScheduledCall]:
+        """Get all calls that are due (current time >= call time).
+        
+        Args:
+            current_time: Time to check against (default: now)
+        
+        Returns:
+            List of due calls
+        """
+        return self._select("WHERE call_time <= ?", (epoch_or_now(current_time),), order="call_time")
+    
+    def pop_due_calls(
+        self,
+        current_time: Optional[datetime] = None,
+        limit: Optional[int] = None
+    ) -> List[ScheduledCall]:
+        """Take calls that are due, moving each appointment on to its next touch.
+        
+        Args:
+            current_time: Time to check against (default: now)
+            limit: Maximum number of calls to take (None for all due calls)
+        
+        Returns:
+            List of due calls, earliest first
+        """
+        now = epoch_or_now(current_time)
+        with self._transaction() as conn:
+            calls = [self._call(row) for row in conn.execute(
+                f"SELECT {COLUMNS} FROM scheduled_calls WHERE call_time <= ? AND {CLAIMABLE} "
+                f"ORDER BY call_time LIMIT ?",
+                (now, now, -1 if limit is None else limit)
+            )]
+            self._advance_many(calls, now)
+        return calls
+    
+    def _advance_many(self, calls: List[ScheduledCall], now: int) -> None:
+        """Move appointments on to their next pending touch, deleting those with none left.
+        
+        Must run inside _transaction(). Advanced rows lose any lease.
+        """
+        updates = []
+        finished = []
+        for call in calls:
+            following = self._touch_from(call, call.touch + 1, now)
+            if following is None:
+                finished.append((call.appointment_id,))
+            else:
+                updates.append((following[0], following[1].touch, call.appointment_id))
+        
+        self._conn.executemany(
+            "UPDATE scheduled_calls SET call_time = ?, touch = ?, attempt = 0, "
+            "lease_owner = NULL, lease_expires = NULL WHERE appointment_id = ?",
+            updates
+        )
+        self._conn.executemany("DELETE FROM scheduled_calls WHERE appointment_id = ?", finished)
+        if updates:
+            self.changed.notify_all()
+    
+    def claim_due_calls(
+        self,
+        worker_id: str,
+        lease_seconds: float,
+        limit: Optional[int] = None,
+        current_time: Optional[datetime] = None
+    ) -> List[ScheduledCall]:
+        """Lease due calls to a worker in a single statement.
+        
+        Calls stay in the store until complete_call(); other workers cannot
+        claim them until the lease expires.
+        
+        Args:
+            worker_id: Unique name of the claiming worker
+            lease_seconds: How long the claim lasts unless renewed
+            limit: Maximum number of calls to claim (None for all due calls)
+            current_time: Time to check against (default: now)
+        
+        Returns:
+            Claimed calls, earliest first
+        """
+        now = epoch_or_now(current_time)
+        expires = now + math.ceil(lease_seconds)
+        with self._lock:
+            rows = self._conn.execute(
+                f"UPDATE scheduled_calls SET lease_owner = ?, lease_expires = ? WHERE rowid IN ("
+                f"SELECT rowid FROM scheduled_calls WHERE call_time <= ? AND {CLAIMABLE} "
+                f"ORDER BY call_time LIMIT ?) RETURNING {COLUMNS}",
+                (worker_id, expires, now, now, -1 if limit is None else limit)
+            ).fetchall()
+        rows.sort(key=lambda row: row[4])
+        return [self._call(row) for row in rows]
+    
+    def renew_leases(
+        self,
+        worker_id: str,
+        appointment_ids: Iterable[str],
+        lease_seconds: float,
+        current_time: Optional[datetime] = None
+    ) -> List[str]:
+        """Extend a worker's unexpired leases.
+        
+        Args:
+            worker_id: Worker holding the leases
+            appointment_ids: Calls to renew
+            lease_seconds: New lease length from now
+            current_time: Time to renew from (default: now)
+            
+        Returns:
+            IDs still leased to the worker; any others were lost and must not be dialed
+        """
+        now = epoch_or_now(current_time)
+        expires = now + math.ceil(lease_seconds)
+        with self._transaction() as conn:
+            return [
+                appointment_id for appointment_id in appointment_ids
+                if conn.execute(
+                    "UPDATE scheduled_calls SET lease_expires = ? "
+                    "WHERE appointment_id = ? AND lease_owner = ? AND lease_expires > ?",
+                    (expires, appointment_id, worker_id, now)
+                ).rowcount
+            ]
+    
+    def complete_call(
+        self,
+        worker_id: str,
+        appointment_id: str,
+        current_time: Optional[datetime] = None
+    ) -> bool:
+        """Finish a touch the worker has dialed: advance the call to its next touch or delete it.
+        
+        Args:
+            worker_id: Worker holding the lease
+            appointment_id: Call to complete
+            current_time: Later touches due before this time are skipped (default: now)
+            
+        Returns:
+            True if the call was still leased to the worker
+        """
+        with self._transaction() as conn:
+            calls = [self._call(row) for row in conn.execute(
+                f"SELECT {COLUMNS} FROM scheduled_calls WHERE appointment_id = ? AND lease_owner = ?",
+                (appointment_id, worker_id)
+            )]
+            self._advance_many(calls, epoch_or_now(current_time))
+        return bool(calls)
+    
+    def advance_call(
+        self,
+        appointment_id: str,
+        current_time: Optional[datetime] = None
+    ) -> Optional[ScheduledCall]:
+        """Mark an appointment's current touch done after dialing it.
+        
+        Args:
+            appointment_id: Unique appointment identifier
+            current_time: Later touches due before this time are skipped (default: now)
+        
+        Returns:
+            The call for the next touch, or None if the appointment has no
+            touches left (it is removed) or was not scheduled
+        """
+        with self._transaction():
+            call = self.get_scheduled_call(appointment_id)
+            if call is None:
+                return None
+            self._advance_many([call], epoch_or_now(current_time))
+            return self.get_scheduled_call(appointment_id)
+    
+    def release_calls(self, worker_id: str, appointment_ids: Iterable[str]) -> int:
+        """Give leased calls back without dialing them (e.g. on shutdown).
+        
+        Args:
+            worker_id: Worker holding the leases
+            appointment_ids: Calls to release
+            
+        Returns:
+            Number of calls released
+        """
+        with self._lock:
+            released = self._conn.execute(
+                "UPDATE scheduled_calls SET lease_owner = NULL, lease_expires = NULL "
+                "WHERE lease_owner = ? AND appointment_id IN (SELECT value FROM json_each(?))",
+                (worker_id, json.dumps(list(appointment_ids)))
+            ).rowcount
+            if released:
+                self.changed.notify_all()
+        return released
+    
+    def next_call_time(self) -> Optional[datetime]:
+        """Get the earliest time a call can be claimed.
+        
+        That is the earliest unleased call time, or the earliest lease
+        expiry if that comes first.
+        
+        Returns:
+            Earliest claimable time, or None if nothing is scheduled
+        """
+        with self._lock:
+            (unleased,) = self._conn.execute(
+                "SELECT call_time FROM scheduled_calls WHERE lease_expires IS NULL "
+                "ORDER BY call_time LIMIT 1"
+            ).fetchone() or (None,)
+            (lease_expiry,) = self._conn.execute(
+                "SELECT MIN(lease_expires) FROM scheduled_calls WHERE lease_expires IS NOT NULL"
+            ).fetchone()
+        candidates = [value for value in (unleased, lease_expiry) if value is not None]
+        return from_epoch(min(candidates), self.timezone) if candidates else None
+    
+    def leased_count(self) -> int:
+        """Get the number of calls currently leased to any worker."""
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM scheduled_calls WHERE lease_expires IS NOT NULL"
+            ).fetchone()[0]
+    
+    def remove_call(self, appointment_id: str) -> bool:
+        """Remove a scheduled call.
+        
+        Args:
+            appointment_id: Unique appointment identifier
+        
+        Returns:
+            True if removed, False if not found
+        """
+        with self._lock:
+            removed = self._conn.execute(
+                "DELETE FROM scheduled_calls WHERE appointment_id = ?", (appointment_id,)
+            ).rowcount > 0
+        if removed:
+            logger.info(f"Removed scheduled call for appointment {appointment_id}")
+        return removed
+    
+    def get_upcoming_calls(self, limit: int = 10) -> List[ScheduledCall]:
+        """Get the next N upcoming calls.
+        
+        Args:
+            limit: Maximum number of calls to return
+        
+        Returns:
+            List of upcoming calls, sorted by call time
+        """
+        return self._select(
+            "WHERE call_time > ?", (epoch_or_now(None),), order="call_time", limit=limit
+        )
+    
+    def get_all_scheduled(self) -> List[ScheduledCall]:
+        """Get all scheduled calls.
+        
+        Returns:
+            List of all scheduled calls
+        """
+        return self._select()
+    
+    def count(self) -> int:
+        """Get total number of scheduled calls.
+        
+        Returns:
+            Number of scheduled calls
+        """
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM scheduled_calls").fetchone()[0]
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
@@ -1,16 +1,24 @@
 """
 Simple TwiML server for Twilio callbacks.
-Hosts an endpoint that Twilio can fetch to get call instructions.
+Hosts an endpoint that Twilio can fetch to get call instructions, and one
+that Twilio posts call status updates to.
 """
 
 import logging
-from http.server import HTTPServer, BaseHTTPRequestHandler
+import threading
+from http.server import HTTPServer, BaseHTTPRequestHandler, ThreadingHTTPServer
 from urllib.parse import urlparse, parse_qs
 import xml.etree.ElementTree as ET
-from typing import Optional
+from typing import Dict, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from call_results import CallResultStore
 
 logger = logging.getLogger(__name__)
 
+# Path Twilio posts status callbacks to
+STATUS_PATH = '/status'
+
 
 class TwiMLHandler(BaseHTTPRequestHandler):
     """HTTP handler for TwiML responses."""
@@ -32,7 +40,7 @@ class TwiMLHandler(BaseHTTPRequestHandler):
             self.send_response(200)
             self.send_header('Content-Type', 'text/xml')
             self.end_headers()
-            self.wfile.write(twiml.encode('utf-8'))
+            self.wfile.write(twiml)
             
             logger.debug(f"Sent TwiML response for message: {message[:50]}...")
             
@@ -40,6 +48,45 @@ class TwiMLHandler(BaseHTTPRequestHandler):
             logger.error(f"Error handling TwiML request: {e}")
             self.send_error(500, str(e))
     
+    def do_POST(self):
+        """Handle a status callback from Twilio."""
+        try:
+            if urlparse(self.path).path != STATUS_PATH:
+                self.send_error(404)
+                return
+            
+            length = int(self.headers.get('Content-Length', 0))
+            body = self.rfile.read(length).decode('utf-8')
+            params = {key: values[0] for key, values in parse_qs(body, keep_blank_values=True).items()}
+            
+            if not self.server.is_authentic(self.path, params, self.headers.get('X-Twilio-Signature', '')):
+                logger.warning(f"Rejected status callback with a bad signature from {self.client_address[0]}")
+                self.send_error(403)
+                return
+            
+            call_id = params.get('CallSid')
+            status = params.get('CallStatus')
+            if not call_id or not status:
+                self.send_error(400, "CallSid and CallStatus are required")
+                return
+            
+            if self.server.results is not None:
+                duration = params.get('CallDuration')
+                error_code = params.get('ErrorCode')
+                self.server.results.update(
+                    call_id,
+                    status,
+                    duration=float(duration) if duration else None,
+                    error_code=int(error_code) if error_code else None
+                )
+            
+            self.send_response(204)
+            self.end_headers()
+            
+        except Exception as e:
+            logger.error(f"Error handling status callback: {e}")
+            self.send_error(500, str(e))
+    
     def _generate_twiml(self, message: str) -> bytes:
         """Generate TwiML XML response.
         
@@ -71,27 +118,84 @@ class TwiMLHandler(BaseHTTPRequestHandler):
         logger.debug("%s - - [%s] %s" % (self.client_address[0], self.log_date_time_string(), format % args))
 
 
+class CallbackHTTPServer(ThreadingHTTPServer):
+    """HTTP server carrying what the handler needs to process status callbacks."""
+    
+    daemon_threads = True
+    
+    def __init__(
+        self,
+        address,
+        results: Optional['CallResultStore'] = None,
+        auth_token: Optional[str] = None,
+        public_url: Optional[str] = None
+    ):
+        super().__init__(address, TwiMLHandler)
+        self.results = results
+        self.public_url = public_url
+        self.validator = None
+        if auth_token:
+            from twilio.request_validator import RequestValidator
+            self.validator = RequestValidator(auth_token)
+    
+    def is_authentic(self, path: str, params: Dict[str, str], signature: str) -> bool:
+        """Check a callback's X-Twilio-Signature (always True without an auth token)."""
+        if self.validator is None:
+            return True
+        base = self.public_url or f"http://{self.server_address[0]}:{self.server_address[1]}"
+        return self.validator.validate(base.rstrip('/') + path, params, signature)
+
+
 class TwiMLServer:
-    """Simple TwiML server for development/testing."""
+    """Simple TwiML server for development/testing, also receiving status callbacks."""
     
-    def __init__(self, host: str = "localhost", port: int = 8000):
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 8000,
+        results: Optional['CallResultStore'] = None,
+        auth_token: Optional[str] = None,
+        public_url: Optional[str] = None
+    ):
         """Initialize TwiML server.
         
         Args:
             host: Host address to bind to
-            port: Port to bind to
+            port: Port to bind to (0 for any free port)
+            results: Store that status callbacks update
+            auth_token: Twilio auth token; when given, callbacks without a
+                valid X-Twilio-Signature are rejected
+            public_url: Base URL Twilio reaches this server at (e.g. behind
+                a proxy); defaults to http://host:port
         """
         self.host = host
         self.port = port
+        self.results = results
+        self.auth_token = auth_token
+        self.public_url = public_url
         self.server: Optional[HTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
     
-    def start(self):
-        """Start the TwiML server."""
-        self.server = HTTPServer((self.host, self.port), TwiMLHandler)
+    def start(self, background: bool = False):
+        """Start the TwiML server.
+        
+        Args:
+            background: Serve on a daemon thread and return immediately
+                instead of blocking until interrupted
+        """
+        self.server = CallbackHTTPServer(
+            (self.host, self.port), self.results, self.auth_token, self.public_url
+        )
+        self.port = self.server.server_address[1]
         logger.info(f"TwiML server started on http://{self.host}:{self.port}")
         
-        # Run in background thread if needed
-        # For now, just start it
+        if background:
+            self._thread = threading.Thread(
+                target=self.server.serve_forever, name='twiml-server', daemon=True
+            )
+            self._thread.start()
+            return
+        
         try:
             self.server.serve_forever()
         except KeyboardInterrupt:
@@ -102,6 +206,11 @@ class TwiMLServer:
         """Stop the TwiML server."""
         if self.server:
             self.server.shutdown()
+            if self._thread is not None:
+                self._thread.join()
+                self._thread = None
+            self.server.server_close()
+            self.server = None
             logger.info("TwiML server stopped")
     
     def get_url(self) -> str:
@@ -112,3 +221,12 @@ class TwiMLServer:
         """
         return f"http://{self.host}:{self.port}/twiml"
 
+    def get_status_callback_url(self) -> str:
+        """Get the URL to pass to Twilio as StatusCallback.
+        
+        Returns:
+            URL string
+        """
+        base = self.public_url or f"http://{self.host}:{self.port}"
+        return base.rstrip('/') + STATUS_PATH
+